@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+Benchmark baseline store for n8n AI Workflow Automation Hub tests.
+
+Node benchmark results and workflow execution timings are appended to a local
+SQLite database keyed by subject, git SHA and environment. Later runs are
+compared against a rolling baseline of earlier runs to flag statistically
+significant latency, throughput and memory regressions.
+
+Used by test_nodes.py and test_workflows.py via --benchmark-db and
+--check-regressions.
+"""
+
+import os
+import sys
+import json
+import time
+import math
+import logging
+import subprocess
+from dataclasses import dataclass, asdict
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger('nexus-benchmark-store')
+
+# Store configuration
+BENCHMARK_DB = os.getenv('BENCHMARK_DB', '')  # empty disables recording
+BENCHMARK_ENV = os.getenv('BENCHMARK_ENV', '')  # defaults to a platform fingerprint
+BASELINE_WINDOW = int(os.getenv('BASELINE_WINDOW', '20'))  # most recent runs per metric
+BASELINE_MIN_RUNS = int(os.getenv('BASELINE_MIN_RUNS', '5'))
+REGRESSION_ALPHA = float(os.getenv('REGRESSION_ALPHA', '0.05'))
+REGRESSION_MIN_EFFECT = float(os.getenv('REGRESSION_MIN_EFFECT', '0.10'))  # relative change
+
+# Metrics tracked per subject kind, with whether larger values are better
+NODE_METRICS = {
+    "latency": False,  # every serial benchmark iteration, in ms
+    "average_execution_time": False,
+    "p95_latency": False,
+    "throughput": True,
+    "memory_usage": False,
+}
+WORKFLOW_METRICS = {
+    "execution_time": False,
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS measurements (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    subject TEXT NOT NULL,
+    metric TEXT NOT NULL,
+    value REAL NOT NULL,
+    git_sha TEXT,
+    environment TEXT NOT NULL,
+    recorded_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_measurements_series
+    ON measurements (kind, subject, metric, environment, recorded_at);
+"""
+
+
+@dataclass
+class Regression:
+    """A metric that got significantly worse than its baseline."""
+    kind: str
+    subject: str
+    metric: str
+    baseline: float
+    current: float
+    change: float  # relative, signed so that positive is worse
+    method: str
+    p_value: Optional[float] = None
+    ci_low: Optional[float] = None  # prediction interval for a single new value
+    ci_high: Optional[float] = None
+
+
+def current_git_sha() -> Optional[str]:
+    """Git SHA of the code under test."""
+    if os.getenv('GITHUB_SHA'):
+        return os.getenv('GITHUB_SHA')
+    try:
+        result = subprocess.run(['git', 'rev-parse', 'HEAD'], capture_output=True, text=True)
+        return result.stdout.strip() or None
+    except (subprocess.SubprocessError, FileNotFoundError):
+        return None
+
+
+def default_environment(*qualifiers: str) -> str:
+    """Identify the machine/runtime so baselines only compare like with like."""
+    import platform
+    base = BENCHMARK_ENV or f"{platform.system()}-{platform.machine()}-py{platform.python_version()}"
+    return "/".join([base, *[q for q in qualifiers if q]])
+
+
+def _median(values: List[float]) -> float:
+    ordered = sorted(values)
+    middle = len(ordered) // 2
+    if len(ordered) % 2:
+        return ordered[middle]
+    return (ordered[middle - 1] + ordered[middle]) / 2
+
+
+def prediction_interval(samples: List[float], alpha: float = REGRESSION_ALPHA) -> Tuple[float, float]:
+    """Two-sided (1 - alpha) prediction interval for one new observation.
+
+    Uses the median and the MAD-based robust standard deviation of the samples,
+    widened by sqrt(1 + 1/n) for the uncertainty in those estimates. Unlike a
+    confidence interval for the median it does not shrink towards a point as
+    history grows, so ordinary run-to-run noise stays inside it.
+    """
+    from statistics import NormalDist
+    center = _median(samples)
+    spread = 1.4826 * _median([abs(value - center) for value in samples])
+    z = NormalDist().inv_cdf(1 - alpha / 2)
+    margin = z * spread * math.sqrt(1 + 1 / len(samples))
+    return center - margin, center + margin
+
+
+def mann_whitney_u(a: List[float], b: List[float]) -> float:
+    """Two-sided Mann-Whitney U test p-value (normal approximation with tie correction)."""
+    combined = sorted((value, group) for group, values in ((0, a), (1, b)) for value in values)
+    ranks = [0.0] * len(combined)
+    tie_term = 0.0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j + 1 < len(combined) and combined[j + 1][0] == combined[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        tied = j - i + 1
+        tie_term += tied ** 3 - tied
+        i = j + 1
+
+    n1, n2 = len(a), len(b)
+    rank_sum = sum(rank for rank, (_, group) in zip(ranks, combined) if group == 0)
+    u = rank_sum - n1 * (n1 + 1) / 2
+    mean_u = n1 * n2 / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (abs(u - mean_u) - 0.5) / math.sqrt(variance)
+    return math.erfc(max(z, 0.0) / math.sqrt(2))
+
+
+def compare(
+    baseline: List[float],
+    current: List[float],
+    higher_is_better: bool,
+    alpha: float = REGRESSION_ALPHA,
+    min_effect: float = REGRESSION_MIN_EFFECT
+) -> Optional[Dict]:
+    """Decide whether current samples are a significant regression against baseline.
+
+    With several current samples (per-iteration latencies) a Mann-Whitney U test
+    is used. A single current value (one per run) is instead checked against a
+    prediction interval of the baseline runs. Either way the change must also
+    exceed min_effect, so tiny but consistent shifts on quiet machines are not
+    reported.
+    """
+    baseline_median = _median(baseline)
+    current_median = _median(current)
+    if baseline_median == 0:
+        return None
+
+    change = (current_median - baseline_median) / abs(baseline_median)
+    if higher_is_better:
+        change = -change
+    if change < min_effect:
+        return None
+
+    if len(current) >= BASELINE_MIN_RUNS:
+        p_value = mann_whitney_u(baseline, current)
+        if p_value >= alpha:
+            return None
+        return {"change": change, "method": "mann-whitney", "p_value": p_value}
+
+    ci_low, ci_high = prediction_interval(baseline, alpha)
+    outside = current_median < ci_low if higher_is_better else current_median > ci_high
+    if not outside:
+        return None
+    return {"change": change, "method": "prediction-interval", "ci_low": ci_low, "ci_high": ci_high}
+
+
+class BenchmarkStore:
+    """Append-only SQLite store of benchmark measurements."""
+
+    def __init__(self, path: str = BENCHMARK_DB, environment: Optional[str] = None):
+        self.path = path
+        self.environment = environment or default_environment()
+        self.git_sha = current_git_sha()
+        self.run_id = f"{int(time.time() * 1000)}-{os.getpid()}"
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        import sqlite3
+        self.connection = sqlite3.connect(path)
+        self.connection.executescript(SCHEMA)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        self.connection.close()
+
+    def record(self, kind: str, subject: str, metrics: Dict[str, List[float]]) -> None:
+        """Append this run's samples for a subject."""
+        now = time.time()
+        rows = [
+            (self.run_id, kind, subject, metric, float(value), self.git_sha, self.environment, now)
+            for metric, values in metrics.items()
+            for value in values
+        ]
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO measurements "
+                "(run_id, kind, subject, metric, value, git_sha, environment, recorded_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows
+            )
+
+    def baseline(self, kind: str, subject: str, metric: str, window: int = BASELINE_WINDOW) -> List[float]:
+        """Samples from the most recent earlier runs of a metric in this environment."""
+        return [value for _, value in self._baseline_rows(kind, subject, metric, window)]
+
+    def _baseline_rows(self, kind: str, subject: str, metric: str, window: int) -> List[Tuple[str, float]]:
+        return self.connection.execute(
+            "SELECT run_id, value FROM measurements "
+            "WHERE kind = ? AND subject = ? AND metric = ? AND environment = ? AND run_id IN ("
+            "  SELECT run_id FROM measurements "
+            "  WHERE kind = ? AND subject = ? AND metric = ? AND environment = ? AND run_id != ? "
+            "  GROUP BY run_id ORDER BY MAX(recorded_at) DESC LIMIT ?"
+            ")",
+            (kind, subject, metric, self.environment,
+             kind, subject, metric, self.environment, self.run_id, window)
+        ).fetchall()
+
+    def check(
+        self,
+        kind: str,
+        subject: str,
+        metrics: Dict[str, List[float]],
+        directions: Dict[str, bool]
+    ) -> List[Regression]:
+        """Compare this run's samples against the rolling baseline."""
+        regressions = []
+        for metric, current in metrics.items():
+            if not current or metric not in directions:
+                continue
+            rows = self._baseline_rows(kind, subject, metric, BASELINE_WINDOW)
+            baseline = [value for _, value in rows]
+            # Metrics with per-iteration samples store many rows per run; count runs, not rows
+            runs = len({run_id for run_id, _ in rows})
+            if runs < BASELINE_MIN_RUNS:
+                logger.debug(f"Not enough history for {kind} {subject} {metric} ({runs} runs)")
+                continue
+
+            verdict = compare(baseline, current, directions[metric])
+            if verdict:
+                regressions.append(Regression(
+                    kind=kind,
+                    subject=subject,
+                    metric=metric,
+                    baseline=_median(baseline),
+                    current=_median(current),
+                    **verdict
+                ))
+        return regressions
+
+
+def node_metrics(node_result: Dict) -> Dict[str, List[float]]:
+    """Extract benchmark metrics from a NodeTester.test_node() result."""
+    benchmark = node_result.get("tests", {}).get("performance_benchmark", {})
+    if not benchmark.get("success"):
+        return {}
+    results = benchmark.get("results", {})
+    metrics = {
+        metric: [results[metric]]
+        for metric in NODE_METRICS
+        if isinstance(results.get(metric), (int, float))
+    }
+    # Per-iteration samples let the gate use a rank test instead of one value per run
+    if results.get("latency_samples"):
+        metrics["latency"] = [float(value) for value in results["latency_samples"]]
+    return metrics
+
+
+def workflow_metrics(result) -> Dict[str, List[float]]:
+    """Extract timing metrics from a WorkflowTester TestResult."""
+    if not result.success:
+        return {}
+    return {"execution_time": [result.execution_time]}
+
+
+def report_regressions(regressions: List[Regression], output_format: str = "text") -> None:
+    """Print detected regressions in the same formats as the test reports."""
+    if output_format == "json":
+        # stdout carries the test report document; keep it parseable
+        print(json.dumps({"regressions": [asdict(r) for r in regressions]}, indent=2), file=sys.stderr)
+        return
+
+    if output_format == "jsonl":
+        for r in regressions:
+            print(json.dumps({"event": "regression", **asdict(r)}), flush=True)
+        return
+
+    if output_format == "github":
+        for r in regressions:
+            print(
+                f"::error file={r.subject},title=Performance regression::"
+                f"{r.metric} {r.change:+.1%} worse ({r.baseline:.2f} -> {r.current:.2f}, {r.method})"
+            )
+        return
+
+    print("\n" + "=" * 80)
+    print(f"PERFORMANCE REGRESSIONS: {len(regressions)}")
+    print("=" * 80)
+    for r in regressions:
+        detail = f"p={r.p_value:.4f}" if r.p_value is not None else f"expected [{r.ci_low:.2f}, {r.ci_high:.2f}]"
+        print(f"\n❌ {r.kind} {r.subject}: {r.metric} {r.change:+.1%} worse")
+        print(f"  Baseline median: {r.baseline:.2f}, current: {r.current:.2f} ({r.method}, {detail})")
+
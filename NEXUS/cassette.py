@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+"""
+Record/replay cassettes for external AI and web calls.
+
+A cassette holds real request/response pairs captured from live services
+(OpenAI, LangChain endpoints, HTTP requests made by workflows) together with
+how long each call took. Interactions are keyed by a hash of the normalized
+request, so volatile details such as timestamps, IDs and whitespace do not
+cause misses. Cassettes are stored as gzip-compressed JSON Lines.
+
+Replaying returns the recorded payloads with the recorded latency, optionally
+accelerated, which keeps isolated test runs deterministic while preserving
+realistic payload sizes and latency distributions.
+"""
+
+import os
+import re
+import gzip
+import json
+import time
+import hashlib
+import logging
+import argparse
+import threading
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger('nexus-cassette')
+
+# Cassette configuration
+CASSETTE_PATH = os.getenv('CASSETTE_PATH', '')  # empty disables record/replay
+CASSETTE_MODE = os.getenv('CASSETTE_MODE', 'replay')  # Options: 'replay', 'record', 'auto'
+REPLAY_SPEED = float(os.getenv('REPLAY_SPEED', '1'))  # 1 = recorded timing, 10 = ten times faster, 0 = no delay
+
+CASSETTE_MODES = ("replay", "record", "auto")
+
+# Request fields that differ between otherwise identical calls
+VOLATILE_FIELDS = {"timestamp", "requestId", "request_id", "apiKey", "api_key", "nonce"}
+# Per-call caller identifiers; only dropped from the request itself, since nested
+# ids (messages, tool calls, records in a body) distinguish different requests
+REQUEST_VOLATILE_FIELDS = VOLATILE_FIELDS | {"id", "user"}
+TIMESTAMP_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}(?:\.\d+)?(?:Z|[+-]\d{2}:?\d{2})?")
+EPOCH_PATTERN = re.compile(r"\b1\d{9}(?:\.\d+)?\b|\b1\d{12}\b")  # Unix times in seconds or milliseconds
+UUID_PATTERN = re.compile(r"[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+
+class CassetteMiss(Exception):
+    """Raised when replaying a request that was never recorded."""
+    pass
+
+
+def normalize_request(value: Any, volatile: Set[str] = REQUEST_VOLATILE_FIELDS) -> Any:
+    """Canonical form of a request for matching: volatile fields dropped, strings normalized.
+
+    volatile applies to the top-level keys; nested objects only drop VOLATILE_FIELDS.
+    """
+    if isinstance(value, dict):
+        return {
+            key: normalize_request(item, VOLATILE_FIELDS)
+            for key, item in sorted(value.items())
+            if key not in volatile
+        }
+    if isinstance(value, list):
+        return [normalize_request(item, VOLATILE_FIELDS) for item in value]
+    if isinstance(value, str):
+        value = TIMESTAMP_PATTERN.sub("<timestamp>", value)
+        value = EPOCH_PATTERN.sub("<timestamp>", value)
+        value = UUID_PATTERN.sub("<uuid>", value)
+        return WHITESPACE_PATTERN.sub(" ", value).strip()
+    return value
+
+
+def request_key(service: str, request: Dict) -> str:
+    """Stable hash identifying a request to a service."""
+    canonical = json.dumps([service, normalize_request(request)], sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+class Cassette:
+    """Recorded interactions, keyed by normalized request hash."""
+
+    def __init__(self, path: str, mode: str = CASSETTE_MODE, speed: float = REPLAY_SPEED):
+        if mode not in CASSETTE_MODES:
+            raise ValueError(f"Unknown cassette mode: {mode}")
+        self.path = path
+        self.mode = mode
+        self.speed = speed
+        self.interactions: Dict[str, List[Dict]] = {}
+        self._cursors: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        if mode != "record" and os.path.exists(path):
+            self.load()
+
+    def load(self) -> None:
+        """Read interactions from the cassette file."""
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    interaction = json.loads(line)
+                    self.interactions.setdefault(interaction["key"], []).append(interaction)
+        logger.info(f"Loaded {sum(len(v) for v in self.interactions.values())} interactions from {self.path}")
+
+    def save(self) -> None:
+        """Write all interactions to the cassette file if anything was recorded."""
+        with self._lock:
+            if not self._dirty:
+                return
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            tmp_path = f"{self.path}.{os.getpid()}.tmp"
+            with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+                for interactions in self.interactions.values():
+                    for interaction in interactions:
+                        f.write(json.dumps(interaction, separators=(",", ":")) + "\n")
+            os.replace(tmp_path, self.path)
+            self._dirty = False
+        logger.info(f"Saved cassette {self.path}")
+
+    def lookup(self, service: str, request: Dict) -> Optional[Dict]:
+        """Find a recorded interaction, cycling through repeated recordings of the same request."""
+        key = request_key(service, request)
+        with self._lock:
+            interactions = self.interactions.get(key)
+            if not interactions:
+                self.misses += 1
+                return None
+            cursor = self._cursors.get(key, 0)
+            self._cursors[key] = cursor + 1
+            self.hits += 1
+            return interactions[cursor % len(interactions)]
+
+    def record(self, service: str, request: Dict, response: Any, duration: float, status: int = 200) -> Dict:
+        """Add a live interaction to the cassette."""
+        interaction = {
+            "key": request_key(service, request),
+            "service": service,
+            "request": request,
+            "status": status,
+            "response": response,
+            "duration": duration,
+            "recorded_at": time.time()
+        }
+        with self._lock:
+            self.interactions.setdefault(interaction["key"], []).append(interaction)
+            self._dirty = True
+        return interaction
+
+    def delay(self, interaction: Dict) -> float:
+        """How long to wait before returning a replayed response."""
+        if self.speed <= 0:
+            return 0.0
+        return interaction.get("duration", 0.0) / self.speed
+
+    def should_record(self, found: bool) -> bool:
+        """Whether a call must go to the live service."""
+        return self.mode == "record" or (self.mode == "auto" and not found)
+
+
+def add_cassette_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the record/replay options shared by every command that runs the n8n stand-in."""
+    parser.add_argument("--cassette", default=CASSETTE_PATH or None,
+                        help="Cassette file (.jsonl.gz) of recorded AI and web calls")
+    parser.add_argument("--cassette-mode", choices=CASSETTE_MODES, default=CASSETTE_MODE,
+                        help="Replay recorded calls, record live calls, or replay and record misses (auto)")
+    parser.add_argument("--replay-speed", type=float, default=REPLAY_SPEED,
+                        help="Replay latency speed-up: 1 keeps recorded timing, 0 disables delays")
+
+
+def cassette_from_args(args: argparse.Namespace) -> Optional[Cassette]:
+    """Open the cassette selected on the command line, if any."""
+    if not args.cassette:
+        return None
+    return Cassette(args.cassette, mode=args.cassette_mode, speed=args.replay_speed)
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Streaming result reporting for the n8n AI Workflow Automation Hub test CLIs.
+
+Each test result is reported as soon as it completes instead of after the
+whole suite: as JSON Lines events (to stdout with --format=jsonl, or to a file
+with --events) and as live GitHub Actions annotations. Summary counters are
+updated incrementally, so in the streaming formats no results are retained
+and memory stays flat however large the suite is.
+
+Used by test_nodes.py and test_workflows.py.
+"""
+
+import sys
+import json
+import time
+from collections import deque
+from concurrent.futures import Executor, FIRST_COMPLETED, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, TextIO
+
+# Formats that are written while the suite runs rather than at the end
+STREAMING_FORMATS = ("jsonl", "github")
+
+
+def bounded_map(
+    executor: Executor,
+    func: Callable,
+    items: Iterable,
+    window: int,
+    ordered: bool = True
+) -> Iterator[Any]:
+    """Like executor.map, but with at most window tasks submitted at a time.
+
+    Only the results inside the window are held in memory. With ordered=False
+    results are yielded as they complete rather than in input order.
+    """
+    window = max(1, window)
+    if ordered:
+        futures = deque()
+        for item in items:
+            futures.append(executor.submit(func, item))
+            if len(futures) >= window:
+                yield futures.popleft().result()
+        while futures:
+            yield futures.popleft().result()
+        return
+
+    pending = set()
+    for item in items:
+        pending.add(executor.submit(func, item))
+        if len(pending) >= window:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                yield future.result()
+    while pending:
+        done, pending = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield future.result()
+
+
+class EventReporter:
+    """Reports results as they complete and keeps running summary counters."""
+
+    def __init__(
+        self,
+        suite: str,
+        output_format: str = "text",
+        to_event: Callable[[Any], Dict] = dict,
+        is_success: Callable[[Any], bool] = lambda result: result["success"],
+        annotations: Callable[[Any], List[str]] = lambda result: [],
+        events_path: Optional[str] = None,
+        title: str = "Test Results"
+    ):
+        self.suite = suite
+        self.output_format = output_format
+        self.to_event = to_event
+        self.is_success = is_success
+        self.annotations = annotations
+        self.title = title
+
+        self.total = 0
+        self.passed = 0
+        self.failed = 0
+        self.start_time = time.time()
+        # End-of-run formats need every result for the final document
+        self.results: List[Any] = [] if output_format not in STREAMING_FORMATS else None
+
+        # "-" sends the event stream to stdout alongside an end-of-run report
+        self._events_file = open(events_path, "w") if events_path and events_path != "-" else None
+        self._streams: List[TextIO] = []
+        if output_format == "jsonl" or events_path == "-":
+            self._streams.append(sys.stdout)
+        if self._events_file:
+            self._streams.append(self._events_file)
+
+        self._emit({"event": "start", "suite": suite, "timestamp": self.start_time})
+
+    def _emit(self, event: Dict) -> None:
+        if not self._streams:
+            return
+        line = json.dumps(event, default=str) + "\n"
+        for stream in self._streams:
+            stream.write(line)
+            stream.flush()
+
+    @property
+    def success_rate(self) -> float:
+        return (self.passed / self.total) * 100 if self.total > 0 else 0
+
+    def add(self, result: Any) -> None:
+        """Report one completed result."""
+        success = self.is_success(result)
+        self.total += 1
+        if success:
+            self.passed += 1
+        else:
+            self.failed += 1
+
+        self._emit({"event": "result", "suite": self.suite, **self.to_event(result)})
+        if self.output_format == "github":
+            for line in self.annotations(result):
+                print(line, flush=True)
+        if self.results is not None:
+            self.results.append(result)
+
+    def track(self, results: Iterable[Any]) -> Iterator[Any]:
+        """Report results from an iterable as they arrive, passing them through."""
+        for result in results:
+            self.add(result)
+            yield result
+
+    def summary(self) -> Dict:
+        return {
+            "total": self.total,
+            "passed": self.passed,
+            "failed": self.failed,
+            "success_rate": self.success_rate,
+            "duration": time.time() - self.start_time
+        }
+
+    def finish(self) -> Dict:
+        """Emit the summary event and, for GitHub output, the summary group."""
+        summary = self.summary()
+        self._emit({"event": "summary", "suite": self.suite, **summary})
+        if self.output_format == "github":
+            print(f"::group::{self.title}")
+            print(
+                f"Total: {self.total}, Passed: {self.passed}, Failed: {self.failed}, "
+                f"Success Rate: {self.success_rate:.1f}%"
+            )
+            print("::endgroup::", flush=True)
+        if self._events_file:
+            self._events_file.close()
+            self._events_file = None
+        return summary
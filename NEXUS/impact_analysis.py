@@ -0,0 +1,285 @@
+#!/usr/bin/env python3
+"""
+Change impact analysis for the n8n AI Workflow Automation Hub test CLIs.
+
+Files changed since a git ref are mapped to the custom node packages they
+belong to, and those packages to the node types they provide (for example
+``nexus-nodes.openai``). A persisted reverse index from node type to the
+workflows using it then selects only the affected workflows. The index is
+updated incrementally: workflow files are re-read only when their size or
+mtime changed, and definitions from the n8n API only when their version did.
+
+Used by test_nodes.py and test_workflows.py via --changed-since.
+"""
+
+import os
+import json
+import hashlib
+import logging
+import subprocess
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+from workflow_graph import is_workflow_file
+
+logger = logging.getLogger('nexus-impact-analysis')
+
+# Impact analysis configuration
+IMPACT_INDEX_PATH = os.getenv('IMPACT_INDEX_PATH', '.build-cache/workflow-index.json')  # empty keeps it in memory
+NODE_DIR = os.getenv('NODE_DIR', './custom-nodes')
+NODE_TYPE_PREFIX = os.getenv('NODE_TYPE_PREFIX', 'nexus-nodes')  # package prefix of custom node types
+
+INDEX_VERSION = 1  # bump when entries change shape
+NODE_DIR_SUFFIXES = ('_node', '-node')  # e.g. openai_node provides nexus-nodes.openai
+
+
+def _git(args: List[str], cwd: str) -> str:
+    try:
+        completed = subprocess.run(
+            ["git", *args], cwd=cwd, capture_output=True, text=True, check=True
+        )
+    except FileNotFoundError:
+        raise RuntimeError("git is not installed")
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError(f"git {' '.join(args)} failed: {e.stderr.strip()}")
+    return completed.stdout
+
+
+def changed_files(ref: str, cwd: str = ".") -> List[str]:
+    """Absolute paths of files changed since the merge base with ref, including uncommitted and new files."""
+    root = _git(["rev-parse", "--show-toplevel"], cwd).strip()
+    base = _git(["merge-base", ref, "HEAD"], cwd).strip()
+    names = _git(["diff", "--name-only", base], root).splitlines()
+    names += _git(["ls-files", "--others", "--exclude-standard"], root).splitlines()
+    return sorted({os.path.join(root, name) for name in names if name})
+
+
+def _relative_parts(path: str, directory: str) -> Optional[List[str]]:
+    """Path components of path below directory, or None if it lies outside it."""
+    relative = os.path.relpath(os.path.realpath(path), os.path.realpath(directory))
+    if relative == os.curdir or relative.startswith(os.pardir + os.sep) or relative == os.pardir:
+        return None
+    return relative.split(os.sep)
+
+
+def changed_node_packages(files: Iterable[str], node_dir: str) -> Set[str]:
+    """Node packages (directories of node_dir) touched by the changed files.
+
+    A changed file at the top of node_dir, such as a shared tsconfig.json,
+    affects every package.
+    """
+    packages = set()
+    for path in files:
+        parts = _relative_parts(path, node_dir)
+        if parts is None:
+            continue
+        if len(parts) > 1:
+            packages.add(parts[0])
+        elif os.path.isdir(node_dir):
+            packages.update(entry.name for entry in os.scandir(node_dir) if entry.is_dir())
+    return packages
+
+
+def package_node_types(node_dir: str, package: str, prefix: str = NODE_TYPE_PREFIX) -> Set[str]:
+    """Node types a package provides, lower-cased for matching.
+
+    Types are named after the package directory (with any ``_node`` suffix
+    removed) and after the node files listed under ``n8n.nodes`` in its
+    package.json, with both the configured prefix and the package name.
+    Packages that no longer exist still map to their directory-derived types.
+    """
+    names = {package}
+    for suffix in NODE_DIR_SUFFIXES:
+        if package.endswith(suffix):
+            names.add(package[:-len(suffix)])
+    prefixes = {prefix}
+
+    try:
+        with open(os.path.join(node_dir, package, 'package.json'), 'r') as f:
+            package_json = json.load(f)
+    except (OSError, ValueError):
+        package_json = {}
+    if isinstance(package_json, dict):
+        if package_json.get("name"):
+            prefixes.add(package_json["name"])
+        for node_file in package_json.get("n8n", {}).get("nodes", []):
+            names.add(os.path.basename(node_file).split(".node.")[0])
+
+    return {f"{p}.{name}".lower() for p in prefixes for name in names}
+
+
+def workflow_node_types(workflow: Dict) -> Set[str]:
+    """Distinct node types used by a workflow definition."""
+    return {node["type"] for node in workflow.get("nodes", []) if isinstance(node, dict) and node.get("type")}
+
+
+def definition_version(workflow: Dict) -> str:
+    """Version of a workflow definition: updatedAt when known, otherwise a hash of its nodes."""
+    if workflow.get("updatedAt"):
+        return str(workflow["updatedAt"])
+    nodes = json.dumps(workflow.get("nodes", []), sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(nodes.encode()).hexdigest()
+
+
+class WorkflowIndex:
+    """Persisted reverse index from node type to the workflows that use it.
+
+    Entries are keyed by workflow ID and record the definition version and the
+    node types it uses. Workflow files additionally record their size and mtime
+    so unchanged files are not re-read.
+    """
+
+    def __init__(self, path: Optional[str] = IMPACT_INDEX_PATH or None):
+        self.path = path
+        self.workflows: Dict[str, Dict] = {}
+        self.files: Dict[str, Dict] = {}
+        self.updated = 0
+        self._dirty = False
+
+        if path and os.path.exists(path):
+            self.load()
+
+    def load(self) -> None:
+        """Read the index file, discarding it if it was written by an incompatible version."""
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable workflow index {self.path}: {str(e)}")
+            return
+        if data.get("version") != INDEX_VERSION:
+            return
+        self.workflows = data.get("workflows", {})
+        self.files = data.get("files", {})
+
+    def save(self) -> None:
+        """Write the index file if any entry changed."""
+        if not self.path or not self._dirty:
+            return
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.{os.getpid()}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump({"version": INDEX_VERSION, "workflows": self.workflows, "files": self.files}, f)
+        os.replace(tmp_path, self.path)
+        self._dirty = False
+
+    def is_current(self, workflow_id: str, version: Optional[str]) -> bool:
+        """Whether the indexed entry for a workflow matches a known version."""
+        entry = self.workflows.get(str(workflow_id))
+        return version is not None and entry is not None and entry["version"] == str(version)
+
+    def add(self, workflow: Dict) -> str:
+        """Index a full workflow definition and return its ID."""
+        workflow_id = str(workflow.get("id"))
+        version = definition_version(workflow)
+        if not self.is_current(workflow_id, version):
+            self.workflows[workflow_id] = {
+                "version": version,
+                "name": workflow.get("name", workflow_id),
+                "types": sorted(workflow_node_types(workflow))
+            }
+            self.updated += 1
+            self._dirty = True
+        return workflow_id
+
+    def scan_directory(self, directory: str) -> None:
+        """Index the workflow files in a directory, re-reading only files that changed."""
+        if not os.path.isdir(directory):
+            return
+        seen = set()
+        for entry in sorted(os.scandir(directory), key=lambda e: e.name):
+            if not is_workflow_file(entry.name) or not entry.is_file():
+                continue
+            path = os.path.realpath(entry.path)
+            seen.add(path)
+            stat = entry.stat()
+            known = self.files.get(path)
+            if known and known["size"] == stat.st_size and known["mtime"] == stat.st_mtime:
+                continue
+
+            try:
+                with open(path, 'r') as f:
+                    workflow = json.load(f)
+            except (OSError, ValueError):
+                workflow = None
+            record = {"size": stat.st_size, "mtime": stat.st_mtime, "id": None}
+            if isinstance(workflow, dict) and "nodes" in workflow:
+                # Same default ID as the local stand-in server gives the file
+                workflow.setdefault("id", os.path.splitext(entry.name)[0])
+                record["id"] = self.add(workflow)
+            self.files[path] = record
+            self._dirty = True
+
+        for path in [path for path in self.files if os.path.dirname(path) == os.path.realpath(directory)]:
+            if path not in seen:
+                del self.files[path]
+                self._dirty = True
+
+    def file_workflow(self, path: str) -> Optional[str]:
+        """ID of the workflow defined in an indexed file."""
+        record = self.files.get(os.path.realpath(path))
+        return record["id"] if record else None
+
+    def reverse(self) -> Dict[str, Set[str]]:
+        """Map each lower-cased node type to the IDs of the workflows using it."""
+        index: Dict[str, Set[str]] = {}
+        for workflow_id, entry in self.workflows.items():
+            for node_type in entry["types"]:
+                index.setdefault(node_type.lower(), set()).add(workflow_id)
+        return index
+
+    def uses_any(self, workflow_id: str, node_types: Set[str]) -> bool:
+        """Whether an indexed workflow uses any of the given (lower-cased) node types."""
+        entry = self.workflows.get(str(workflow_id))
+        return entry is not None and any(t.lower() in node_types for t in entry["types"])
+
+    def affected_workflows(self, node_types: Set[str]) -> Set[str]:
+        """IDs of indexed workflows using any of the given (lower-cased) node types."""
+        index = self.reverse()
+        return set().union(*(index.get(node_type, set()) for node_type in node_types))
+
+
+@dataclass
+class ChangeImpact:
+    """What a set of changed files affects."""
+    ref: str
+    files: List[str]
+    nodes: Set[str] = field(default_factory=set)
+    node_types: Set[str] = field(default_factory=set)
+    workflows: Set[str] = field(default_factory=set)
+
+    def describe(self) -> str:
+        return (
+            f"{len(self.files)} files changed since {self.ref}: "
+            f"nodes [{', '.join(sorted(self.nodes))}], "
+            f"workflows [{', '.join(sorted(self.workflows))}]"
+        )
+
+
+def analyze_changes(
+    ref: str,
+    node_dir: str,
+    workflows_dir: Optional[str] = None,
+    index: Optional[WorkflowIndex] = None
+) -> ChangeImpact:
+    """Work out which node packages and indexed workflows are affected by changes since ref.
+
+    Workflows whose own definition file changed are affected too. The workflow
+    set is only as complete as the index; callers testing against an n8n
+    instance should also check listed workflows with WorkflowIndex.uses_any.
+    """
+    files = changed_files(ref, node_dir if os.path.isdir(node_dir) else ".")
+    impact = ChangeImpact(ref, files, changed_node_packages(files, node_dir))
+    for package in impact.nodes:
+        impact.node_types |= package_node_types(node_dir, package)
+
+    if index is not None:
+        if workflows_dir:
+            index.scan_directory(workflows_dir)
+            for path in files:
+                workflow_id = index.file_workflow(path) if _relative_parts(path, workflows_dir) else None
+                if workflow_id:
+                    impact.workflows.add(workflow_id)
+        impact.workflows |= index.affected_workflows(impact.node_types)
+    return impact
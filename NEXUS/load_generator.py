@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Open-loop load generator for n8n AI Workflow Automation Hub workflows.
+
+Requests are started on a fixed schedule derived from an arrival-rate profile
+(constant, ramp or step), whether or not earlier requests have completed, so a
+slow server shows up as growing latency instead of a quietly reduced request
+rate. Latency is measured from each request's scheduled start and recorded in
+an HDR-style log-linear histogram.
+
+The arrival schedule runs on an asyncio event loop, but the request function
+is a blocking call (the requests-based N8nAPI client), so each request runs on
+one of max_in_flight worker threads. That pool size is the concurrency limit:
+arrivals beyond it wait for a free thread, and the wait counts as latency.
+
+Used by the `load` subcommand of test_workflows.py.
+"""
+
+import os
+import json
+import math
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+from percentiles import nearest_rank
+
+logger = logging.getLogger('nexus-load-generator')
+
+# Load test configuration
+LOAD_MAX_IN_FLIGHT = int(os.getenv('LOAD_MAX_IN_FLIGHT', '256'))  # worker threads issuing requests
+LOAD_WINDOW = float(os.getenv('LOAD_WINDOW', '1'))  # seconds per saturation analysis window
+LOAD_MAX_ERROR_RATE = float(os.getenv('LOAD_MAX_ERROR_RATE', '0.01'))
+ARRIVAL_TICK = 0.001  # seconds; resolution of the arrival schedule
+HISTOGRAM_SIGNIFICANT_BITS = 10  # ~0.1% relative precision
+
+# Saturation: achieved throughput falls below this share of the offered rate,
+# or p99 latency grows beyond this multiple of the unloaded p99
+SATURATION_THROUGHPUT_RATIO = 0.9
+SATURATION_LATENCY_FACTOR = 3.0
+
+REPORT_PERCENTILES = (50, 95, 99, 99.9)
+
+
+class LatencyHistogram:
+    """Log-linear latency histogram with bounded relative error, in microseconds.
+
+    Values below 2**(bits+1) are counted exactly. Larger values are grouped into
+    buckets keyed by (shift, top bits), so each bucket spans at most 1/2**bits
+    of its value and memory stays constant however many samples are recorded.
+    """
+
+    def __init__(self, significant_bits: int = HISTOGRAM_SIGNIFICANT_BITS):
+        self.significant_bits = significant_bits
+        self.counts: Dict[Tuple[int, int], int] = {}
+        self.count = 0
+        self.total = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+
+    def _key(self, value: int) -> Tuple[int, int]:
+        shift = max(0, value.bit_length() - self.significant_bits - 1)
+        return shift, value >> shift
+
+    @staticmethod
+    def _value(key: Tuple[int, int]) -> int:
+        """Midpoint of a bucket."""
+        shift, top = key
+        return (top << shift) + ((1 << shift) >> 1)
+
+    def record(self, seconds: float) -> None:
+        """Record one latency sample given in seconds."""
+        value = max(0, int(seconds * 1_000_000))
+        key = self._key(value)
+        self.counts[key] = self.counts.get(key, 0) + 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: 'LatencyHistogram') -> None:
+        """Add another histogram's samples to this one."""
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.count:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+
+    def percentile(self, percentile: float) -> float:
+        """Latency in seconds at or below which percentile% of samples fall."""
+        if not self.count:
+            return 0.0
+        rank = nearest_rank(percentile, self.count)
+        seen = 0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            if seen >= rank:
+                return min(max(self._value(key), self.min), self.max) / 1_000_000
+        return self.max / 1_000_000
+
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.total / self.count / 1_000_000 if self.count else 0.0
+
+
+class ArrivalProfile:
+    """Target request rate over time, in requests per second."""
+
+    def __init__(self, kind: str, rate: float, end_rate: Optional[float] = None, step: float = 0,
+                 step_duration: float = 10):
+        self.kind = kind
+        self.rate = rate
+        self.end_rate = rate if end_rate is None else end_rate
+        self.step = step
+        self.step_duration = step_duration
+
+    def rate_at(self, elapsed: float, duration: float) -> float:
+        """Target rate at a point in the run."""
+        if self.kind == "ramp":
+            return self.rate + (self.end_rate - self.rate) * min(1.0, elapsed / duration)
+        if self.kind == "step":
+            return self.rate + self.step * int(elapsed // self.step_duration)
+        return self.rate
+
+    def arrivals(self, duration: float) -> Iterator[float]:
+        """Scheduled start offsets, in seconds from the start of the run.
+
+        The rate is integrated over short ticks so ramps starting at zero and
+        rates above one request per tick are both scheduled accurately.
+        """
+        tick = ARRIVAL_TICK
+        # Start with just enough credit for the first request to go out immediately
+        initial_rate = self.rate_at(0.0, duration)
+        credit = 1.0 - initial_rate * tick if initial_rate > 0 else 0.0
+        for index in range(int(math.ceil(duration / tick))):
+            elapsed = index * tick
+            credit += self.rate_at(elapsed, duration) * tick
+            due = int(credit)
+            for n in range(due):
+                yield elapsed + tick * n / due
+            credit -= due
+
+
+@dataclass
+class LoadWindow:
+    """One analysis window of a load run.
+
+    offered, errors and the histogram cover requests scheduled in the window;
+    succeeded counts requests that finished within it, i.e. achieved throughput.
+    """
+    start: float
+    offered: int = 0
+    succeeded: int = 0
+    errors: int = 0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+
+@dataclass
+class LoadResult:
+    """Outcome of a load run."""
+    target: str
+    profile: str
+    duration: float
+    requests: int
+    errors: int
+    elapsed: float
+    histogram: LatencyHistogram
+    windows: List[LoadWindow]
+    error_samples: Dict[str, int]
+    saturation_rate: Optional[float] = None
+
+    @property
+    def throughput(self) -> float:
+        return (self.requests - self.errors) / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.errors / self.requests if self.requests else 0.0
+
+    def to_dict(self) -> Dict:
+        return {
+            "target": self.target,
+            "profile": self.profile,
+            "duration": self.duration,
+            "requests": self.requests,
+            "errors": self.errors,
+            "error_rate": self.error_rate,
+            "throughput": self.throughput,
+            "latency": {
+                "min": (self.histogram.min or 0) / 1_000_000,
+                "mean": self.histogram.mean(),
+                "max": (self.histogram.max or 0) / 1_000_000,
+                **{f"p{p:g}".replace(".", ""): self.histogram.percentile(p) for p in REPORT_PERCENTILES}
+            },
+            "saturation_rate": self.saturation_rate,
+            "windows": [
+                {
+                    "start": window.start,
+                    "offered_rate": window.offered / LOAD_WINDOW,
+                    "throughput": window.succeeded / LOAD_WINDOW,
+                    "errors": window.errors,
+                    "p99": window.histogram.percentile(99)
+                }
+                for window in self.windows
+            ],
+            "error_samples": self.error_samples
+        }
+
+
+def find_saturation(windows: List[LoadWindow], max_error_rate: float = LOAD_MAX_ERROR_RATE) -> Optional[float]:
+    """Offered rate of the first window where the server stopped keeping up."""
+    # The last window is usually partial, so it is not judged on throughput
+    measured = [window for window in windows[:-1] if window.histogram.count]
+    if not measured:
+        return None
+    unloaded_p99 = measured[0].histogram.percentile(99)
+
+    for window in measured:
+        if (
+            window.succeeded < window.offered * SATURATION_THROUGHPUT_RATIO
+            or window.errors > window.offered * max_error_rate
+            or (unloaded_p99 and window.histogram.percentile(99) > unloaded_p99 * SATURATION_LATENCY_FACTOR)
+        ):
+            return window.offered / LOAD_WINDOW
+    return None
+
+
+class LoadGenerator:
+    """Drives a blocking request function at an open-loop arrival rate, on max_in_flight threads."""
+
+    def __init__(
+        self,
+        send: Callable[[], None],
+        profile: ArrivalProfile,
+        duration: float,
+        max_in_flight: int = LOAD_MAX_IN_FLIGHT,
+        target: str = "",
+        max_error_rate: float = LOAD_MAX_ERROR_RATE
+    ):
+        self.send = send
+        self.profile = profile
+        self.duration = duration
+        self.max_in_flight = max(1, max_in_flight)
+        self.target = target
+        self.max_error_rate = max_error_rate
+
+    async def _issue(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        executor: ThreadPoolExecutor,
+        start: float,
+        offset: float,
+        windows: List[LoadWindow],
+        histogram: LatencyHistogram,
+        errors: Dict[str, int]
+    ) -> None:
+        try:
+            await loop.run_in_executor(executor, self.send)
+            failed = False
+        except Exception as e:
+            failed = True
+            reason = type(e).__name__ if not str(e) else str(e)[:200]
+            errors[reason] = errors.get(reason, 0) + 1
+
+        # Measured from the scheduled start, so time spent waiting for a free worker counts too
+        finished = time.perf_counter() - start
+        latency = finished - offset
+        scheduled_window = self._window(windows, offset)
+        if failed:
+            scheduled_window.errors += 1
+        else:
+            scheduled_window.histogram.record(latency)
+            histogram.record(latency)
+            self._window(windows, finished).succeeded += 1
+
+    @staticmethod
+    def _window(windows: List[LoadWindow], offset: float) -> LoadWindow:
+        index = int(offset // LOAD_WINDOW)
+        while len(windows) <= index:
+            windows.append(LoadWindow(start=len(windows) * LOAD_WINDOW))
+        return windows[index]
+
+    async def run(self) -> LoadResult:
+        """Send requests on schedule until the profile ends, then wait for stragglers."""
+        loop = asyncio.get_running_loop()
+        histogram = LatencyHistogram()
+        windows: List[LoadWindow] = []
+        errors: Dict[str, int] = {}
+        tasks = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_in_flight, thread_name_prefix="load") as executor:
+            start = time.perf_counter()
+            for offset in self.profile.arrivals(self.duration):
+                delay = start + offset - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                self._window(windows, offset).offered += 1
+                task = asyncio.ensure_future(
+                    self._issue(loop, executor, start, offset, windows, histogram, errors)
+                )
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+
+            if tasks:
+                await asyncio.gather(*tasks)
+            elapsed = time.perf_counter() - start
+
+        requests_sent = sum(window.offered for window in windows)
+        return LoadResult(
+            target=self.target,
+            profile=self.profile.kind,
+            duration=self.duration,
+            requests=requests_sent,
+            errors=sum(window.errors for window in windows),
+            elapsed=elapsed,
+            histogram=histogram,
+            windows=windows,
+            error_samples=errors,
+            saturation_rate=find_saturation(windows, self.max_error_rate)
+        )
+
+
+def report_load(result: LoadResult, output_format: str = "text", max_error_rate: float = LOAD_MAX_ERROR_RATE) -> None:
+    """Print a load test result in the same formats as the test reports."""
+    summary = result.to_dict()
+    latency = summary["latency"]
+
+    if output_format == "json":
+        print(json.dumps(summary, indent=2))
+        return
+
+    if output_format == "github":
+        print("::group::Workflow Load Test Results")
+        print(
+            f"Target: {result.target}, Requests: {result.requests}, Throughput: {result.throughput:.2f}/s, "
+            f"p50: {latency['p50'] * 1000:.1f}ms, p95: {latency['p95'] * 1000:.1f}ms, "
+            f"p99: {latency['p99'] * 1000:.1f}ms, p999: {latency['p999'] * 1000:.1f}ms, "
+            f"Error Rate: {result.error_rate:.2%}"
+        )
+        print("::endgroup::")
+        if result.error_rate > max_error_rate:
+            print(f"::error file={result.target}::Error rate {result.error_rate:.2%} exceeds {max_error_rate:.2%}")
+        if result.saturation_rate is not None:
+            print(f"::warning file={result.target}::Saturated at {result.saturation_rate:.1f} requests/s")
+        return
+
+    print("\n" + "=" * 80)
+    print(f"WORKFLOW LOAD TEST: {result.target} ({result.profile} profile, {result.duration:.0f}s)")
+    print("=" * 80)
+    print(f"  Requests: {result.requests} ({result.errors} errors, {result.error_rate:.2%})")
+    print(f"  Throughput: {result.throughput:.2f} requests/s")
+    print(
+        f"  Latency: p50 {latency['p50'] * 1000:.1f}ms, p95 {latency['p95'] * 1000:.1f}ms, "
+        f"p99 {latency['p99'] * 1000:.1f}ms, p999 {latency['p999'] * 1000:.1f}ms, "
+        f"max {latency['max'] * 1000:.1f}ms"
+    )
+    if result.saturation_rate is not None:
+        print(f"  Saturation Point: {result.saturation_rate:.1f} requests/s offered")
+    else:
+        print("  Saturation Point: not reached")
+
+    print("\n  Window   Offered/s   Achieved/s   Errors   p99")
+    for window in summary["windows"]:
+        print(
+            f"  {window['start']:>6.0f}s  {window['offered_rate']:>9.1f}  {window['throughput']:>11.1f}"
+            f"  {window['errors']:>7}  {window['p99'] * 1000:>7.1f}ms"
+        )
+
+    for reason, count in result.error_samples.items():
+        print(f"  ❌ {count}x {reason}")
+    print("=" * 80)
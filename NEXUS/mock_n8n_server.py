@@ -0,0 +1,730 @@
+#!/usr/bin/env python3
+"""
+Local n8n API stand-in for the n8n AI Workflow Automation Hub tests.
+
+This module serves the subset of the n8n public API that the workflow tests
+use (/workflows, /workflows/{id}/execute, /executions), plus webhook trigger
+URLs (/webhook/{path}), from an asyncio HTTP server. Executions are simulated
+by walking the workflow's node graph and running a handler per node type;
+external services are answered by MockService. Isolated test runs complete in milliseconds without a real n8n
+instance, and the server doubles as a throughput benchmark target.
+
+Usage:
+    python mock_n8n_server.py --port=5678
+    python mock_n8n_server.py --workflows-dir=./workflows --port=5678
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import asyncio
+import logging
+import argparse
+import threading
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlparse
+from cassette import Cassette, CassetteMiss, add_cassette_arguments, cassette_from_args, request_key
+from workflow_graph import WORKFLOWS_DIR, is_workflow_file
+
+logger = logging.getLogger('nexus-n8n-mock-server')
+
+# Stand-in configuration
+MOCK_NODE_LATENCY_MS = float(os.getenv('MOCK_NODE_LATENCY_MS', '0'))  # simulated run time per node
+MOCK_MAX_EXECUTIONS = int(os.getenv('MOCK_MAX_EXECUTIONS', '10000'))  # executions kept for lookups
+MOCK_START_TIMEOUT = float(os.getenv('MOCK_START_TIMEOUT', '10'))  # seconds to wait for the listener
+MAX_NODE_RUNS = 1000  # guards against cycles in malformed workflow graphs
+
+# Live endpoints, used when recording cassettes
+OPENAI_API_BASE = os.getenv('OPENAI_API_BASE', 'https://api.openai.com/v1')
+OPENAI_API_KEY = os.getenv('OPENAI_API_KEY', '')
+LANGCHAIN_API_URL = os.getenv('LANGCHAIN_API_URL', '')
+LIVE_CALL_TIMEOUT = float(os.getenv('LIVE_CALL_TIMEOUT', '120'))  # seconds
+
+# Simple n8n expressions reading the current item: {{$json["a"]["b"]}}, {{ $json.a.b }}
+JSON_EXPRESSION_PATTERN = re.compile(r"\{\{\s*\$json((?:\.\w+|\[\s*[\"'][^\"']+[\"']\s*\]|\[\d+\])+)\s*\}\}")
+JSON_PATH_TOKEN_PATTERN = re.compile(r"\.(\w+)|\[\s*[\"']([^\"']+)[\"']\s*\]|\[(\d+)\]")
+
+HTTP_REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+# A node handler receives the node definition, its input items and the run context,
+# and returns the items emitted on each of its outputs
+NodeHandler = Callable[[Dict, List[Dict], Dict], Awaitable[List[List[Dict]]]]
+
+
+class MockService:
+    """Mock external service integrations for testing.
+    
+    With a cassette, requests are answered from recorded live interactions, replayed
+    with their recorded latency, instead of the canned responses below.
+    """
+    
+    def __init__(self, cassette: Optional[Cassette] = None):
+        self.cassette = cassette
+    
+    @staticmethod
+    def mock_openai_response(*args, **kwargs):
+        """Mock OpenAI API responses."""
+        messages = kwargs.get('messages', [])
+        
+        if any("generate content" in str(m).lower() for m in messages):
+            return {
+                "choices": [
+                    {
+                        "message": {
+                            "content": "This is a mock response for content generation."
+                        }
+                    }
+                ]
+            }
+        elif any("classify" in str(m).lower() for m in messages):
+            return {
+                "choices": [
+                    {
+                        "message": {
+                            "content": json.dumps({
+                                "category": "Test Category",
+                                "confidence": 0.95,
+                                "reasoning": "This is a test classification."
+                            })
+                        }
+                    }
+                ]
+            }
+        else:
+            return {
+                "choices": [
+                    {
+                        "message": {
+                            "content": "This is a generic mock response."
+                        }
+                    }
+                ]
+            }
+    
+    @staticmethod
+    def mock_langchain_response(*args, **kwargs):
+        """Mock LangChain responses."""
+        return {
+            "result": {
+                "output": "This is a mock LangChain response.",
+                "metadata": {
+                    "model": "mock-model",
+                    "tokens": 15,
+                    "process_time": 0.1
+                }
+            }
+        }
+    
+    @staticmethod
+    def mock_webhook_response(*args, **kwargs):
+        """Mock webhook responses."""
+        return {
+            "status": "success",
+            "webhook_id": "mock-webhook-id",
+            "data": {
+                "timestamp": time.time(),
+                "event": "mock_event",
+                "payload": {"key": "value"}
+            }
+        }
+    
+    def _canned_response(self, service: str, request: Dict) -> Any:
+        if service == "openai":
+            messages = request.get("messages") or [request.get("prompt", "")]
+            return self.mock_openai_response(model=request.get("model"), messages=messages)
+        if service == "langchain":
+            return self.mock_langchain_response()
+        return self.mock_webhook_response()
+    
+    @staticmethod
+    def _call_live(service: str, request: Dict) -> Tuple[int, Any]:
+        """Send a request to the real service, for recording."""
+        import requests
+        
+        if service == "openai":
+            endpoint = "/chat/completions" if "messages" in request else "/completions"
+            response = requests.post(
+                f"{OPENAI_API_BASE}{endpoint}",
+                json=request,
+                headers={"Authorization": f"Bearer {OPENAI_API_KEY}"},
+                timeout=LIVE_CALL_TIMEOUT
+            )
+        elif service == "langchain":
+            if not LANGCHAIN_API_URL:
+                raise CassetteMiss("LANGCHAIN_API_URL is not set, so LangChain calls cannot be recorded")
+            response = requests.post(LANGCHAIN_API_URL, json=request, timeout=LIVE_CALL_TIMEOUT)
+        else:
+            response = requests.request(
+                request.get("method", "GET"),
+                request["url"],
+                json=request.get("body"),
+                timeout=LIVE_CALL_TIMEOUT
+            )
+        
+        try:
+            return response.status_code, response.json()
+        except ValueError:
+            return response.status_code, response.text
+    
+    def respond(self, service: str, request: Dict) -> Tuple[Any, float]:
+        """Answer a service request, returning the response and how long to delay it."""
+        if self.cassette is None:
+            return self._canned_response(service, request), 0.0
+        
+        interaction = None if self.cassette.mode == "record" else self.cassette.lookup(service, request)
+        if self.cassette.should_record(interaction is not None):
+            start_time = time.time()
+            status, response = self._call_live(service, request)
+            interaction = self.cassette.record(service, request, response, time.time() - start_time, status)
+            delay = 0.0  # the live call already took the real time
+        elif interaction is None:
+            raise CassetteMiss(f"No recorded {service} interaction for request {request_key(service, request)[:12]}")
+        else:
+            delay = self.cassette.delay(interaction)
+        
+        if interaction["status"] >= 400:
+            raise RuntimeError(f"{service} request failed with status {interaction['status']}")
+        return interaction["response"], delay
+    
+    def call(self, service: str, request: Dict) -> Any:
+        """Answer a service request, blocking for any replay delay."""
+        response, delay = self.respond(service, request)
+        if delay:
+            time.sleep(delay)
+        return response
+    
+    async def respond_async(self, service: str, request: Dict) -> Any:
+        """Answer a service request from the event loop, sleeping rather than blocking for replay delays."""
+        if self.cassette is not None and self.cassette.mode != "replay":
+            # Recording makes blocking live calls
+            response, delay = await asyncio.get_running_loop().run_in_executor(None, self.respond, service, request)
+        else:
+            response, delay = self.respond(service, request)
+        if delay:
+            await asyncio.sleep(delay)
+        return response
+
+
+def resolve_expressions(value: Any, item_json: Dict) -> Any:
+    """Substitute simple {{$json...}} expressions in node parameters with values from the input item."""
+    if isinstance(value, dict):
+        return {key: resolve_expressions(item, item_json) for key, item in value.items()}
+    if isinstance(value, list):
+        return [resolve_expressions(item, item_json) for item in value]
+    if not isinstance(value, str) or not value.startswith("="):
+        return value
+    
+    def substitute(match: re.Match) -> str:
+        current: Any = item_json
+        for key, quoted, index in JSON_PATH_TOKEN_PATTERN.findall(match.group(1)):
+            try:
+                current = current[int(index)] if index else current[key or quoted]
+            except (KeyError, IndexError, TypeError):
+                return match.group(0)
+        return current if isinstance(current, str) else json.dumps(current)
+    
+    return JSON_EXPRESSION_PATTERN.sub(substitute, value[1:])
+
+
+NODE_HANDLERS: Dict[str, NodeHandler] = {}
+
+
+def register_handler(type_pattern: str):
+    """Register a handler for node types containing type_pattern (exact types take precedence)."""
+    def decorator(handler: NodeHandler) -> NodeHandler:
+        NODE_HANDLERS[type_pattern] = handler
+        return handler
+    return decorator
+
+
+def find_handler(node_type: str) -> NodeHandler:
+    """Pick the handler for a node type: exact match, then substring match, then pass-through."""
+    if node_type in NODE_HANDLERS:
+        return NODE_HANDLERS[node_type]
+    for pattern, handler in NODE_HANDLERS.items():
+        if pattern in node_type:
+            return handler
+    return passthrough_handler
+
+
+async def passthrough_handler(node: Dict, items: List[Dict], context: Dict) -> List[List[Dict]]:
+    """Forward input items unchanged on the first output (also used for If/Switch nodes)."""
+    return [items]
+
+
+def _openai_request(parameters: Dict) -> Dict:
+    """Build the OpenAI API request body a nexus-nodes.openai node would send."""
+    request = {"model": parameters.get("model", "gpt-3.5-turbo")}
+    messages = parameters.get("messages", {})
+    if isinstance(messages, dict) and messages.get("values"):
+        request["messages"] = [
+            {"role": message.get("messageType", "user"), "content": message.get("message", "")}
+            for message in messages["values"]
+        ]
+    else:
+        request["prompt"] = parameters.get("prompt", "")
+    
+    options = parameters.get("options", {})
+    for option, field_name in (("temperature", "temperature"), ("maxTokens", "max_tokens"), ("topP", "top_p")):
+        if option in options:
+            request[field_name] = options[option]
+    return request
+
+
+@register_handler("openai")
+async def openai_handler(node: Dict, items: List[Dict], context: Dict) -> List[List[Dict]]:
+    outputs = []
+    for item in items:
+        parameters = resolve_expressions(node.get("parameters", {}), item.get("json", {}))
+        response = await context["mock_services"].respond_async("openai", _openai_request(parameters))
+        outputs.append({"json": response})
+    return [outputs]
+
+
+@register_handler("langchain")
+async def langchain_handler(node: Dict, items: List[Dict], context: Dict) -> List[List[Dict]]:
+    outputs = []
+    for item in items:
+        parameters = resolve_expressions(node.get("parameters", {}), item.get("json", {}))
+        response = await context["mock_services"].respond_async("langchain", parameters)
+        outputs.append({"json": response})
+    return [outputs]
+
+
+@register_handler("httpRequest")
+async def http_handler(node: Dict, items: List[Dict], context: Dict) -> List[List[Dict]]:
+    outputs = []
+    for item in items:
+        parameters = resolve_expressions(node.get("parameters", {}), item.get("json", {}))
+        request = {
+            "method": parameters.get("method", parameters.get("requestMethod", "GET")),
+            "url": parameters.get("url", ""),
+            "body": parameters.get("jsonBody", parameters.get("body"))
+        }
+        response = await context["mock_services"].respond_async("http", request)
+        outputs.append({"json": response if isinstance(response, dict) else {"data": response}})
+    return [outputs]
+
+
+@register_handler("webhook")
+async def webhook_handler(node: Dict, items: List[Dict], context: Dict) -> List[List[Dict]]:
+    response = context["mock_services"].mock_webhook_response()
+    return [[{"json": response} for _ in items]]
+
+
+class WorkflowInterpreter:
+    """Simulates an n8n execution by walking a workflow's node graph."""
+    
+    def __init__(self, mock_services: Optional[MockService] = None, node_latency_ms: float = MOCK_NODE_LATENCY_MS):
+        self.mock_services = mock_services or MockService()
+        self.node_latency_ms = node_latency_ms
+    
+    async def run(self, workflow: Dict, input_data: Optional[Dict], execution: Dict) -> None:
+        """Run the workflow, recording per-node results into the execution record."""
+        nodes = {node["name"]: node for node in workflow.get("nodes", []) if not node.get("disabled")}
+        connections = workflow.get("connections", {})
+        pin_data = workflow.get("pinData") or {}
+        context = {"workflow": workflow, "execution": execution, "mock_services": self.mock_services}
+        
+        targets = {
+            connection["node"]
+            for outputs in connections.values()
+            for output in outputs.get("main", [])
+            for connection in (output or [])
+        }
+        start_items = [{"json": input_data or {}}]
+        queue = deque((name, start_items) for name in nodes if name not in targets)
+        run_data = execution["nodeExecutions"]
+        runs = 0
+        
+        while queue:
+            name, items = queue.popleft()
+            node = nodes.get(name)
+            if node is None:
+                continue
+            runs += 1
+            if runs > MAX_NODE_RUNS:
+                raise RuntimeError(f"Workflow exceeded {MAX_NODE_RUNS} node runs; is the graph cyclic?")
+            
+            started = time.time()
+            record = {"node": {"name": name, "type": node.get("type", "")}, "startTime": int(started * 1000)}
+            try:
+                if name in pin_data:
+                    outputs = [pin_data[name]]
+                else:
+                    if self.node_latency_ms:
+                        await asyncio.sleep(self.node_latency_ms / 1000)
+                    outputs = await find_handler(node.get("type", ""))(node, items, context)
+            except Exception as e:
+                record["executionTime"] = int((time.time() - started) * 1000)
+                record["error"] = {"message": str(e)}
+                run_data.setdefault(name, []).append(record)
+                raise
+            
+            record["executionTime"] = int((time.time() - started) * 1000)
+            record["data"] = {"main": outputs}
+            run_data.setdefault(name, []).append(record)
+            
+            for index, output in enumerate(connections.get(name, {}).get("main", [])):
+                if index < len(outputs) and outputs[index]:
+                    for connection in output or []:
+                        queue.append((connection["node"], outputs[index]))
+
+
+class MockN8nServer:
+    """Asyncio HTTP server implementing the n8n API endpoints used by the workflow tests."""
+    
+    def __init__(
+        self,
+        workflows: Optional[List[Dict]] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        interpreter: Optional[WorkflowInterpreter] = None
+    ):
+        self.host = host
+        self.port = port
+        self.interpreter = interpreter or WorkflowInterpreter()
+        self.workflows: Dict[str, Dict] = {}
+        self.executions: Dict[str, Dict] = {}
+        self._execution_order: deque = deque()
+        self._next_execution_id = 1
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._routes: List[Tuple[str, re.Pattern, Callable]] = [
+            ("GET", re.compile(r"^/workflows/?$"), self._list_workflows),
+            ("POST", re.compile(r"^/workflows/?$"), self._create_workflow),
+            ("GET", re.compile(r"^/workflows/(?P<workflow_id>[^/]+)$"), self._get_workflow),
+            ("POST", re.compile(r"^/workflows/(?P<workflow_id>[^/]+)/execute$"), self._execute_workflow),
+            ("GET", re.compile(r"^/executions/?$"), self._list_executions),
+            ("GET", re.compile(r"^/executions/(?P<execution_id>[^/]+)$"), self._get_execution),
+            ("POST", re.compile(r"^/webhook/(?P<path>.+?)/?$"), self._call_webhook),
+            ("GET", re.compile(r"^/webhook/(?P<path>.+?)/?$"), self._call_webhook),
+        ]
+        for workflow in workflows or []:
+            self.add_workflow(workflow)
+    
+    @property
+    def base_url(self) -> str:
+        """API base URL to point N8nAPI at."""
+        return f"http://{self.host}:{self.port}/api/v1"
+    
+    @property
+    def webhook_url(self) -> str:
+        """Base URL of workflow webhook triggers."""
+        return f"http://{self.host}:{self.port}/webhook"
+    
+    def add_workflow(self, workflow: Dict) -> Dict:
+        """Register a workflow definition, assigning an ID and timestamps if missing."""
+        workflow = dict(workflow)
+        workflow.setdefault("id", str(len(self.workflows) + 1))
+        workflow["id"] = str(workflow["id"])
+        workflow.setdefault("updatedAt", time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime()))
+        self.workflows[workflow["id"]] = workflow
+        return workflow
+    
+    # Request handlers: (query, body, **path_params) -> (status, payload)
+    
+    @staticmethod
+    def _page(items: List[Dict], query: Dict) -> Dict:
+        limit = int(query.get("limit", 100))
+        offset = int(query.get("cursor") or 0)
+        page = items[offset:offset + limit]
+        next_cursor = str(offset + limit) if offset + limit < len(items) else None
+        return {"data": page, "nextCursor": next_cursor}
+    
+    async def _list_workflows(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        workflows = list(self.workflows.values())
+        tag = query.get("tags") or (query.get("filter", "")[len("tag:"):] if query.get("filter", "").startswith("tag:") else None)
+        if tag:
+            workflows = [
+                w for w in workflows
+                if any((t.get("name") if isinstance(t, dict) else t) == tag for t in w.get("tags", []))
+            ]
+        return 200, self._page(workflows, query)
+    
+    async def _create_workflow(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        if not isinstance(body, dict) or "nodes" not in body:
+            return 400, {"message": "Workflow body must include nodes"}
+        return 200, self.add_workflow(body)
+    
+    async def _get_workflow(self, query: Dict, body: Any, workflow_id: str) -> Tuple[int, Any]:
+        workflow = self.workflows.get(workflow_id)
+        if workflow is None:
+            return 404, {"message": f"Workflow {workflow_id} not found"}
+        return 200, workflow
+    
+    def _start_execution(self, workflow: Dict, input_data: Optional[Dict], mode: str) -> Tuple[Dict, asyncio.Future]:
+        """Create an execution record and run the workflow in the background."""
+        execution_id = str(self._next_execution_id)
+        self._next_execution_id += 1
+        execution = {
+            "id": execution_id,
+            "workflowId": workflow["id"],
+            "mode": mode,
+            "status": "running",
+            "finished": False,
+            "startedAt": self._timestamp(),
+            "stoppedAt": None,
+            "nodeExecutions": {}
+        }
+        self.executions[execution_id] = execution
+        self._execution_order.append(execution_id)
+        while len(self._execution_order) > MOCK_MAX_EXECUTIONS:
+            self.executions.pop(self._execution_order.popleft(), None)
+        
+        return execution, asyncio.ensure_future(self._run_execution(workflow, input_data, execution))
+    
+    async def _execute_workflow(self, query: Dict, body: Any, workflow_id: str) -> Tuple[int, Any]:
+        workflow = self.workflows.get(workflow_id)
+        if workflow is None:
+            return 404, {"message": f"Workflow {workflow_id} not found"}
+        
+        input_data = body.get("data") if isinstance(body, dict) else None
+        execution, _ = self._start_execution(workflow, input_data, "manual")
+        return 200, {"executionId": execution["id"]}
+    
+    async def _call_webhook(self, query: Dict, body: Any, path: str) -> Tuple[int, Any]:
+        for workflow in self.workflows.values():
+            for node in workflow.get("nodes", []):
+                parameters = node.get("parameters", {})
+                if node.get("type", "").endswith(".webhook") and parameters.get("path", "").strip("/") == path:
+                    execution, task = self._start_execution(workflow, body if isinstance(body, dict) else query, "webhook")
+                    if parameters.get("responseMode", "onReceived") == "onReceived":
+                        return 200, {"message": "Workflow was started"}
+                    
+                    # Respond with the last node's output once the execution finishes
+                    await task
+                    if execution["status"] != "success":
+                        return 500, {"message": "Error in workflow"}
+                    runs = list(execution["nodeExecutions"].values())
+                    outputs = runs[-1][-1]["data"]["main"] if runs else []
+                    items = outputs[0] if outputs and outputs[0] else [{"json": {}}]
+                    return 200, items[0].get("json", {})
+        return 404, {"message": f"The requested webhook \"{path}\" is not registered."}
+    
+    async def _run_execution(self, workflow: Dict, input_data: Optional[Dict], execution: Dict) -> None:
+        try:
+            await self.interpreter.run(workflow, input_data, execution)
+            execution["status"] = "success"
+        except Exception as e:
+            logger.debug(f"Execution {execution['id']} failed: {str(e)}")
+            execution["status"] = "error"
+        execution["finished"] = True
+        execution["stoppedAt"] = self._timestamp()
+    
+    async def _list_executions(self, query: Dict, body: Any) -> Tuple[int, Any]:
+        executions = [self.executions[i] for i in reversed(self._execution_order) if i in self.executions]
+        if query.get("status"):
+            executions = [e for e in executions if e["status"] == query["status"]]
+        if query.get("workflowId"):
+            executions = [e for e in executions if e["workflowId"] == query["workflowId"]]
+        if query.get("includeData", "false") != "true":
+            executions = [{k: v for k, v in e.items() if k != "nodeExecutions"} for e in executions]
+        return 200, self._page(executions, query)
+    
+    async def _get_execution(self, query: Dict, body: Any, execution_id: str) -> Tuple[int, Any]:
+        execution = self.executions.get(execution_id)
+        if execution is None:
+            return 404, {"message": f"Execution {execution_id} not found"}
+        return 200, execution
+    
+    @staticmethod
+    def _timestamp() -> str:
+        now = time.time()
+        return time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(now)) + f".{int(now * 1000) % 1000:03d}Z"
+    
+    async def _dispatch(self, method: str, target: str, body: bytes) -> Tuple[int, Any]:
+        url = urlparse(target)
+        path = url.path
+        for prefix in ("/api/v1", "/rest"):
+            if path.startswith(prefix):
+                path = path[len(prefix):]
+                break
+        query = {key: values[-1] for key, values in parse_qs(url.query).items()}
+        
+        try:
+            payload = json.loads(body) if body else None
+        except ValueError:
+            return 400, {"message": "Invalid JSON body"}
+        
+        path_matched = False
+        for route_method, pattern, handler in self._routes:
+            match = pattern.match(path)
+            if match:
+                path_matched = True
+                if route_method == method:
+                    return await handler(query, payload, **match.groupdict())
+        if path_matched:
+            return 405, {"message": f"{method} not allowed on {path}"}
+        return 404, {"message": f"No route for {path}"}
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            # HTTP/1.1 keep-alive: serve requests until the client closes the connection
+            while True:
+                request_line = await reader.readline()
+                if not request_line.strip():
+                    break
+                method, target, _ = request_line.decode("latin-1").split(" ", 2)
+                
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    name, _, value = line.decode("latin-1").partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                
+                body = await reader.readexactly(int(headers.get("content-length") or 0))
+                status, payload = await self._dispatch(method.upper(), target, body)
+                
+                data = json.dumps(payload).encode()
+                writer.write(
+                    f"HTTP/1.1 {status} {HTTP_REASONS.get(status, '')}\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(data)}\r\n\r\n".encode() + data
+                )
+                await writer.drain()
+                if headers.get("connection", "").lower() == "close":
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError, ValueError):
+            pass
+        except asyncio.CancelledError:
+            pass  # stop() closing an idle keep-alive connection
+        finally:
+            writer.close()
+    
+    async def serve(self) -> None:
+        """Start listening on the running event loop."""
+        self._server = await asyncio.start_server(self._handle_connection, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        logger.info(f"Mock n8n API listening on {self.base_url}")
+    
+    def start(self, timeout: float = MOCK_START_TIMEOUT) -> 'MockN8nServer':
+        """Run the server on a background event loop thread.
+
+        Raises whatever stopped the listener from starting, such as the port
+        being in use, or RuntimeError if it is not listening within timeout.
+        """
+        ready = threading.Event()
+        failure: List[BaseException] = []
+        
+        def run_loop():
+            self._loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(self._loop)
+            try:
+                self._loop.run_until_complete(self.serve())
+            except BaseException as e:
+                failure.append(e)
+                self._loop.close()
+                self._loop = None
+                return
+            finally:
+                ready.set()
+            self._loop.run_forever()
+        
+        self._thread = threading.Thread(target=run_loop, name="mock-n8n-server", daemon=True)
+        self._thread.start()
+        if not ready.wait(timeout):
+            raise RuntimeError(f"Mock n8n API did not start listening within {timeout:.0f}s")
+        if failure:
+            self._thread.join()
+            raise failure[0]
+        return self
+    
+    def stop(self) -> None:
+        """Stop a server started with start()."""
+        if self._loop is None:
+            return
+        
+        async def shutdown():
+            self._server.close()
+            # Idle keep-alive connections would otherwise be destroyed with the loop
+            pending = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await self._server.wait_closed()
+        
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+        self._loop = None
+        self.save_cassette()
+    
+    def save_cassette(self) -> None:
+        """Persist interactions recorded during this run."""
+        cassette = self.interpreter.mock_services.cassette
+        if cassette is not None:
+            cassette.save()
+
+
+def load_workflows(directory: str = WORKFLOWS_DIR) -> List[Dict]:
+    """Load workflow definitions from the directory's workflow files, using the file name as the default ID."""
+    workflows = []
+    if not os.path.isdir(directory):
+        logger.warning(f"Workflow directory {directory} does not exist.")
+        return workflows
+    
+    for name in sorted(os.listdir(directory)):
+        if not is_workflow_file(name):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            with open(path, "r") as f:
+                workflow = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping workflow file {path}: {str(e)}")
+            continue
+        if isinstance(workflow, dict) and "nodes" in workflow:
+            workflow.setdefault("id", os.path.splitext(name)[0])
+            workflows.append(workflow)
+    return workflows
+
+
+def main():
+    """Run the stand-in server until interrupted."""
+    parser = argparse.ArgumentParser(description="Serve a local n8n API stand-in")
+    parser.add_argument("--workflows-dir", default=WORKFLOWS_DIR, help="Directory of *-workflow.json files")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to listen on")
+    parser.add_argument("--port", type=int, default=5678, help="Port to listen on")
+    parser.add_argument("--node-latency-ms", type=float, default=MOCK_NODE_LATENCY_MS,
+                        help="Simulated run time of each node in milliseconds")
+    add_cassette_arguments(parser)
+    args = parser.parse_args()
+    
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stdout)]
+    )
+    
+    server = MockN8nServer(
+        load_workflows(args.workflows_dir),
+        host=args.host,
+        port=args.port,
+        interpreter=WorkflowInterpreter(
+            mock_services=MockService(cassette_from_args(args)),
+            node_latency_ms=args.node_latency_ms
+        )
+    )
+    
+    async def run():
+        await server.serve()
+        await asyncio.Event().wait()
+    
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.save_cassette()
+
+
+if __name__ == "__main__":
+    main()
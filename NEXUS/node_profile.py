@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+Per-node latency profiles from n8n execution data.
+
+Each node run in an execution's nodeExecutions (or n8n's runData) is reduced to
+its start offset, run time, output item count and queue wait: the time between
+the node becoming ready (its predecessor finishing, or the execution starting)
+and the node actually starting. Timings from many executions are aggregated
+into per-workflow, per-node percentile profiles and rendered as a text
+waterfall, or written as folded stacks for flame graph tools
+(e.g. ``flamegraph.pl profile.folded > profile.svg``).
+
+Usage:
+    python node_profile.py executions/*.json --workflows ./workflows
+    python node_profile.py executions/*.json --folded-stacks profile.folded
+"""
+
+import os
+import sys
+import json
+import logging
+import argparse
+import threading
+from datetime import datetime
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from percentiles import percentile
+from workflow_graph import WorkflowGraph, load_workflow_files
+
+logger = logging.getLogger('nexus-node-profile')
+
+PROFILE_PERCENTILES = (50, 95, 99)
+WATERFALL_WIDTH = 40  # characters for the longest execution
+TIMING_TOLERANCE_MS = 1  # startTime and executionTime are whole milliseconds
+
+
+@dataclass
+class NodeTiming:
+    """One run of one node within an execution."""
+    node: str
+    run: int
+    start: float  # milliseconds after the execution started
+    queue_wait: float  # milliseconds between the node becoming ready and starting
+    run_time: float  # milliseconds
+    items: int  # output items across all outputs
+    error: bool = False
+
+
+def _epoch_ms(value) -> Optional[float]:
+    """Milliseconds since the epoch from an epoch number or an ISO 8601 timestamp."""
+    if isinstance(value, (int, float)):
+        return float(value)
+    if isinstance(value, str) and value:
+        try:
+            return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp() * 1000
+        except ValueError:
+            return None
+    return None
+
+
+def _output_items(run: Dict) -> int:
+    outputs = (run.get("data") or {}).get("main") or []
+    return sum(len(items) for items in outputs if isinstance(items, list))
+
+
+def node_timings(execution: Dict, workflow: Optional[Dict] = None) -> List[NodeTiming]:
+    """Timing of every node run in an execution, in start order.
+
+    A run's predecessors come from its ``source`` entries when n8n provides
+    them, otherwise from the workflow's connections. Without either, the last
+    run to finish before it started is taken as its predecessor.
+    """
+    run_data = execution.get("nodeExecutions")
+    if run_data is None:
+        run_data = execution.get("data", {}).get("resultData", {}).get("runData", {})
+
+    runs = []
+    for node_name, node_runs in (run_data or {}).items():
+        for index, run in enumerate(node_runs):
+            start = _epoch_ms(run.get("startTime"))
+            if start is None:
+                continue
+            runs.append((node_name, index, run, start, start + float(run.get("executionTime") or 0)))
+    if not runs:
+        return []
+    runs.sort(key=lambda entry: (entry[3], entry[4]))
+
+    started_at = _epoch_ms(execution.get("startedAt"))
+    execution_start = min(started_at, runs[0][3]) if started_at is not None else runs[0][3]
+    graph = WorkflowGraph(workflow) if workflow else None
+
+    timings = []
+    for node_name, index, run, start, end in runs:
+        sources = [
+            source.get("previousNode") for source in (run.get("source") or [])
+            if isinstance(source, dict) and source.get("previousNode")
+        ]
+        if not sources and graph is not None:
+            sources = graph.predecessors.get(node_name, [])
+        known_sources = bool(sources) or graph is not None
+        finished = [
+            other_end for other_name, other_index, _, _, other_end in runs
+            if other_end <= start + TIMING_TOLERANCE_MS and (other_name, other_index) != (node_name, index)
+            and (other_name in sources or not known_sources)
+        ]
+        ready = max(finished) if finished else execution_start
+        timings.append(NodeTiming(
+            node=node_name,
+            run=index,
+            start=start - execution_start,
+            queue_wait=max(0.0, start - ready),
+            run_time=end - start,
+            items=_output_items(run),
+            error=bool(run.get("error"))
+        ))
+    return timings
+
+
+class LatencyProfiler:
+    """Per-workflow, per-node latency samples aggregated across executions."""
+
+    def __init__(self):
+        self.names: Dict[str, str] = {}
+        self.executions: Dict[str, int] = {}
+        # workflow ID -> node -> metric -> samples
+        self.samples: Dict[str, Dict[str, Dict[str, List[float]]]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, workflow_id: str, execution: Dict, workflow: Optional[Dict] = None) -> List[NodeTiming]:
+        """Add an execution's node timings to the workflow's profile and return them."""
+        timings = node_timings(execution, workflow)
+        if not timings:
+            return timings
+        workflow_id = str(workflow_id)
+        with self._lock:
+            if workflow and workflow.get("name"):
+                self.names[workflow_id] = workflow["name"]
+            self.executions[workflow_id] = self.executions.get(workflow_id, 0) + 1
+
+            nodes = self.samples.setdefault(workflow_id, {})
+            for timing in timings:
+                metrics = nodes.setdefault(timing.node, {"start": [], "queue_wait": [], "run_time": [], "items": []})
+                metrics["start"].append(timing.start)
+                metrics["queue_wait"].append(timing.queue_wait)
+                metrics["run_time"].append(timing.run_time)
+                metrics["items"].append(timing.items)
+        return timings
+
+    def profile(self, workflow_id: str) -> List[Dict]:
+        """Percentiles per node, in order of median start time."""
+        nodes = self.samples.get(str(workflow_id), {})
+        total_run_time = sum(sum(metrics["run_time"]) for metrics in nodes.values())
+        profile = []
+        for node_name, metrics in nodes.items():
+            entry = {
+                "node": node_name,
+                "runs": len(metrics["run_time"]),
+                "start_p50": percentile(metrics["start"], 50),
+                "items_p50": percentile(metrics["items"], 50),
+                "share": sum(metrics["run_time"]) / total_run_time if total_run_time else 0.0
+            }
+            for pct in PROFILE_PERCENTILES:
+                entry[f"queue_wait_p{pct}"] = percentile(metrics["queue_wait"], pct)
+                entry[f"run_time_p{pct}"] = percentile(metrics["run_time"], pct)
+            profile.append(entry)
+        profile.sort(key=lambda entry: (entry["start_p50"], entry["node"]))
+        return profile
+
+    def to_dict(self) -> Dict[str, Dict]:
+        """Profiles of every workflow, keyed by workflow ID."""
+        return {
+            workflow_id: {
+                "workflow_name": self.names.get(workflow_id, workflow_id),
+                "executions": self.executions.get(workflow_id, 0),
+                "nodes": self.profile(workflow_id)
+            }
+            for workflow_id in self.samples
+        }
+
+    def waterfall(self, workflow_id: str, width: int = WATERFALL_WIDTH) -> List[str]:
+        """Text waterfall of median queue wait (░) and run time (█) per node."""
+        profile = self.profile(workflow_id)
+        if not profile:
+            return []
+        bottleneck = max(profile, key=lambda entry: entry["share"])
+        span = max(entry["start_p50"] + entry["run_time_p50"] for entry in profile) or 1.0
+        scale = width / span
+        name_width = max(len(entry["node"]) for entry in profile)
+
+        title = f"{self.names.get(str(workflow_id), workflow_id)} ({self.executions.get(str(workflow_id), 0)} executions)"
+        if bottleneck["share"] > 0:
+            title += f": bottleneck {bottleneck['node']} ({bottleneck['share']:.0%} of node run time)"
+        else:
+            bottleneck = None
+        lines = [
+            title,
+            f"{'Node':<{name_width}}  {'Start':>8}  {'Wait p50':>8}  {'Run p50':>8}  {'Run p95':>8}  {'Items':>5}"
+        ]
+        for entry in profile:
+            wait_start = max(0.0, entry["start_p50"] - entry["queue_wait_p50"])
+            offset = int(wait_start * scale)
+            wait = int(entry["start_p50"] * scale) - offset
+            run = max(1, int(round(entry["run_time_p50"] * scale)))
+            marker = " ◀" if entry is bottleneck else ""
+            lines.append(
+                f"{entry['node']:<{name_width}}  {entry['start_p50']:>6.0f}ms  {entry['queue_wait_p50']:>6.0f}ms  "
+                f"{entry['run_time_p50']:>6.0f}ms  {entry['run_time_p95']:>6.0f}ms  {entry['items_p50']:>5.0f}  "
+                f"|{' ' * offset}{'░' * wait}{'█' * run}{marker}"
+            )
+        return lines
+
+    def folded_stacks(self) -> List[str]:
+        """Folded stack lines (``workflow;node;phase microseconds``) summed over all executions."""
+        lines = []
+        for workflow_id, nodes in sorted(self.samples.items()):
+            workflow_frame = self.names.get(workflow_id, workflow_id).replace(";", ",")
+            for node_name, metrics in sorted(nodes.items()):
+                node_frame = node_name.replace(";", ",")
+                for phase, metric in (("queue wait", "queue_wait"), ("run", "run_time")):
+                    total = int(round(sum(metrics[metric]) * 1000))
+                    if total > 0:
+                        lines.append(f"{workflow_frame};{node_frame};{phase} {total}")
+        return lines
+
+    def write_folded_stacks(self, path: str) -> None:
+        """Write the folded stacks for flame graph tools."""
+        with open(path, "w") as f:
+            for line in self.folded_stacks():
+                f.write(line + "\n")
+        logger.info(f"Wrote node latency folded stacks to {path}")
+
+
+def main():
+    """Profile node latencies from exported execution files."""
+    parser = argparse.ArgumentParser(description="Per-node latency profiles from n8n executions")
+    parser.add_argument("executions", nargs="+", help="Execution JSON files (single executions or lists)")
+    parser.add_argument("--workflows", nargs="*", default=[],
+                        help="Workflow JSON files or directories, used to find each node's predecessors")
+    parser.add_argument("--format", choices=["text", "json"], default="text",
+                        help="Print waterfalls or the percentile profiles as JSON")
+    parser.add_argument("--folded-stacks", default=None, help="Write flame graph folded stacks to this file")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stderr)]
+    )
+
+    workflows = {
+        str(workflow.get("id") or os.path.splitext(os.path.basename(path))[0]): workflow
+        for path, workflow in load_workflow_files(args.workflows)
+    }
+    profiler = LatencyProfiler()
+    for path in args.executions:
+        with open(path, "r") as f:
+            data = json.load(f)
+        # A single execution, a list of them, or an API listing ({"data": [...]})
+        if isinstance(data, dict):
+            data = data["data"] if isinstance(data.get("data"), list) else [data]
+        executions = data
+        for execution in executions:
+            workflow_id = str(execution.get("workflowId", "unknown"))
+            profiler.add(workflow_id, execution, workflows.get(workflow_id))
+
+    if args.format == "json":
+        print(json.dumps(profiler.to_dict(), indent=2))
+    else:
+        for workflow_id in profiler.samples:
+            print()
+            for line in profiler.waterfall(workflow_id):
+                print(f"  {line}")
+    if args.folded_stacks:
+        profiler.write_folded_stacks(args.folded_stacks)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Bounded-memory capture of workflow execution outputs.
+
+Workflows that process documents or scrape pages can return very large node
+outputs, often with base64-encoded binary data. Instead of keeping every
+payload in memory until the report is written, each node's output is reduced
+according to a capture policy:
+
+    full       keep outputs inline up to the size limit, spill larger ones to the blob store
+    truncated  keep a size-limited preview plus a digest, with binary data replaced by digests
+    digest     keep only the size, item count and SHA-256 of each output
+
+Spilled payloads are stored gzip-compressed and content-addressed, so reports
+reference them by ID and identical outputs are stored once.
+
+The default policy is truncated. Reports used to include every node's full
+output; set OUTPUT_CAPTURE=full (or --capture full) to keep them.
+"""
+
+import os
+import gzip
+import json
+import hashlib
+import logging
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger('nexus-output-capture')
+
+# Capture configuration
+OUTPUT_CAPTURE = os.getenv('OUTPUT_CAPTURE', 'truncated')  # Options: 'full', 'truncated', 'digest'
+OUTPUT_CAPTURE_LIMIT = int(os.getenv('OUTPUT_CAPTURE_LIMIT', '65536'))  # bytes kept inline per node
+OUTPUT_BLOB_DIR = os.getenv('OUTPUT_BLOB_DIR', 'test-results/blobs')  # empty disables spilling
+
+CAPTURE_POLICIES = ("full", "truncated", "digest")
+
+
+class BlobStore:
+    """Content-addressed, gzip-compressed store for large outputs."""
+
+    def __init__(self, directory: str = OUTPUT_BLOB_DIR):
+        # Created by put() on the first spill, so runs that spill nothing leave no directory
+        self.directory = directory
+
+    def _path(self, blob_id: str) -> str:
+        return os.path.join(self.directory, blob_id[:2], f"{blob_id}.json.gz")
+
+    def put(self, data: bytes, digest: Optional[str] = None) -> str:
+        """Store data and return its ID."""
+        blob_id = digest or hashlib.sha256(data).hexdigest()
+        path = self._path(blob_id)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with gzip.open(tmp_path, "wb", compresslevel=6) as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        return blob_id
+
+    def get(self, blob_id: str) -> Any:
+        """Load a stored output."""
+        with gzip.open(self._path(blob_id), "rb") as f:
+            return json.loads(f.read())
+
+
+def _strip_binary(output: List) -> List:
+    """Replace base64 binary payloads in n8n items with their size and digest."""
+    stripped = []
+    for items in output:
+        if not isinstance(items, list):
+            stripped.append(items)
+            continue
+        new_items = []
+        for item in items:
+            binary = item.get("binary") if isinstance(item, dict) else None
+            if isinstance(binary, dict):
+                item = dict(item)
+                item["binary"] = {
+                    key: {
+                        **{k: v for k, v in value.items() if k != "data"},
+                        "data": {
+                            "size": len(value["data"]),
+                            "sha256": hashlib.sha256(value["data"].encode()).hexdigest()
+                        }
+                    } if isinstance(value, dict) and isinstance(value.get("data"), str) else value
+                    for key, value in binary.items()
+                }
+            new_items.append(item)
+        stripped.append(new_items)
+    return stripped
+
+
+class OutputCapture:
+    """Applies the capture policy to node outputs as they are collected."""
+
+    def __init__(
+        self,
+        policy: str = OUTPUT_CAPTURE,
+        limit: int = OUTPUT_CAPTURE_LIMIT,
+        blob_store: Optional[BlobStore] = None
+    ):
+        if policy not in CAPTURE_POLICIES:
+            raise ValueError(f"Unknown output capture policy: {policy}")
+        self.policy = policy
+        self.limit = limit
+        self.blob_store = blob_store
+        self.spilled = 0
+
+    def capture(self, output: List) -> Any:
+        """Reduce one node's data.main output according to the policy."""
+        data = json.dumps(output, separators=(",", ":")).encode()
+        digest = hashlib.sha256(data).hexdigest()
+        summary = {
+            "size": len(data),
+            "items": sum(len(items) for items in output if isinstance(items, list)),
+            "sha256": digest
+        }
+
+        if self.policy == "digest":
+            return summary
+
+        if len(data) <= self.limit:
+            return output if self.policy == "full" else _strip_binary(output)
+
+        if self.blob_store is not None:
+            summary["blob"] = self.blob_store.put(data, digest)
+            self.spilled += 1
+        elif self.policy == "full":
+            # Nowhere to spill to: keep the output rather than lose it
+            return output
+
+        if self.policy == "truncated":
+            preview = json.dumps(_strip_binary(output), separators=(",", ":"))
+            summary["preview"] = preview[:self.limit]
+            summary["truncated"] = len(preview) > self.limit
+        return summary
+
+    def capture_execution(self, execution: Dict) -> Dict[str, Any]:
+        """Capture the last output of every node in an execution."""
+        output_data = {}
+        for node_name, node_execution in execution.get("nodeExecutions", {}).items():
+            for execution_data in node_execution:
+                output = execution_data.get("data", {}).get("main")
+                if output:
+                    output_data[node_name] = output
+        return {node_name: self.capture(output) for node_name, output in output_data.items()}
@@ -0,0 +1,25 @@
+#!/usr/bin/env python3
+"""
+Nearest-rank percentiles shared by the n8n AI Workflow Automation Hub tools.
+
+The p-th percentile of n samples is the sample at 1-based rank ceil(p/100 * n)
+in ascending order, so it is always one of the observed values.
+
+Used by test_nodes.py, load_generator.py and node_profile.py.
+"""
+
+import math
+from typing import Iterable
+
+
+def nearest_rank(pct: float, count: int) -> int:
+    """1-based rank of the pct-th percentile among count ordered samples."""
+    return min(count, max(1, math.ceil(pct / 100 * count)))
+
+
+def percentile(values: Iterable[float], pct: float) -> float:
+    """Nearest-rank percentile of the values, or 0.0 when there are none."""
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[nearest_rank(pct, len(ordered)) - 1]
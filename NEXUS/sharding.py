@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Timing-balanced sharding for the n8n AI Workflow Automation Hub test CLIs.
+
+With --shard i/N each CI machine runs one of N disjoint subsets of the nodes
+or workflows. Items are assigned with the LPT rule (longest processing time
+first, each to the currently least-loaded shard) using per-item durations
+from earlier runs, so every shard takes roughly total/N. Items without
+history are estimated at the median known duration and ordered by a stable
+hash of their name, which keeps the assignment identical on every machine.
+
+Per-shard JSON reports are combined with the ``merge`` subcommand, which
+also records the observed durations for the next sharded run.
+"""
+
+import os
+import json
+import hashlib
+import argparse
+import logging
+from typing import Any, Dict, Iterable, List, Tuple
+
+logger = logging.getLogger('nexus-sharding')
+
+# Sharding configuration
+SHARD_DURATIONS = os.getenv('SHARD_DURATIONS', '.build-cache/durations.json')  # per-item durations from earlier runs
+DEFAULT_ITEM_DURATION = 1.0  # seconds, used when no item has any history
+
+
+def parse_shard(value: str) -> Tuple[int, int]:
+    """Parse an i/N shard specification (1-based) for argparse."""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', expected i/N such as 1/4")
+    if total < 1 or not 1 <= index <= total:
+        raise argparse.ArgumentTypeError(f"invalid shard '{value}', need 1 <= i <= N")
+    return index, total
+
+
+def load_durations(path: str, kind: str) -> Dict[str, float]:
+    """Recorded durations of one kind of item ("nodes" or "workflows")."""
+    try:
+        with open(path, 'r') as f:
+            return json.load(f).get(kind, {})
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def save_durations(path: str, kind: str, durations: Dict[str, float]) -> None:
+    """Merge newly observed durations into the durations file."""
+    try:
+        with open(path, 'r') as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    data.setdefault(kind, {}).update(durations)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def _stable_hash(name: str) -> str:
+    return hashlib.sha256(name.encode()).hexdigest()
+
+
+def estimate_durations(items: Iterable[str], history: Dict[str, float]) -> Dict[str, float]:
+    """Expected duration of each item: its history, else the median of the known ones."""
+    items = list(items)
+    known = sorted(history[item] for item in items if item in history)
+    fallback = known[len(known) // 2] if known else DEFAULT_ITEM_DURATION
+    return {item: history.get(item, fallback) for item in items}
+
+
+def assign_shards(items: Iterable[str], count: int, history: Dict[str, float]) -> List[List[str]]:
+    """Split items into count shards of roughly equal expected duration (LPT).
+
+    The result depends only on the set of items and the history, not on the
+    order items were listed in.
+    """
+    estimates = estimate_durations(set(items), history)
+    shards: List[List[str]] = [[] for _ in range(count)]
+    loads = [0.0] * count
+    for item in sorted(estimates, key=lambda item: (-estimates[item], _stable_hash(item))):
+        target = min(range(count), key=lambda index: (loads[index], index))
+        shards[target].append(item)
+        loads[target] += estimates[item]
+    return shards
+
+
+def select_shard(items: Iterable[str], shard: Tuple[int, int], history: Dict[str, float]) -> List[str]:
+    """The items of one i/N shard, longest expected first."""
+    index, total = shard
+    items = list(items)
+    shards = assign_shards(items, total, history)
+    estimates = estimate_durations(items, history)
+    loads = [sum(estimates[item] for item in assigned) for assigned in shards]
+    logger.info(
+        f"Shard {index}/{total}: {len(shards[index - 1])} of {len(items)} items, "
+        f"{loads[index - 1]:.1f}s estimated (shards range {min(loads):.1f}s-{max(loads):.1f}s)"
+    )
+    return shards[index - 1]
+
+
+def load_report(path: str) -> Any:
+    """Read a JSON report written with --format=json."""
+    with open(path, 'r') as f:
+        return json.load(f)
+
+
+def add_shard_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the sharding options shared by both test CLIs."""
+    parser.add_argument("--shard", type=parse_shard, default=None, metavar="I/N",
+                        help="Run only shard I of N, balanced by historical durations")
+    parser.add_argument("--shard-durations", default=SHARD_DURATIONS or None,
+                        help="JSON file of per-item durations used to balance shards")
+
+
+def add_merge_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of the merge subcommand shared by both test CLIs."""
+    parser.add_argument("reports", nargs="+", help="Per-shard JSON reports (--format=json output)")
+    parser.add_argument("--format", choices=["text", "json", "github"], default="text",
+                        help="Output format for the combined report")
+    parser.add_argument("--durations", default=SHARD_DURATIONS or None,
+                        help="Record the observed per-item durations in this file for later sharded runs")
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Startup time check for the n8n AI Workflow Automation Hub test CLIs.
+
+Runs each CLI with --help in a fresh interpreter under ``python -X importtime``,
+reports the slowest imports beyond the interpreter's own start-up, and fails
+when the import time exceeds the budget or a module that should only be
+loaded on demand (requests, pytest, asyncio, ...) is imported at startup.
+
+Usage:
+    python startup_benchmark.py
+    python startup_benchmark.py --budget-ms=50 --repeat=5
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+from typing import Dict, List, Tuple
+
+# Budget configuration
+STARTUP_BUDGET_MS = float(os.getenv('STARTUP_BUDGET_MS', '60'))  # import time beyond a bare interpreter
+STARTUP_REPEAT = int(os.getenv('STARTUP_REPEAT', '5'))  # runs per script; the fastest is reported
+
+SCRIPTS = tuple(
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), name)
+    for name in ("test_nodes-file.py", "test-workflows-file.py")
+)
+
+# Heavy modules that only the code paths using them may import
+LAZY_MODULES = ("requests", "pytest", "unittest", "asyncio", "http.server", "multiprocessing", "xml.etree")
+
+
+def _import_times(command: List[str]) -> Tuple[Dict[str, int], float]:
+    """Run a command under -X importtime; return cumulative microseconds per top-level import and wall time."""
+    start_time = time.perf_counter()
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", *command],
+        capture_output=True, text=True
+    )
+    wall_time = time.perf_counter() - start_time
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            cumulative = int(cumulative)
+        except ValueError:
+            continue  # the header line
+        # One space follows the separator; nested imports are indented further
+        name = name[1:].rstrip()
+        times[name] = times.get(name, 0) + cumulative
+    return times, wall_time
+
+
+def measure(script: str, repeat: int = STARTUP_REPEAT) -> Dict:
+    """Fastest of several startups of a CLI, with the interpreter's own imports excluded."""
+    baseline_modules = set(_import_times(["-c", "pass"])[0])
+    best = None
+    for _ in range(max(1, repeat)):
+        times, wall_time = _import_times([script, "--help"])
+        # Only top-level entries: nested imports are already counted in their parent's cumulative time
+        own = {name: us for name, us in times.items() if not name.startswith(" ") and name not in baseline_modules}
+        total_ms = sum(own.values()) / 1000
+        if best is None or total_ms < best["import_ms"]:
+            best = {"script": script, "import_ms": total_ms, "wall_ms": wall_time * 1000, "imports": own}
+
+    loaded = {name.strip() for name in times}
+    best["lazy_violations"] = sorted(
+        module for module in LAZY_MODULES
+        if any(name == module or name.startswith(module + ".") for name in loaded)
+    )
+    return best
+
+
+def main():
+    """Measure CLI startup and enforce the import budget."""
+    parser = argparse.ArgumentParser(description="Check the startup import time of the test CLIs")
+    parser.add_argument("scripts", nargs="*", default=list(SCRIPTS), help="CLI scripts to measure")
+    parser.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS,
+                        help="Maximum import time per script beyond a bare interpreter")
+    parser.add_argument("--repeat", type=int, default=STARTUP_REPEAT,
+                        help="Startups per script; the fastest is compared with the budget")
+    parser.add_argument("--top", type=int, default=5, help="Number of slowest imports to show")
+    args = parser.parse_args()
+
+    failed = False
+    for script in args.scripts:
+        result = measure(script, args.repeat)
+        within_budget = result["import_ms"] <= args.budget_ms
+        status = "✅" if within_budget and not result["lazy_violations"] else "❌"
+        print(f"{status} {os.path.basename(script)}: {result['import_ms']:.1f}ms imports "
+              f"(budget {args.budget_ms:.0f}ms), {result['wall_ms']:.1f}ms wall")
+        slowest = sorted(result["imports"].items(), key=lambda item: item[1], reverse=True)[:args.top]
+        for name, us in slowest:
+            print(f"    {us / 1000:7.1f}ms  {name}")
+        if result["lazy_violations"]:
+            print(f"    imported at startup: {', '.join(result['lazy_violations'])}")
+        failed = failed or status == "❌"
+
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
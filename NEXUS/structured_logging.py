@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+Non-blocking structured logging for the n8n AI Workflow Automation Hub test CLIs.
+
+Log calls only put the record on an in-memory queue; a background listener
+thread writes it to the console (as text) and to a size-rotated log file (as
+JSON Lines). The console is stdout for text reports and stderr whenever stdout
+carries a machine-readable report. Each record carries the run ID and whichever workflow, node and
+execution IDs are bound in the calling context. When the queue is full,
+records are dropped and counted rather than blocking the caller, and DEBUG
+records are rate-limited per call site and optionally sampled, so logging
+does not distort the latencies being measured.
+
+Used by test_nodes.py and test_workflows.py.
+"""
+
+import os
+import sys
+import json
+import time
+import uuid
+import queue
+import atexit
+import random
+import logging
+import threading
+import contextvars
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Iterator, Optional, Tuple
+
+# Logging configuration
+LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+LOG_STDOUT_FORMAT = os.getenv('LOG_STDOUT_FORMAT', 'text')  # Options: 'text', 'json'
+LOG_MAX_BYTES = int(os.getenv('LOG_MAX_BYTES', str(10 * 1024 * 1024)))  # 0 disables rotation
+LOG_BACKUP_COUNT = int(os.getenv('LOG_BACKUP_COUNT', '5'))
+LOG_QUEUE_SIZE = int(os.getenv('LOG_QUEUE_SIZE', '10000'))  # records waiting to be written; more are dropped
+LOG_DEBUG_RATE = float(os.getenv('LOG_DEBUG_RATE', '10'))  # DEBUG records per second per call site, 0 = unlimited
+LOG_DEBUG_SAMPLE = float(os.getenv('LOG_DEBUG_SAMPLE', '1'))  # fraction of DEBUG records kept
+
+TEXT_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+CONTEXT_FIELDS = ("run_id", "workflow_id", "node", "execution_id")
+
+_context: contextvars.ContextVar = contextvars.ContextVar('nexus_log_context', default={})
+_pipeline: Optional[Tuple[int, QueueListener, 'StructuredQueueHandler']] = None
+_pipeline_lock = threading.Lock()
+
+
+def run_id() -> str:
+    """ID shared by every record of this test run, including worker processes."""
+    if not os.environ.get('NEXUS_RUN_ID'):
+        # Stored in the environment so spawned worker processes report the same ID
+        os.environ['NEXUS_RUN_ID'] = uuid.uuid4().hex[:12]
+    return os.environ['NEXUS_RUN_ID']
+
+
+@contextmanager
+def log_context(**ids) -> Iterator[None]:
+    """Attach IDs (workflow_id, node, execution_id) to records logged inside the block."""
+    token = _context.set({**_context.get(), **{key: value for key, value in ids.items() if value is not None}})
+    try:
+        yield
+    finally:
+        _context.reset(token)
+
+
+def bind_log_context(**ids) -> None:
+    """Attach IDs to the rest of the enclosing log_context block."""
+    _context.set({**_context.get(), **{key: value for key, value in ids.items() if value is not None}})
+
+
+class ContextFilter(logging.Filter):
+    """Copies the run ID and the bound context IDs onto each record, in the thread that logged it."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.run_id = run_id()
+        for key, value in _context.get().items():
+            setattr(record, key, value)
+        return True
+
+
+class DebugRateLimiter(logging.Filter):
+    """Token bucket per call site for DEBUG records, with optional random sampling."""
+
+    def __init__(self, rate: float = LOG_DEBUG_RATE, sample: float = LOG_DEBUG_SAMPLE):
+        super().__init__()
+        self.rate = rate
+        self.sample = sample
+        self.suppressed = 0
+        self._buckets: Dict[Tuple[str, int], Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno > logging.DEBUG:
+            return True
+        if self.sample < 1 and random.random() >= self.sample:
+            self.suppressed += 1
+            return False
+        if self.rate <= 0:
+            return True
+
+        site = (record.pathname, record.lineno)
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.get(site, (self.rate, now))
+            tokens = min(self.rate, tokens + (now - updated) * self.rate)
+            allowed = tokens >= 1
+            self._buckets[site] = (tokens - 1 if allowed else tokens, now)
+            if not allowed:
+                self.suppressed += 1
+        return allowed
+
+
+class StructuredQueueHandler(QueueHandler):
+    """Queue handler that never blocks: records that do not fit are dropped and counted."""
+
+    def __init__(self, log_queue: queue.Queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        # Resolve the message and traceback now; the listener formats them as text or JSON
+        record = logging.makeLogRecord(record.__dict__)
+        record.message = record.getMessage()
+        record.msg = record.message
+        record.args = None
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per record."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "timestamp": datetime.fromtimestamp(record.created, timezone.utc).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+            "process": record.process,
+            "thread": record.threadName
+        }
+        for key in CONTEXT_FIELDS:
+            value = getattr(record, key, None)
+            if value is not None:
+                entry[key] = value
+        if record.exc_text:
+            entry["exception"] = record.exc_text
+        return json.dumps(entry, default=str)
+
+
+def start_logging(
+    log_file: str,
+    level: str = LOG_LEVEL,
+    stdout_format: str = LOG_STDOUT_FORMAT,
+    max_bytes: int = LOG_MAX_BYTES,
+    backup_count: int = LOG_BACKUP_COUNT,
+    console: Optional[str] = None
+) -> None:
+    """Route all logging through a queue to the console and a rotating JSON Lines file.
+
+    console is 'stdout' (the default) or 'stderr'; the LOG_CONSOLE environment
+    variable overrides it. Safe to call more than once. Worker processes get
+    their own listener, log to the parent's console stream and append to the
+    same file, leaving its rotation to the parent process.
+    """
+    global _pipeline
+    multiprocessing = sys.modules.get('multiprocessing')
+    worker = multiprocessing is not None and multiprocessing.parent_process() is not None
+    with _pipeline_lock:
+        if _pipeline is not None:
+            pid, listener, handler = _pipeline
+            if pid == os.getpid():
+                return
+            # Inherited through fork: the parent's listener thread does not exist here
+            logging.getLogger().removeHandler(handler)
+        if worker:
+            max_bytes = 0
+        console = os.environ.get('LOG_CONSOLE') or console or 'stdout'
+        # Stored in the environment so spawned worker processes use the same stream
+        os.environ['LOG_CONSOLE'] = console
+
+        stream_handler = logging.StreamHandler(sys.stderr if console == 'stderr' else sys.stdout)
+        stream_handler.setFormatter(JsonFormatter() if stdout_format == "json" else logging.Formatter(TEXT_FORMAT))
+        file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count, encoding="utf-8")
+        file_handler.setFormatter(JsonFormatter())
+
+        handler = StructuredQueueHandler(queue.Queue(LOG_QUEUE_SIZE))
+        handler.addFilter(DebugRateLimiter())
+        handler.addFilter(ContextFilter())
+        listener = QueueListener(handler.queue, stream_handler, file_handler, respect_handler_level=True)
+
+        root = logging.getLogger()
+        root.setLevel(level.upper())
+        root.addHandler(handler)
+        listener.start()
+        atexit.register(stop_logging)
+        if worker:
+            # Pool workers exit without running atexit handlers, but do run multiprocessing finalizers
+            from multiprocessing.util import Finalize
+            Finalize(None, stop_logging, exitpriority=100)
+        _pipeline = (os.getpid(), listener, handler)
+
+
+def stop_logging() -> None:
+    """Write out queued records and stop the listener thread."""
+    global _pipeline
+    with _pipeline_lock:
+        if _pipeline is None or _pipeline[0] != os.getpid():
+            return
+        _, listener, handler = _pipeline
+        _pipeline = None
+    listener.stop()
+    logging.getLogger().removeHandler(handler)
+    for target in listener.handlers:
+        target.close()
+    suppressed = sum(f.suppressed for f in handler.filters if isinstance(f, DebugRateLimiter))
+    if handler.dropped or suppressed:
+        print(f"Logging: {handler.dropped} records dropped (queue full), "
+              f"{suppressed} debug records rate-limited or sampled out", file=sys.stderr)
@@ -10,6 +10,12 @@ Usage:
     python test_workflows.py --workflow=workflow_id
     python test_workflows.py --all
     python test_workflows.py --tag=ai-integration
+    python test_workflows.py --all --concurrency=8
+    python test_workflows.py --changed-since=origin/main
+    python test_workflows.py --all --shard=1/4 --format=json > shard-1.json
+    python test_workflows.py merge shard-*.json
+    python test_workflows.py load --workflow=workflow_id --profile=ramp --rate=1 --end-rate=50
+    python test_workflows.py --all --waterfall --profile-history=20 --folded-stacks=nodes.folded
 """
 
 import json
@@ -17,28 +23,44 @@ import os
 import sys
 import time
 import argparse
+import random
 import logging
-import requests
-from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass
-import unittest
-import pytest
-from dotenv import load_dotenv
-from unittest.mock import patch, MagicMock
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout),
-        logging.FileHandler('workflow_tests.log')
-    ]
+import threading
+from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING, Dict, List, Any, Iterable, Iterator, Optional, Tuple, Union
+from dataclasses import dataclass, asdict
+from datetime import datetime
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from benchmark_store import (
+    BENCHMARK_DB, WORKFLOW_METRICS, BenchmarkStore, Regression, default_environment, report_regressions,
+    workflow_metrics
 )
+from cassette import add_cassette_arguments, cassette_from_args
+from workflow_graph import WORKFLOWS_DIR, analyze_workflow, format_analysis, median_node_latencies
+from node_profile import LatencyProfiler, node_timings
+from event_reporter import STREAMING_FORMATS, EventReporter, bounded_map
+from output_capture import CAPTURE_POLICIES, OUTPUT_BLOB_DIR, OUTPUT_CAPTURE, OUTPUT_CAPTURE_LIMIT, BlobStore, OutputCapture
+from impact_analysis import IMPACT_INDEX_PATH, NODE_DIR, ChangeImpact, WorkflowIndex, analyze_changes
+from sharding import (
+    add_merge_arguments, add_shard_arguments, load_durations, load_report, save_durations, select_shard
+)
+from structured_logging import bind_log_context, log_context, start_logging
+
+# requests, asyncio, http.server, the n8n stand-in and the load generator are imported
+# on the code paths that use them, so --help, merge and worker processes start quickly
+if TYPE_CHECKING:
+    import requests
+    from http.server import ThreadingHTTPServer
+    from mock_n8n_server import MockN8nServer
+
 logger = logging.getLogger('nexus-n8n-tests')
 
-# Load environment variables
-load_dotenv()
+# Load environment variables before the configuration below is read. Only the
+# command-line entry point does this; importers inherit the caller's environment.
+if __name__ == "__main__":
+    from dotenv import load_dotenv
+    load_dotenv()
 
 # n8n API Configuration
 N8N_HOST = os.getenv('N8N_HOST', 'localhost')
@@ -46,10 +68,42 @@ N8N_PORT = os.getenv('N8N_PORT', '5678')
 N8N_PROTOCOL = os.getenv('N8N_PROTOCOL', 'http')
 N8N_API_KEY = os.getenv('N8N_API_KEY', '')
 BASE_URL = f"{N8N_PROTOCOL}://{N8N_HOST}:{N8N_PORT}/api/v1"
+WEBHOOK_URL = os.getenv('N8N_WEBHOOK_URL', f"{N8N_PROTOCOL}://{N8N_HOST}:{N8N_PORT}/webhook")
+
+# HTTP client configuration
+HTTP_POOL_SIZE = int(os.getenv('N8N_HTTP_POOL_SIZE', '10'))
+HTTP_CONNECT_TIMEOUT = float(os.getenv('N8N_HTTP_CONNECT_TIMEOUT', '5'))
+HTTP_READ_TIMEOUT = float(os.getenv('N8N_HTTP_READ_TIMEOUT', '30'))
+HTTP_MAX_RETRIES = int(os.getenv('N8N_HTTP_MAX_RETRIES', '3'))
+HTTP_BACKOFF_BASE = float(os.getenv('N8N_HTTP_BACKOFF_BASE', '0.5'))  # seconds
+HTTP_BACKOFF_MAX = float(os.getenv('N8N_HTTP_BACKOFF_MAX', '10'))  # seconds
+
+# Execution completion configuration
+POLL_MIN_INTERVAL = float(os.getenv('POLL_MIN_INTERVAL', '0.1'))  # seconds
+POLL_MAX_INTERVAL = float(os.getenv('POLL_MAX_INTERVAL', '5'))  # seconds
+POLL_BACKOFF_FACTOR = float(os.getenv('POLL_BACKOFF_FACTOR', '1.5'))
+BATCH_TICK_INTERVAL = float(os.getenv('BATCH_TICK_INTERVAL', '1'))  # seconds
+BATCH_PAGE_SIZE = int(os.getenv('BATCH_PAGE_SIZE', '250'))
+
+# Workflow definition cache configuration
+WORKFLOW_CACHE_TTL = float(os.getenv('WORKFLOW_CACHE_TTL', '300'))  # seconds
+WORKFLOW_CACHE_SIZE = int(os.getenv('WORKFLOW_CACHE_SIZE', '512'))
+WORKFLOW_CACHE_DIR = os.getenv('WORKFLOW_CACHE_DIR', '')  # empty disables the on-disk cache
+WORKFLOW_PAGE_SIZE = int(os.getenv('WORKFLOW_PAGE_SIZE', '100'))
+WEBHOOK_LISTENER_HOST = os.getenv('WEBHOOK_LISTENER_HOST', '127.0.0.1')
+WEBHOOK_LISTENER_PORT = int(os.getenv('WEBHOOK_LISTENER_PORT', '5679'))
+WEBHOOK_LISTENER_SECRET = os.getenv('WEBHOOK_LISTENER_SECRET', '')  # required in the X-Callback-Secret header
+WEBHOOK_EARLY_CALLBACK_TTL = float(os.getenv('WEBHOOK_EARLY_CALLBACK_TTL', '60'))  # seconds
+
+# Execution statuses after which n8n will not update an execution again
+TERMINAL_STATUSES = ("success", "error", "failed", "crashed", "canceled")
 
 # Test environment
 TEST_ENV = os.getenv('TEST_ENV', 'isolated')  # Options: 'isolated', 'integrated', 'production'
 
+# Concurrency configuration
+TEST_CONCURRENCY = int(os.getenv('TEST_CONCURRENCY', '1'))
+EXECUTION_TIMEOUT = int(os.getenv('EXECUTION_TIMEOUT', '60'))  # seconds, per workflow
 
 @dataclass
 class TestResult:
@@ -62,6 +116,8 @@ class TestResult:
     error_message: Optional[str] = None
     output_data: Optional[Dict] = None
     nodes_tested: Optional[List[str]] = None
+    analysis: Optional[Dict] = None
+    node_timings: Optional[List[Dict]] = None
 
 
 class WorkflowTestException(Exception):
@@ -69,160 +125,831 @@ class WorkflowTestException(Exception):
     pass
 
 
-class MockService:
-    """Mock external service integrations for testing."""
+def _parse_timestamp(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp as returned by the n8n API."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def execution_duration(execution: Dict) -> Optional[float]:
+    """Server-side run time of an execution in seconds, if it has finished."""
+    started_at = _parse_timestamp(execution.get("startedAt"))
+    stopped_at = _parse_timestamp(execution.get("stoppedAt"))
+    if started_at is None or stopped_at is None:
+        return None
+    return max(0.0, (stopped_at - started_at).total_seconds())
+
+
+class AdaptivePollingStrategy:
+    """Poll schedule that starts fast and backs off exponentially up to a cap."""
     
-    @staticmethod
-    def mock_openai_response(*args, **kwargs):
-        """Mock OpenAI API responses."""
-        model = kwargs.get('model', 'gpt-3.5-turbo')
-        messages = kwargs.get('messages', [])
+    def __init__(
+        self,
+        min_interval: float = POLL_MIN_INTERVAL,
+        max_interval: float = POLL_MAX_INTERVAL,
+        backoff_factor: float = POLL_BACKOFF_FACTOR
+    ):
+        self.min_interval = min_interval
+        self.max_interval = max(min_interval, max_interval)
+        self.backoff_factor = max(1.0, backoff_factor)
+    
+    def intervals(self, expected_duration: Optional[float] = None) -> Iterator[float]:
+        """Yield successive sleep intervals between status checks.
         
-        if any("generate content" in str(m).lower() for m in messages):
-            return {
-                "choices": [
-                    {
-                        "message": {
-                            "content": "This is a mock response for content generation."
-                        }
-                    }
-                ]
-            }
-        elif any("classify" in str(m).lower() for m in messages):
-            return {
-                "choices": [
-                    {
-                        "message": {
-                            "content": json.dumps({
-                                "category": "Test Category",
-                                "confidence": 0.95,
-                                "reasoning": "This is a test classification."
-                            })
-                        }
-                    }
-                ]
-            }
-        else:
-            return {
-                "choices": [
-                    {
-                        "message": {
-                            "content": "This is a generic mock response."
-                        }
-                    }
-                ]
-            }
+        With an expected duration, one fast check catches executions that finish
+        immediately, then the schedule skips ahead to just before the expected end
+        and restarts the fast polls from there.
+        """
+        interval = self.min_interval
+        if expected_duration and expected_duration > 2 * self.min_interval:
+            yield self.min_interval
+            yield 0.8 * expected_duration - self.min_interval
+        
+        while True:
+            yield interval
+            interval = min(self.max_interval, interval * self.backoff_factor)
+
+
+class CompletionSource(ABC):
+    """Strategy for waiting until an n8n execution has finished."""
     
-    @staticmethod
-    def mock_langchain_response(*args, **kwargs):
-        """Mock LangChain responses."""
-        return {
-            "result": {
-                "output": "This is a mock LangChain response.",
-                "metadata": {
-                    "model": "mock-model",
-                    "tokens": 15,
-                    "process_time": 0.1
-                }
-            }
-        }
+    @abstractmethod
+    def wait(
+        self,
+        api: 'N8nAPI',
+        execution_id: str,
+        timeout: float,
+        expected_duration: Optional[float] = None
+    ) -> Dict:
+        """Block until the execution reaches a terminal status and return it."""
     
-    @staticmethod
-    def mock_webhook_response(*args, **kwargs):
-        """Mock webhook responses."""
-        return {
-            "status": "success",
-            "webhook_id": "mock-webhook-id",
-            "data": {
-                "timestamp": time.time(),
-                "event": "mock_event",
-                "payload": {"key": "value"}
+    def close(self) -> None:
+        """Release any resources held by the completion source."""
+        pass
+
+
+class PollingCompletionSource(CompletionSource):
+    """Waits for completion by polling the execution endpoint."""
+    
+    def __init__(self, strategy: Optional[AdaptivePollingStrategy] = None):
+        self.strategy = strategy or AdaptivePollingStrategy()
+    
+    def wait(
+        self,
+        api: 'N8nAPI',
+        execution_id: str,
+        timeout: float,
+        expected_duration: Optional[float] = None
+    ) -> Dict:
+        deadline = time.time() + timeout
+        for interval in self.strategy.intervals(expected_duration):
+            execution = api.get_execution(execution_id)
+            if execution.get("status") in TERMINAL_STATUSES:
+                return execution
+            
+            remaining = deadline - time.time()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+        
+        raise TimeoutError(f"Execution {execution_id} did not complete within {timeout} seconds")
+
+
+class WebhookCompletionSource(CompletionSource):
+    """Waits for completion callbacks posted by n8n to a local HTTP listener.
+    
+    Workflows under test notify the listener with a final HTTP Request node
+    that POSTs to ``/executions/{{$execution.id}}`` (or posts a JSON body with an
+    ``executionId`` field) with the shared secret in an ``X-Callback-Secret``
+    header. As a safety net against lost callbacks, the execution is also
+    checked at ``fallback_interval``.
+    """
+    
+    def __init__(
+        self,
+        host: str = WEBHOOK_LISTENER_HOST,
+        port: int = WEBHOOK_LISTENER_PORT,
+        secret: str = WEBHOOK_LISTENER_SECRET,
+        fallback_interval: float = 30.0,
+        early_callback_ttl: float = WEBHOOK_EARLY_CALLBACK_TTL,
+        strategy: Optional[AdaptivePollingStrategy] = None
+    ):
+        if not secret:
+            raise ValueError("Webhook completion requires a shared secret (set WEBHOOK_LISTENER_SECRET)")
+        self.host = host
+        self.port = port
+        self.secret = secret
+        self.fallback_interval = fallback_interval
+        self.early_callback_ttl = early_callback_ttl
+        self.strategy = strategy or AdaptivePollingStrategy()
+        self._lock = threading.Lock()
+        self._events: Dict[str, threading.Event] = {}
+        # Callbacks that arrived before their waiter registered, with their arrival time
+        self._early: Dict[str, float] = {}
+        self._server: Optional['ThreadingHTTPServer'] = None
+    
+    def _register(self, execution_id: str) -> threading.Event:
+        with self._lock:
+            event = self._events.setdefault(execution_id, threading.Event())
+            if self._early.pop(execution_id, None) is not None:
+                event.set()
+            return event
+    
+    def _signal(self, execution_id: str) -> None:
+        now = time.monotonic()
+        with self._lock:
+            event = self._events.get(execution_id)
+            if event is not None:
+                event.set()
+                return
+            # Callbacks can arrive before anyone waits on them; keep them only briefly
+            # so callbacks for executions nobody waits on do not accumulate
+            self._early = {
+                early_id: arrived for early_id, arrived in self._early.items()
+                if now - arrived < self.early_callback_ttl
             }
-        }
+            self._early[execution_id] = now
+    
+    def _make_handler(self):
+        import hmac
+        from http.server import BaseHTTPRequestHandler
+        source = self
+        
+        class CallbackHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                length = int(self.headers.get("Content-Length") or 0)
+                body = self.rfile.read(length) if length else b""
+                
+                if not hmac.compare_digest(self.headers.get("X-Callback-Secret", ""), source.secret):
+                    self.send_response(403)
+                    self.end_headers()
+                    return
+                
+                execution_id = None
+                path = self.path.rstrip("/")
+                if path.startswith("/executions/"):
+                    execution_id = path[len("/executions/"):]
+                elif body:
+                    try:
+                        execution_id = json.loads(body).get("executionId")
+                    except (ValueError, AttributeError):
+                        pass
+                
+                if not execution_id:
+                    self.send_response(400)
+                    self.end_headers()
+                    return
+                
+                source._signal(str(execution_id))
+                self.send_response(204)
+                self.end_headers()
+            
+            def log_message(self, format, *args):
+                logger.debug(f"Completion callback: {format % args}")
+        
+        return CallbackHandler
+    
+    def start(self) -> None:
+        """Start the callback listener if it is not already running."""
+        from http.server import ThreadingHTTPServer
+        with self._lock:
+            if self._server is not None:
+                return
+            self._server = ThreadingHTTPServer((self.host, self.port), self._make_handler())
+            self.port = self._server.server_address[1]
+        
+        threading.Thread(target=self._server.serve_forever, name="completion-listener", daemon=True).start()
+        logger.info(f"Listening for execution callbacks on {self.host}:{self.port}")
+    
+    def wait(
+        self,
+        api: 'N8nAPI',
+        execution_id: str,
+        timeout: float,
+        expected_duration: Optional[float] = None
+    ) -> Dict:
+        self.start()
+        execution_id = str(execution_id)
+        event = self._register(execution_id)
+        deadline = time.time() + timeout
+        # Poll schedule used once a callback arrived before the execution record was finalized
+        retry_intervals: Optional[Iterator[float]] = None
+        
+        try:
+            while True:
+                remaining = deadline - time.time()
+                if remaining <= 0:
+                    break
+                
+                interval = next(retry_intervals) if retry_intervals is not None else self.fallback_interval
+                signalled = event.wait(min(interval, remaining))
+                execution = api.get_execution(execution_id)
+                if execution.get("status") in TERMINAL_STATUSES:
+                    return execution
+                if signalled:
+                    # n8n may call back before the execution record is finalized; back off
+                    # adaptively from here rather than waiting for the fallback interval
+                    event.clear()
+                    if retry_intervals is None:
+                        retry_intervals = self.strategy.intervals(expected_duration=None)
+        finally:
+            with self._lock:
+                self._events.pop(execution_id, None)
+        
+        raise TimeoutError(f"Execution {execution_id} did not complete within {timeout} seconds")
+    
+    def close(self) -> None:
+        with self._lock:
+            server, self._server = self._server, None
+        if server is not None:
+            server.shutdown()
+            server.server_close()
+
+
+class BatchCompletionSource(CompletionSource):
+    """Resolves many pending executions with one list query per tick.
+    
+    Waiters register their execution IDs with a shared tracker thread. Each tick
+    lists recent executions once, without node data, and only fetches the full
+    record for executions that turned out to be finished, so polling traffic
+    grows with ticks rather than with the number of executions in flight.
+    Executions that fall outside the listed window for several ticks are checked
+    individually as a fallback.
+    """
+    
+    def __init__(
+        self,
+        tick_interval: float = BATCH_TICK_INTERVAL,
+        page_size: int = BATCH_PAGE_SIZE,
+        max_pages: int = 3,
+        fallback_after_ticks: int = 3
+    ):
+        self.tick_interval = tick_interval
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.fallback_after_ticks = fallback_after_ticks
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[str, Any]] = {}
+        self._api: Optional['N8nAPI'] = None
+        self._thread: Optional[threading.Thread] = None
+        self._stopped = threading.Event()
+        self.list_queries = 0
+        self.detail_fetches = 0
+    
+    def _ensure_tracker(self, api: 'N8nAPI') -> None:
+        with self._lock:
+            self._api = api
+            if self._thread is None or not self._thread.is_alive():
+                self._stopped.clear()
+                self._thread = threading.Thread(target=self._run, name="execution-tracker", daemon=True)
+                self._thread.start()
+    
+    def _run(self) -> None:
+        while not self._stopped.wait(self.tick_interval):
+            with self._lock:
+                if not self._pending:
+                    continue
+            try:
+                self._tick()
+            except Exception as e:
+                logger.warning(f"Execution status tick failed: {str(e)}")
+    
+    def _tick(self) -> None:
+        with self._lock:
+            pending_ids = set(self._pending)
+        
+        # Walk the newest-first execution list until every pending ID has been seen
+        statuses: Dict[str, str] = {}
+        cursor = None
+        oldest_pending = min((int(i) for i in pending_ids if i.isdigit()), default=None)
+        for _ in range(self.max_pages):
+            page = self._api.list_executions(limit=self.page_size, cursor=cursor)
+            self.list_queries += 1
+            
+            for execution in page.get("data", []):
+                execution_id = str(execution.get("id"))
+                if execution_id in pending_ids:
+                    statuses[execution_id] = execution.get("status")
+            
+            cursor = page.get("nextCursor")
+            listed_ids = [str(e.get("id")) for e in page.get("data", [])]
+            reached_oldest = (
+                oldest_pending is not None and listed_ids and listed_ids[-1].isdigit()
+                and int(listed_ids[-1]) <= oldest_pending
+            )
+            if not cursor or reached_oldest or pending_ids <= set(statuses):
+                break
+        
+        for execution_id in pending_ids:
+            with self._lock:
+                waiter = self._pending.get(execution_id)
+            if waiter is None:
+                continue
+            
+            status = statuses.get(execution_id)
+            if status is None:
+                waiter["missed_ticks"] += 1
+                if waiter["missed_ticks"] < self.fallback_after_ticks:
+                    continue
+                waiter["missed_ticks"] = 0
+            elif status not in TERMINAL_STATUSES:
+                continue
+            
+            # Finished (or unseen for too long): fetch the full record for the waiter
+            try:
+                execution = self._api.get_execution(execution_id)
+            except Exception as e:
+                # Fail only this waiter; the others in this tick still get resolved
+                logger.warning(f"Could not fetch execution {execution_id}: {str(e)}")
+                waiter["error"] = e
+                waiter["done"].set()
+                continue
+            self.detail_fetches += 1
+            if execution.get("status") in TERMINAL_STATUSES:
+                waiter["execution"] = execution
+                waiter["done"].set()
+    
+    def wait(
+        self,
+        api: 'N8nAPI',
+        execution_id: str,
+        timeout: float,
+        expected_duration: Optional[float] = None
+    ) -> Dict:
+        execution_id = str(execution_id)
+        waiter = {"done": threading.Event(), "execution": None, "error": None, "missed_ticks": 0}
+        with self._lock:
+            self._pending[execution_id] = waiter
+        self._ensure_tracker(api)
+        
+        try:
+            if waiter["done"].wait(timeout):
+                if waiter["error"] is not None:
+                    raise waiter["error"]
+                return waiter["execution"]
+        finally:
+            with self._lock:
+                self._pending.pop(execution_id, None)
+        
+        raise TimeoutError(f"Execution {execution_id} did not complete within {timeout} seconds")
+    
+    def close(self) -> None:
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.tick_interval * 2)
+            self._thread = None
+
+
+class WorkflowCache:
+    """LRU cache of workflow definitions keyed by ID and version.
+    
+    Entries expire after ``ttl`` seconds. When a workflow's ``updatedAt`` is
+    known (e.g. from a list response), entries for any other version are
+    treated as stale. With a ``cache_dir``, definitions are also written to
+    disk and reused by later runs, but only once a list response confirms the
+    stored version is still current.
+    """
+    
+    def __init__(
+        self,
+        ttl: float = WORKFLOW_CACHE_TTL,
+        max_entries: int = WORKFLOW_CACHE_SIZE,
+        cache_dir: Optional[str] = WORKFLOW_CACHE_DIR or None
+    ):
+        self.ttl = ttl
+        self.max_entries = max(1, max_entries)
+        self.cache_dir = cache_dir
+        self._lock = threading.Lock()
+        self._entries: 'OrderedDict[str, Tuple[float, Dict]]' = OrderedDict()
+        self._versions: Dict[str, Optional[str]] = {}
+        self.hits = 0
+        self.misses = 0
+        
+        if self.cache_dir:
+            os.makedirs(self.cache_dir, exist_ok=True)
+    
+    def _disk_path(self, workflow_id: str) -> str:
+        return os.path.join(self.cache_dir, f"{workflow_id}.json")
+    
+    def _load_from_disk(self, workflow_id: str, version: Optional[str]) -> Optional[Dict]:
+        if not self.cache_dir or version is None:
+            return None
+        try:
+            with open(self._disk_path(workflow_id), 'r') as f:
+                workflow = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return workflow if workflow.get("updatedAt") == version else None
+    
+    def get(self, workflow_id: str) -> Optional[Dict]:
+        """Return the cached definition, or None if it is missing or stale."""
+        workflow_id = str(workflow_id)
+        with self._lock:
+            version = self._versions.get(workflow_id)
+            entry = self._entries.get(workflow_id)
+            if entry is not None:
+                cached_at, workflow = entry
+                fresh = time.time() - cached_at < self.ttl
+                if fresh and (version is None or workflow.get("updatedAt") == version):
+                    self._entries.move_to_end(workflow_id)
+                    self.hits += 1
+                    return workflow
+                del self._entries[workflow_id]
+        
+        workflow = self._load_from_disk(workflow_id, version)
+        if workflow is not None:
+            self._store(workflow_id, workflow)
+            with self._lock:
+                self.hits += 1
+            return workflow
+        
+        with self._lock:
+            self.misses += 1
+        return None
+    
+    def _store(self, workflow_id: str, workflow: Dict) -> None:
+        with self._lock:
+            self._entries[workflow_id] = (time.time(), workflow)
+            self._entries.move_to_end(workflow_id)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+    
+    def put(self, workflow: Dict) -> None:
+        """Cache a full workflow definition."""
+        workflow_id = str(workflow.get("id"))
+        self._store(workflow_id, workflow)
+        with self._lock:
+            self._versions[workflow_id] = workflow.get("updatedAt")
+        
+        if self.cache_dir:
+            path = self._disk_path(workflow_id)
+            tmp_path = f"{path}.{threading.get_ident()}.tmp"
+            try:
+                with open(tmp_path, 'w') as f:
+                    json.dump(workflow, f)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.warning(f"Could not write workflow cache file {path}: {str(e)}")
+    
+    def seed(self, workflows: List[Dict]) -> None:
+        """Record versions from a list response, caching any complete definitions."""
+        for workflow in workflows:
+            if not workflow.get("id"):
+                continue
+            if "nodes" in workflow:
+                self.put(workflow)
+            else:
+                with self._lock:
+                    self._versions[str(workflow["id"])] = workflow.get("updatedAt")
 
 
 class N8nAPI:
     """Interface for interacting with n8n API."""
     
-    def __init__(self, base_url: str = BASE_URL, api_key: str = N8N_API_KEY):
+    # Statuses worth retrying; 5xx responses are only retried for idempotent requests
+    RETRY_STATUSES = {429, 500, 502, 503, 504}
+    IDEMPOTENT_METHODS = {"GET", "HEAD", "OPTIONS"}
+    
+    def __init__(
+        self,
+        base_url: str = BASE_URL,
+        api_key: str = N8N_API_KEY,
+        pool_size: int = HTTP_POOL_SIZE,
+        connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+        read_timeout: float = HTTP_READ_TIMEOUT,
+        max_retries: int = HTTP_MAX_RETRIES,
+        backoff_base: float = HTTP_BACKOFF_BASE,
+        backoff_max: float = HTTP_BACKOFF_MAX,
+        completion_source: Optional[CompletionSource] = None,
+        workflow_cache: Optional[WorkflowCache] = None,
+        webhook_url: str = WEBHOOK_URL
+    ):
         self.base_url = base_url
+        self.webhook_url = webhook_url
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json"
         }
         if api_key:
             self.headers["X-N8N-API-KEY"] = api_key
+        
+        self.timeout = (connect_timeout, read_timeout)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        
+        import requests
+        from requests.adapters import HTTPAdapter
+        
+        # One keep-alive session shared by all calls (and threads) so connections are reused
+        self._adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True)
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount("http://", self._adapter)
+        self.session.mount("https://", self._adapter)
+        
+        self._stats_lock = threading.Lock()
+        self._retries = 0
+        
+        self.completion_source = completion_source or PollingCompletionSource()
+        self.workflow_cache = workflow_cache or WorkflowCache()
     
-    def get_workflow(self, workflow_id: str) -> Dict:
-        """Retrieve a workflow by ID."""
-        response = requests.get(
-            f"{self.base_url}/workflows/{workflow_id}",
-            headers=self.headers
-        )
-        response.raise_for_status()
-        return response.json()
+    def close(self) -> None:
+        """Close all pooled connections and stop the completion source."""
+        self.completion_source.close()
+        self.session.close()
     
-    def list_workflows(self, tag: Optional[str] = None) -> List[Dict]:
-        """List all workflows, optionally filtered by tag."""
-        params = {}
+    def _backoff(self, attempt: int, response: Optional['requests.Response'] = None) -> float:
+        """Compute the delay before the next retry using full-jitter exponential backoff."""
+        if response is not None:
+            retry_after = response.headers.get("Retry-After", "")
+            if retry_after.isdigit():
+                return min(float(retry_after), self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+    
+    def _request(self, method: str, path: str, **kwargs) -> 'requests.Response':
+        """Send a request through the pooled session, retrying transient failures."""
+        import requests
+        url = f"{self.base_url}{path}"
+        kwargs.setdefault("timeout", self.timeout)
+        idempotent = method.upper() in self.IDEMPOTENT_METHODS
+        attempt = 0
+        
+        while True:
+            try:
+                response = self.session.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                # A request that never connected cannot have been processed, so it is always safe to resend
+                if attempt >= self.max_retries or not (idempotent or isinstance(e, requests.ConnectTimeout)):
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"{method} {path} failed ({e}), retrying in {delay:.2f}s")
+            else:
+                retryable = response.status_code == 429 or (
+                    idempotent and response.status_code in self.RETRY_STATUSES
+                )
+                if not retryable or attempt >= self.max_retries:
+                    response.raise_for_status()
+                    return response
+                delay = self._backoff(attempt, response)
+                logger.warning(f"{method} {path} returned {response.status_code}, retrying in {delay:.2f}s")
+                response.close()
+            
+            with self._stats_lock:
+                self._retries += 1
+            attempt += 1
+            time.sleep(delay)
+    
+    def connection_stats(self) -> Dict[str, int]:
+        """Report connection pool usage, to confirm connections are being reused."""
+        requests_sent = 0
+        connections_opened = 0
+        pools = self._adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is not None:
+                requests_sent += pool.num_requests
+                connections_opened += pool.num_connections
+        
+        return {
+            "requests": requests_sent,
+            "connections_opened": connections_opened,
+            "connections_reused": max(0, requests_sent - connections_opened),
+            "retries": self._retries
+        }
+    
+    def get_workflow(self, workflow_id: str, refresh: bool = False) -> Dict:
+        """Retrieve a workflow by ID, using the definition cache unless refresh is set."""
+        if not refresh:
+            workflow = self.workflow_cache.get(workflow_id)
+            if workflow is not None:
+                return workflow
+        
+        response = self._request("GET", f"/workflows/{workflow_id}")
+        workflow = response.json()
+        self.workflow_cache.put(workflow)
+        return workflow
+    
+    def list_workflows_page(
+        self,
+        tag: Optional[str] = None,
+        limit: int = WORKFLOW_PAGE_SIZE,
+        cursor: Optional[str] = None
+    ) -> Dict:
+        """Fetch one page of workflows as a dict with 'data' and 'nextCursor'."""
+        params: Dict[str, Any] = {"limit": limit}
         if tag:
             params["filter"] = f"tag:{tag}"
+        if cursor:
+            params["cursor"] = cursor
             
-        response = requests.get(
-            f"{self.base_url}/workflows",
-            headers=self.headers,
-            params=params
-        )
-        response.raise_for_status()
-        return response.json()
+        response = self._request("GET", "/workflows", params=params)
+        page = response.json()
+        if isinstance(page, list):
+            # Older servers return a bare, unpaginated list
+            page = {"data": page, "nextCursor": None}
+        self.workflow_cache.seed(page.get("data", []))
+        return page
+    
+    def iter_workflows(
+        self,
+        tag: Optional[str] = None,
+        page_size: int = WORKFLOW_PAGE_SIZE,
+        prefetch: bool = True
+    ) -> Iterator[Dict]:
+        """Lazily yield all workflows, following nextCursor pagination.
+        
+        With prefetch enabled, the next page is requested in the background
+        while the caller is still consuming the current one.
+        """
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="workflow-pages") as executor:
+            page = self.list_workflows_page(tag, page_size)
+            while True:
+                cursor = page.get("nextCursor")
+                next_page = None
+                if cursor and prefetch:
+                    next_page = executor.submit(self.list_workflows_page, tag, page_size, cursor)
+                
+                yield from page.get("data", [])
+                
+                if not cursor:
+                    return
+                page = next_page.result() if next_page else self.list_workflows_page(tag, page_size, cursor)
+    
+    def list_workflows(self, tag: Optional[str] = None) -> List[Dict]:
+        """List all workflows, optionally filtered by tag."""
+        return list(self.iter_workflows(tag))
     
     def execute_workflow(self, workflow_id: str, data: Dict = None) -> Dict:
         """Execute a workflow with optional input data."""
         payload = {} if data is None else {"data": data}
         
-        response = requests.post(
-            f"{self.base_url}/workflows/{workflow_id}/execute",
-            headers=self.headers,
-            json=payload
-        )
-        response.raise_for_status()
+        response = self._request("POST", f"/workflows/{workflow_id}/execute", json=payload)
         return response.json()
     
+    def call_webhook(self, path: str, data: Optional[Dict] = None) -> Any:
+        """Trigger a workflow through its webhook URL, without retries since triggers are not idempotent."""
+        response = self.session.post(f"{self.webhook_url}/{path.strip('/')}", json=data or {}, timeout=self.timeout)
+        response.raise_for_status()
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+    
     def get_execution(self, execution_id: str) -> Dict:
         """Get details of a workflow execution."""
-        response = requests.get(
-            f"{self.base_url}/executions/{execution_id}",
-            headers=self.headers
-        )
-        response.raise_for_status()
+        response = self._request("GET", f"/executions/{execution_id}")
         return response.json()
     
+    def list_executions(
+        self,
+        status: Optional[str] = None,
+        workflow_id: Optional[str] = None,
+        limit: int = 100,
+        cursor: Optional[str] = None,
+        include_data: bool = False
+    ) -> Dict:
+        """List executions, newest first, as a page with 'data' and 'nextCursor'."""
+        params: Dict[str, Any] = {"limit": limit, "includeData": str(include_data).lower()}
+        if status:
+            params["status"] = status
+        if workflow_id:
+            params["workflowId"] = workflow_id
+        if cursor:
+            params["cursor"] = cursor
+        
+        response = self._request("GET", "/executions", params=params)
+        body = response.json()
+        if isinstance(body, list):
+            return {"data": body, "nextCursor": None}
+        return body
+    
+    def get_execution_durations(self, workflow_id: str, limit: int = 5) -> List[float]:
+        """Get the run times of a workflow's most recent successful executions."""
+        executions = self.list_executions(status="success", workflow_id=workflow_id, limit=limit)["data"]
+        durations = [execution_duration(execution) for execution in executions]
+        return [duration for duration in durations if duration is not None]
+    
+    def get_node_latencies(self, workflow_id: str, limit: int = 5) -> Dict[str, float]:
+        """Get median per-node run times in milliseconds from recent successful executions."""
+        executions = self.list_executions(
+            status="success", workflow_id=workflow_id, limit=limit, include_data=True
+        )["data"]
+        return median_node_latencies(executions)
+    
     def wait_for_execution(
         self, 
         execution_id: str, 
         timeout: int = 60, 
-        poll_interval: int = 2
+        poll_interval: Optional[float] = None,
+        expected_duration: Optional[float] = None
     ) -> Dict:
-        """Wait for a workflow execution to complete."""
-        start_time = time.time()
-        while time.time() - start_time < timeout:
-            execution = self.get_execution(execution_id)
-            if execution["status"] in ["success", "error", "failed"]:
-                return execution
-            time.sleep(poll_interval)
+        """Wait for a workflow execution to complete.
         
-        raise TimeoutError(f"Execution {execution_id} did not complete within {timeout} seconds")
+        By default the configured completion source decides how to wait; passing
+        a poll_interval forces fixed-interval polling instead.
+        """
+        if poll_interval is not None:
+            fixed = AdaptivePollingStrategy(poll_interval, poll_interval, 1.0)
+            return PollingCompletionSource(fixed).wait(self, execution_id, timeout)
+        
+        return self.completion_source.wait(self, execution_id, timeout, expected_duration)
 
 
 class WorkflowTester:
     """Core workflow testing functionality."""
     
-    def __init__(self, api: N8nAPI = None, test_env: str = TEST_ENV):
-        self.api = api or N8nAPI()
+    def __init__(
+        self,
+        api: N8nAPI = None,
+        test_env: str = TEST_ENV,
+        concurrency: int = TEST_CONCURRENCY,
+        timeout: int = EXECUTION_TIMEOUT,
+        max_in_flight: Optional[int] = None,
+        use_duration_history: bool = False,
+        analyze: bool = True,
+        output_capture: Optional[OutputCapture] = None,
+        profiler: Optional[LatencyProfiler] = None,
+        profile_history: int = 0
+    ):
+        self.concurrency = max(1, concurrency)
+        self.api = api or N8nAPI(pool_size=max(HTTP_POOL_SIZE, self.concurrency))
         self.test_env = test_env
-        self.mock_services = MockService()
+        self.timeout = timeout
+        # Caps executions running on the n8n side, independently of the worker count
+        self._execution_slots = threading.BoundedSemaphore(max(1, max_in_flight or self.concurrency))
+        self.use_duration_history = use_duration_history
+        self._expected_durations: Dict[str, Optional[float]] = {}
+        self.analyze = analyze
+        self.output_capture = output_capture or OutputCapture()
+        self.profiler = profiler
+        # Recent executions per workflow added to the profiler before its first test result
+        self.profile_history = profile_history
+        self._profiled_history: set = set()
+        self._profile_lock = threading.Lock()
+    
+    def _get_timeout(self, workflow: Dict) -> int:
+        """Resolve the execution timeout for a workflow, preferring its own settings."""
+        workflow_timeout = workflow.get("settings", {}).get("executionTimeout", -1)
+        if isinstance(workflow_timeout, (int, float)) and workflow_timeout > 0:
+            return int(workflow_timeout)
+        return self.timeout
+    
+    def _expected_duration(self, workflow_id: str) -> Optional[float]:
+        """Estimate how long a workflow takes from its recent successful executions."""
+        if not self.use_duration_history:
+            return None
+        if workflow_id not in self._expected_durations:
+            try:
+                durations = sorted(self.api.get_execution_durations(workflow_id))
+                self._expected_durations[workflow_id] = durations[len(durations) // 2] if durations else None
+            except Exception as e:
+                logger.warning(f"Could not load execution history for workflow {workflow_id}: {str(e)}")
+                self._expected_durations[workflow_id] = None
+        return self._expected_durations[workflow_id]
+    
+    def _analyze_workflow(self, workflow_id: str, workflow: Dict) -> Optional[Dict]:
+        """Pre-test stage: estimate the workflow's critical path from its node graph."""
+        if not self.analyze:
+            return None
+        try:
+            history = self.api.get_node_latencies(workflow_id) if self.use_duration_history else {}
+            analysis = analyze_workflow(workflow, history)
+        except Exception as e:
+            logger.warning(f"Could not analyze workflow {workflow_id}: {str(e)}")
+            return None
+        
+        for line in format_analysis(analysis):
+            logger.info(f"Workflow {workflow_id}: {line}")
+        return asdict(analysis)
+    
+    def _profile_execution(self, workflow_id: str, workflow: Dict, execution: Dict) -> List[Dict]:
+        """Per-node timings of an execution, also added to the latency profiler when one is configured."""
+        if self.profiler is None:
+            return [asdict(timing) for timing in node_timings(execution, workflow)]
+        
+        with self._profile_lock:
+            load_history = self.profile_history > 0 and workflow_id not in self._profiled_history
+            self._profiled_history.add(workflow_id)
+        if load_history:
+            try:
+                history = self.api.list_executions(
+                    status="success", workflow_id=workflow_id, limit=self.profile_history, include_data=True
+                )["data"]
+            except Exception as e:
+                logger.warning(f"Could not load execution history for workflow {workflow_id}: {str(e)}")
+                history = []
+            for past in history:
+                if str(past.get("id")) != str(execution.get("id")):
+                    self.profiler.add(workflow_id, past, workflow)
+        
+        return [asdict(timing) for timing in self.profiler.add(workflow_id, execution, workflow)]
     
-    def _prepare_test_data(self, workflow_id: str) -> Dict:
+    def _prepare_test_data(self, workflow_id: str, workflow: Optional[Dict] = None) -> Dict:
         """Prepare test data for a specific workflow."""
         # Load test data from JSON file if it exists
         test_data_path = f"test_data/{workflow_id}.json"
@@ -231,7 +958,8 @@ class WorkflowTester:
                 return json.load(f)
         
         # Default test data for common workflow types
-        workflow = self.api.get_workflow(workflow_id)
+        if workflow is None:
+            workflow = self.api.get_workflow(workflow_id)
         workflow_name = workflow.get("name", "").lower()
         
         if "twitter" in workflow_name or "social" in workflow_name:
@@ -264,50 +992,46 @@ class WorkflowTester:
             "testEnvironment": self.test_env
         }
     
+    def _execute_and_wait(self, workflow_id: str, workflow: Dict, test_data: Dict) -> Tuple[str, Dict]:
+        """Execute a workflow and block until the execution completes."""
+        # Isolated runs point the API client at the local n8n stand-in, which answers
+        # external service calls with MockService responses
+        result = self.api.execute_workflow(workflow_id, test_data)
+        
+        # Get execution ID and wait for completion
+        execution_id = result.get("executionId")
+        if not execution_id:
+            raise WorkflowTestException("No execution ID returned")
+        bind_log_context(execution_id=execution_id)
+        
+        execution = self.api.wait_for_execution(
+            execution_id,
+            timeout=self._get_timeout(workflow),
+            expected_duration=self._expected_duration(workflow_id)
+        )
+        return execution_id, execution
+    
     def test_workflow(self, workflow_id: str) -> TestResult:
         """Test a specific workflow and return the results."""
+        with log_context(workflow_id=workflow_id):
+            return self._run_workflow_test(workflow_id)
+    
+    def _run_workflow_test(self, workflow_id: str) -> TestResult:
         start_time = time.time()
         
         try:
             # Get workflow details
             workflow = self.api.get_workflow(workflow_id)
             workflow_name = workflow.get("name", f"Workflow {workflow_id}")
+            analysis = self._analyze_workflow(workflow_id, workflow)
             
             # Prepare test data
-            test_data = self._prepare_test_data(workflow_id)
+            test_data = self._prepare_test_data(workflow_id, workflow)
             
             # Execute workflow with appropriate mock setup based on environment
-            if self.test_env == 'isolated':
-                with patch('requests.post') as mock_post, \
-                     patch('requests.get') as mock_get:
-                    
-                    # Configure mocks based on workflow nodes
-                    nodes = workflow.get("nodes", [])
-                    for node in nodes:
-                        node_type = node.get("type", "")
-                        
-                        if "openai" in node_type:
-                            mock_post.return_value.json.return_value = self.mock_services.mock_openai_response()
-                            mock_post.return_value.status_code = 200
-                        elif "langchain" in node_type:
-                            mock_post.return_value.json.return_value = self.mock_services.mock_langchain_response()
-                            mock_post.return_value.status_code = 200
-                        elif "webhook" in node_type:
-                            mock_post.return_value.json.return_value = self.mock_services.mock_webhook_response()
-                            mock_post.return_value.status_code = 200
-                    
-                    # Execute workflow with mocks active
-                    result = self.api.execute_workflow(workflow_id, test_data)
-            else:
-                # Execute workflow with real external services
-                result = self.api.execute_workflow(workflow_id, test_data)
-            
-            # Get execution ID and wait for completion
-            execution_id = result.get("executionId")
-            if not execution_id:
-                raise WorkflowTestException("No execution ID returned")
-            
-            execution = self.api.wait_for_execution(execution_id)
+            with self._execution_slots:
+                execution_id, execution = self._execute_and_wait(workflow_id, workflow, test_data)
+            timings = self._profile_execution(workflow_id, workflow, execution)
             
             # Analyze execution results
             status = execution.get("status")
@@ -329,18 +1053,14 @@ class WorkflowTester:
                     success=False,
                     execution_time=time.time() - start_time,
                     execution_id=execution_id,
-                    error_message=f"Error in node '{error_node}': {error_message}"
+                    error_message=f"Error in node '{error_node}': {error_message}",
+                    analysis=analysis,
+                    node_timings=timings
                 )
             
-            # Extract output data
-            output_data = {}
-            nodes_tested = []
-            
-            for node_name, node_execution in execution.get("nodeExecutions", {}).items():
-                nodes_tested.append(node_name)
-                for execution_data in node_execution:
-                    if execution_data.get("data", {}).get("main"):
-                        output_data[node_name] = execution_data.get("data", {}).get("main", [])
+            # Extract output data, reduced by the capture policy so large payloads are not held in memory
+            output_data = self.output_capture.capture_execution(execution)
+            nodes_tested = list(execution.get("nodeExecutions", {}))
             
             return TestResult(
                 workflow_id=workflow_id,
@@ -349,7 +1069,9 @@ class WorkflowTester:
                 execution_time=time.time() - start_time,
                 execution_id=execution_id,
                 output_data=output_data,
-                nodes_tested=nodes_tested
+                nodes_tested=nodes_tested,
+                analysis=analysis,
+                node_timings=timings
             )
             
         except Exception as e:
@@ -362,29 +1084,84 @@ class WorkflowTester:
                 error_message=str(e)
             )
     
-    def test_workflows_by_tag(self, tag: str) -> List[TestResult]:
-        """Test all workflows with a specific tag."""
-        workflows = self.api.list_workflows(tag)
-        results = []
+    def _iter_results(self, workflows: Iterable[Dict], ordered: bool = True) -> Iterator[TestResult]:
+        """Test workflows as they are enumerated, concurrently when configured, yielding each result.
         
-        for workflow in workflows:
-            workflow_id = workflow.get("id")
-            if workflow_id:
-                results.append(self.test_workflow(workflow_id))
+        With ordered=False results are yielded as soon as they complete instead of in input order.
+        """
+        workflow_ids = (workflow.get("id") for workflow in workflows if workflow.get("id"))
+        
+        if self.concurrency <= 1:
+            for workflow_id in workflow_ids:
+                yield self.test_workflow(workflow_id)
+            return
         
-        return results
+        logger.info(f"Testing workflows with concurrency {self.concurrency}")
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="workflow-test") as executor:
+            # Tests start as soon as each workflow is submitted, while later pages are still loading;
+            # the submission window keeps only a few finished results waiting to be consumed
+            yield from bounded_map(executor, self.test_workflow, workflow_ids, self.concurrency * 2, ordered)
     
-    def test_all_workflows(self) -> List[TestResult]:
-        """Test all workflows in the n8n instance."""
-        workflows = self.api.list_workflows()
-        results = []
+    def _run_workflows(self, workflows: Iterable[Dict]) -> List[TestResult]:
+        """Test workflows as they are enumerated, concurrently when configured, preserving input order."""
+        return list(self._iter_results(workflows))
+    
+    def iter_workflow_results(self, tag: Optional[str] = None, ordered: bool = True) -> Iterator[TestResult]:
+        """Test all workflows (optionally only those with a tag), yielding results as they are produced."""
+        return self._iter_results(self.api.iter_workflows(tag), ordered)
+    
+    def affected_workflows(self, impact: ChangeImpact, index: WorkflowIndex) -> Iterator[Dict]:
+        """Listed workflows that use a changed node type or whose definition file changed.
         
-        for workflow in workflows:
-            workflow_id = workflow.get("id")
-            if workflow_id:
-                results.append(self.test_workflow(workflow_id))
+        Definitions are only fetched for workflows whose indexed version is out of date.
+        """
+        for workflow in self.api.iter_workflows():
+            workflow_id = str(workflow.get("id"))
+            try:
+                if "nodes" in workflow:
+                    index.add(workflow)
+                elif not index.is_current(workflow_id, workflow.get("updatedAt")):
+                    index.add(self.api.get_workflow(workflow_id))
+            except Exception as e:
+                # Without a definition the workflow cannot be ruled out
+                logger.warning(f"Could not index workflow {workflow_id}, testing it anyway: {str(e)}")
+                yield workflow
+                continue
+            if workflow_id in impact.workflows or index.uses_any(workflow_id, impact.node_types):
+                yield workflow
+    
+    def iter_changed_workflow_results(
+        self,
+        impact: ChangeImpact,
+        index: WorkflowIndex,
+        ordered: bool = True
+    ) -> Iterator[TestResult]:
+        """Test only the workflows affected by a change, yielding results as they are produced."""
+        return self._iter_results(self.affected_workflows(impact, index), ordered)
+    
+    def iter_shard_results(
+        self,
+        workflows: Iterable[Dict],
+        shard: Tuple[int, int],
+        durations: Dict[str, float],
+        ordered: bool = True
+    ) -> Iterator[TestResult]:
+        """Test one shard of the workflows, balanced by historical durations.
         
-        return results
+        Every shard must see the full workflow list before any test starts, so
+        the listing is consumed up front.
+        """
+        by_id = {str(workflow["id"]): workflow for workflow in workflows if workflow.get("id")}
+        selected = select_shard(by_id, shard, durations)
+        return self._iter_results((by_id[workflow_id] for workflow_id in selected), ordered)
+    
+    def test_workflows_by_tag(self, tag: str) -> List[TestResult]:
+        """Test all workflows with a specific tag."""
+        return self._run_workflows(self.api.iter_workflows(tag))
+    
+    def test_all_workflows(self) -> List[TestResult]:
+        """Test all workflows in the n8n instance."""
+        return self._run_workflows(self.api.iter_workflows())
 
 
 def generate_report(results: List[TestResult], output_format: str = "text") -> None:
@@ -412,22 +1189,37 @@ def generate_report(results: List[TestResult], output_format: str = "text") -> N
             
             if result.nodes_tested:
                 print(f"  Nodes Tested: {', '.join(result.nodes_tested)}")
+            
+            if result.analysis:
+                print(f"  Critical Path: {result.analysis['critical_path_latency'] / 1000:.2f}s estimated "
+                      f"({' → '.join(result.analysis['critical_path'])})")
+                for pair in result.analysis["parallelizable"]:
+                    print(f"  Parallelizable: {pair['upstream']} ∥ {pair['downstream']}")
+            
+            if result.node_timings:
+                slowest = max(result.node_timings, key=lambda timing: timing["run_time"])
+                print(f"  Slowest Node: {slowest['node']} ({slowest['run_time']:.0f}ms run, "
+                      f"{slowest['queue_wait']:.0f}ms queued, {slowest['items']} items)")
         
         print("\n" + "=" * 80)
         print(f"SUMMARY: {passed} passed, {failed} failed, {success_rate:.1f}% success rate")
         print("=" * 80)
     
     elif output_format == "json":
-        report = {
-            "summary": {
-                "total": total,
-                "passed": passed,
-                "failed": failed,
-                "success_rate": success_rate
-            },
-            "results": [vars(r) for r in results]
+        summary = {
+            "total": total,
+            "passed": passed,
+            "failed": failed,
+            "success_rate": success_rate
         }
-        print(json.dumps(report, indent=2))
+        # Write one result at a time instead of building the whole document in memory
+        out = sys.stdout
+        out.write('{\n  "summary": ' + json.dumps(summary, indent=2).replace("\n", "\n  ") + ',\n  "results": [')
+        for index, result in enumerate(results):
+            out.write("," if index else "")
+            out.write("\n    " + json.dumps(vars(result), indent=2).replace("\n", "\n    "))
+        out.write("\n  ]\n}\n" if results else "]\n}\n")
+        out.flush()
     
     elif output_format == "github":
         # GitHub Actions format
@@ -436,45 +1228,441 @@ def generate_report(results: List[TestResult], output_format: str = "text") -> N
         print("::endgroup::")
         
         for result in results:
-            if not result.success:
-                node_info = ""
-                if result.nodes_tested:
-                    node_info = f" (Nodes tested: {', '.join(result.nodes_tested)})"
-                    
-                print(f"::error file={result.workflow_id}::{result.error_message}{node_info}")
+            for line in github_annotations(result):
+                print(line)
+
+
+def github_annotations(result: TestResult) -> List[str]:
+    """GitHub Actions annotations for one workflow result."""
+    annotations = []
+    if not result.success:
+        node_info = ""
+        if result.nodes_tested:
+            node_info = f" (Nodes tested: {', '.join(result.nodes_tested)})"
+        annotations.append(f"::error file={result.workflow_id}::{result.error_message}{node_info}")
+    
+    for pair in (result.analysis or {}).get("parallelizable", []):
+        annotations.append(
+            f"::notice file={result.workflow_id},title=Parallelizable AI nodes::"
+            f"{pair['downstream']} does not use the output of {pair['upstream']}"
+        )
+    return annotations
+
+
+def record_benchmarks(
+    results: Iterable[TestResult],
+    db_path: str,
+    test_env: str,
+    check: bool = False
+) -> List[Regression]:
+    """Store workflow timings, optionally checking them against the baseline first."""
+    store = BenchmarkStore(db_path, environment=default_environment("workflows", test_env))
+    regressions = []
+    try:
+        for result in results:
+            metrics = workflow_metrics(result)
+            if check:
+                regressions.extend(store.check("workflow", result.workflow_id, metrics, WORKFLOW_METRICS))
+            store.record("workflow", result.workflow_id, metrics)
+    finally:
+        store.close()
+    return regressions
+
+
+def build_completion_source(completion: str, callback_port: int = WEBHOOK_LISTENER_PORT) -> CompletionSource:
+    """Create the completion source selected on the command line."""
+    if completion == "webhook":
+        return WebhookCompletionSource(port=callback_port)
+    if completion == "batch":
+        return BatchCompletionSource()
+    return PollingCompletionSource()
+
+
+def add_mock_server_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options for running against the local n8n stand-in."""
+    parser.add_argument("--mock-server", action=argparse.BooleanOptionalAction, default=None,
+                        help="Run against a local n8n stand-in (default in the isolated environment)")
+    parser.add_argument("--workflows-dir", default=WORKFLOWS_DIR,
+                        help="Directory of *-workflow.json files served by the local n8n stand-in")
+    add_cassette_arguments(parser)
+
+
+def start_mock_server(args: argparse.Namespace) -> Optional['MockN8nServer']:
+    """Start the local n8n stand-in if requested (by default in the isolated environment)."""
+    enabled = args.mock_server if args.mock_server is not None else args.env == 'isolated'
+    if not enabled:
+        return None
+    from mock_n8n_server import MockN8nServer, MockService, WorkflowInterpreter, load_workflows
+    interpreter = WorkflowInterpreter(mock_services=MockService(cassette_from_args(args)))
+    return MockN8nServer(load_workflows(args.workflows_dir), interpreter=interpreter).start()
+
+
+def add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the per-node latency profile options."""
+    parser.add_argument("--waterfall", action="store_true",
+                        help="Show a per-node waterfall of median queue wait and run time for each workflow")
+    parser.add_argument("--folded-stacks", default=None,
+                        help="Write per-node latencies as flame graph folded stacks to this file")
+
+
+def report_profiles(profiler: Optional[LatencyProfiler], args: argparse.Namespace) -> None:
+    """Show the node waterfalls and write the folded stacks requested on the command line."""
+    if profiler is None:
+        return
+    if args.waterfall:
+        for workflow_id in profiler.samples:
+            lines = profiler.waterfall(workflow_id)
+            if args.format == "text":
+                print()
+                for line in lines:
+                    print(f"  {line}")
+            else:
+                # Logs go to stderr for this format, keeping the report on stdout parseable
+                for line in lines:
+                    logger.info(f"Node waterfall: {line}")
+    if args.folded_stacks:
+        profiler.write_folded_stacks(args.folded_stacks)
+
+
+def _webhook_path(workflow: Dict) -> Optional[str]:
+    for node in workflow.get("nodes", []):
+        if node.get("type", "").endswith(".webhook") and not node.get("disabled"):
+            return node.get("parameters", {}).get("path")
+    return None
+
+
+def configure_logging(output_format: str = "text", events_path: Optional[str] = None) -> None:
+    """Log to the console and workflow_tests.log through the background queue; done by the entry point, not on import.
+
+    Logs go to stderr unless stdout only carries a text report, so JSON and
+    JSON Lines output (including --events -) stays parseable.
+    """
+    text_only = output_format == "text" and events_path != "-"
+    start_logging('workflow_tests.log', console="stdout" if text_only else "stderr")
+
+
+def add_load_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add the options of the load subcommand."""
+    parser.add_argument("--workflow", required=True, help="ID of the workflow to load test")
+    parser.add_argument("--target", choices=["execute", "webhook"], default="execute",
+                        help="Trigger executions through the API execute endpoint or the workflow's webhook")
+    parser.add_argument("--profile", choices=["constant", "ramp", "step"], default="constant",
+                        help="How the arrival rate changes over the run")
+    parser.add_argument("--rate", type=float, default=10,
+                        help="Requests per second (starting rate for ramp and step profiles)")
+    parser.add_argument("--end-rate", type=float, default=None, help="Final rate of a ramp profile")
+    parser.add_argument("--step-rate", type=float, default=10, help="Rate increase per step of a step profile")
+    parser.add_argument("--step-duration", type=float, default=10, help="Seconds per step of a step profile")
+    parser.add_argument("--duration", type=float, default=30, help="Length of the run in seconds")
+    # Defaults come from load_generator, which is only imported when the subcommand runs
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="Worker threads issuing requests, i.e. the maximum concurrent requests "
+                             "before new arrivals queue (default: LOAD_MAX_IN_FLIGHT or 256)")
+    parser.add_argument("--timeout", type=int, default=EXECUTION_TIMEOUT,
+                        help="Per-execution timeout in seconds (execute target)")
+    parser.add_argument("--completion", choices=["poll", "batch", "webhook"], default="poll",
+                        help="How to detect execution completion (execute target)")
+    parser.add_argument("--callback-port", type=int, default=WEBHOOK_LISTENER_PORT,
+                        help="Port for the execution callback listener (with --completion=webhook)")
+    parser.add_argument("--max-error-rate", type=float, default=None,
+                        help="Fail if more than this fraction of requests fail (default: LOAD_MAX_ERROR_RATE or 0.01)")
+    parser.add_argument("--format", choices=["text", "json", "github"], default="text",
+                        help="Output format for load test results")
+    parser.add_argument("--env", choices=["isolated", "integrated", "production"],
+                        default=TEST_ENV, help="Test environment")
+    add_mock_server_arguments(parser)
+    add_profile_arguments(parser)
+
+
+def load_main(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Entry point for the `load` subcommand: drive one workflow at an open-loop arrival rate."""
+    import asyncio
+    from load_generator import LOAD_MAX_ERROR_RATE, LOAD_MAX_IN_FLIGHT, ArrivalProfile, LoadGenerator, report_load
+    
+    configure_logging(args.format)
+    if args.max_in_flight is None:
+        args.max_in_flight = LOAD_MAX_IN_FLIGHT
+    if args.max_error_rate is None:
+        args.max_error_rate = LOAD_MAX_ERROR_RATE
+    if args.completion == "webhook" and not WEBHOOK_LISTENER_SECRET:
+        parser.error("--completion=webhook requires WEBHOOK_LISTENER_SECRET")
+    profiler = LatencyProfiler() if args.waterfall or args.folded_stacks else None
+    
+    mock_server = start_mock_server(args)
+    api = None
+    # Everything after the stand-in starts is inside the try, so a bad workflow ID
+    # still stops it and saves any recorded cassette
+    try:
+        api = N8nAPI(
+            base_url=mock_server.base_url if mock_server else BASE_URL,
+            webhook_url=mock_server.webhook_url if mock_server else WEBHOOK_URL,
+            pool_size=args.max_in_flight,
+            max_retries=0,  # retries would hide the errors a load test is looking for
+            completion_source=build_completion_source(args.completion, args.callback_port)
+        )
+        tester = WorkflowTester(api=api, test_env=args.env, analyze=False)
+        
+        workflow = api.get_workflow(args.workflow)
+        test_data = tester._prepare_test_data(args.workflow, workflow)
+        
+        if args.target == "webhook":
+            path = _webhook_path(workflow)
+            if not path:
+                parser.error(f"Workflow {args.workflow} has no webhook trigger")
+            
+            def send():
+                api.call_webhook(path, test_data)
+        else:
+            def send():
+                execution_id = api.execute_workflow(args.workflow, test_data).get("executionId")
+                if not execution_id:
+                    raise WorkflowTestException("No execution ID returned")
+                execution = api.wait_for_execution(execution_id, timeout=args.timeout)
+                if profiler is not None:
+                    profiler.add(args.workflow, execution, workflow)
+                if execution.get("status") != "success":
+                    raise WorkflowTestException(f"Execution finished with status {execution.get('status')}")
+        
+        profile = ArrivalProfile(
+            args.profile,
+            args.rate,
+            end_rate=args.end_rate,
+            step=args.step_rate,
+            step_duration=args.step_duration
+        )
+        generator = LoadGenerator(
+            send,
+            profile,
+            args.duration,
+            max_in_flight=args.max_in_flight,
+            target=args.workflow,
+            max_error_rate=args.max_error_rate
+        )
+        logger.info(f"Load testing workflow {args.workflow} via {args.target} ({args.profile} profile, {args.duration:.0f}s)")
+        
+        result = asyncio.run(generator.run())
+    finally:
+        if api is not None:
+            api.close()
+        if mock_server:
+            mock_server.stop()
+    
+    report_load(result, args.format, args.max_error_rate)
+    report_profiles(profiler, args)
+    if result.error_rate > args.max_error_rate:
+        sys.exit(1)
+
+
+def merge_main(args: argparse.Namespace, parser: argparse.ArgumentParser) -> None:
+    """Entry point for the `merge` subcommand: combine per-shard JSON reports into one report."""
+    configure_logging(args.format)
+    
+    results = []
+    for path in args.reports:
+        try:
+            results.extend(TestResult(**result) for result in load_report(path)["results"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            parser.error(f"Cannot read report {path}: {str(e)}")
+    
+    if args.durations:
+        save_durations(args.durations, "workflows", {
+            result.workflow_id: result.execution_time for result in results
+        })
+    generate_report(results, args.format)
+    
+    if not all(result.success for result in results):
+        sys.exit(1)
 
 
 def main():
     """Main entry point for the workflow testing script."""
     parser = argparse.ArgumentParser(description="Test n8n workflows")
-    group = parser.add_mutually_exclusive_group(required=True)
+    subcommands = parser.add_subparsers(dest="command", title="subcommands",
+                                        description="Run one of these instead of testing workflows")
+    load_parser = subcommands.add_parser("load", help="Load test one workflow at an open-loop arrival rate",
+                                         description="Load test an n8n workflow")
+    add_load_arguments(load_parser)
+    merge_parser = subcommands.add_parser("merge", help="Combine per-shard JSON reports into one report",
+                                          description="Merge per-shard workflow test reports")
+    add_merge_arguments(merge_parser)
+    
+    # Required unless a subcommand is given; checked after parsing
+    group = parser.add_mutually_exclusive_group()
     group.add_argument("--workflow", help="Test a specific workflow by ID")
     group.add_argument("--tag", help="Test all workflows with a specific tag")
     group.add_argument("--all", action="store_true", help="Test all workflows")
+    group.add_argument("--changed-since", metavar="REF",
+                       help="Test only the workflows affected by node or workflow files changed since a git ref")
     
-    parser.add_argument("--format", choices=["text", "json", "github"], default="text",
-                        help="Output format for test results")
+    parser.add_argument("--format", choices=["text", "json", "github", "jsonl"], default="text",
+                        help="Output format for test results (github and jsonl report each result as it completes)")
+    parser.add_argument("--events", default=None,
+                        help="Also stream results as JSON Lines events to this file ('-' for stdout)")
     parser.add_argument("--env", choices=["isolated", "integrated", "production"], 
                         default=TEST_ENV, help="Test environment")
+    parser.add_argument("--concurrency", type=int, default=TEST_CONCURRENCY,
+                        help="Number of workflows to test in parallel")
+    parser.add_argument("--max-in-flight", type=int, default=None,
+                        help="Maximum concurrent executions on the n8n server (defaults to --concurrency)")
+    parser.add_argument("--timeout", type=int, default=EXECUTION_TIMEOUT,
+                        help="Per-workflow execution timeout in seconds")
+    parser.add_argument("--completion", choices=["poll", "batch", "webhook"], default=None,
+                        help="How to detect execution completion: per-execution adaptive polling, "
+                             "batched status polling (default with --concurrency > 1 against a real n8n "
+                             "instance) or webhook callbacks")
+    parser.add_argument("--callback-port", type=int, default=WEBHOOK_LISTENER_PORT,
+                        help="Port for the execution callback listener (with --completion=webhook)")
+    parser.add_argument("--history-hints", action="store_true",
+                        help="Use recent execution durations to schedule completion polls")
+    parser.add_argument("--workflow-cache-dir", default=WORKFLOW_CACHE_DIR or None,
+                        help="Directory for reusing workflow definitions across runs")
+    parser.add_argument("--analyze", action=argparse.BooleanOptionalAction, default=True,
+                        help="Estimate each workflow's critical path from its node graph before testing")
+    add_mock_server_arguments(parser)
+    parser.add_argument("--node-dir", default=NODE_DIR,
+                        help="Directory containing custom nodes, for mapping changed files with --changed-since")
+    parser.add_argument("--impact-index", default=IMPACT_INDEX_PATH or None,
+                        help="File for the persisted node type to workflow index used by --changed-since")
+    add_shard_arguments(parser)
+    parser.add_argument("--capture", choices=CAPTURE_POLICIES, default=OUTPUT_CAPTURE,
+                        help="How much node output to keep: everything, a truncated preview, or a digest only "
+                             f"(default: {OUTPUT_CAPTURE}; reports kept full outputs before this option, "
+                             "use --capture full for that)")
+    parser.add_argument("--capture-limit", type=int, default=OUTPUT_CAPTURE_LIMIT,
+                        help="Bytes of output kept inline per node; larger outputs go to the blob store")
+    parser.add_argument("--blob-dir", default=OUTPUT_BLOB_DIR or None,
+                        help="Directory for outputs too large to keep inline, created on the first spill")
+    parser.add_argument("--benchmark-db", default=BENCHMARK_DB or None,
+                        help="SQLite file to record workflow timings in")
+    parser.add_argument("--check-regressions", action="store_true",
+                        help="Fail if timings regressed significantly against the recorded baseline")
+    add_profile_arguments(parser)
+    parser.add_argument("--profile-history", type=int, default=0,
+                        help="Also profile this many recent successful executions of each tested workflow "
+                             "(with --waterfall or --folded-stacks)")
     
     args = parser.parse_args()
+    if args.command == "load":
+        return load_main(args, load_parser)
+    if args.command == "merge":
+        return merge_main(args, merge_parser)
+    if not (args.workflow or args.tag or args.all or args.changed_since):
+        parser.error("one of the arguments --workflow --tag --all --changed-since is required")
+    configure_logging(args.format, args.events)
+    if args.check_regressions and not args.benchmark_db:
+        parser.error("--check-regressions requires --benchmark-db")
+    if args.shard and args.workflow:
+        parser.error("--shard requires --all, --tag or --changed-since")
+    if args.profile_history > 0 and not (args.waterfall or args.folded_stacks):
+        parser.error("--profile-history requires --waterfall or --folded-stacks")
+    if args.completion == "webhook" and not WEBHOOK_LISTENER_SECRET:
+        parser.error("--completion=webhook requires WEBHOOK_LISTENER_SECRET")
     
-    # Initialize tester
-    tester = WorkflowTester(test_env=args.env)
+    impact = index = None
+    if args.changed_since:
+        index = WorkflowIndex(args.impact_index)
+        try:
+            impact = analyze_changes(args.changed_since, args.node_dir, args.workflows_dir, index)
+        except RuntimeError as e:
+            parser.error(str(e))
+        logger.info(f"Impact analysis: {impact.describe()}")
     
-    # Run tests based on arguments
-    if args.workflow:
-        results = [tester.test_workflow(args.workflow)]
-    elif args.tag:
-        results = tester.test_workflows_by_tag(args.tag)
-    else:  # args.all
-        results = tester.test_all_workflows()
+    # Isolated runs need no n8n instance: serve the workflow files from a local stand-in
+    mock_server = start_mock_server(args)
+    api = None
+    # Everything after the stand-in starts is inside the try, so a failing run or
+    # report write still stops it and saves any recorded cassette
+    try:
+        # Initialize tester. Batched status polls tick every BATCH_TICK_INTERVAL, which
+        # would dominate runs against the in-process stand-in, so it polls instead
+        completion = args.completion or ("batch" if args.concurrency > 1 and not mock_server else "poll")
+        completion_source = build_completion_source(completion, args.callback_port)
+        api = N8nAPI(
+            base_url=mock_server.base_url if mock_server else BASE_URL,
+            webhook_url=mock_server.webhook_url if mock_server else WEBHOOK_URL,
+            pool_size=max(HTTP_POOL_SIZE, args.concurrency),
+            completion_source=completion_source,
+            workflow_cache=WorkflowCache(cache_dir=args.workflow_cache_dir)
+        )
+        tester = WorkflowTester(
+            api=api,
+            test_env=args.env,
+            concurrency=args.concurrency,
+            timeout=args.timeout,
+            max_in_flight=args.max_in_flight,
+            use_duration_history=args.history_hints,
+            analyze=args.analyze,
+            output_capture=OutputCapture(
+                args.capture,
+                args.capture_limit,
+                BlobStore(args.blob_dir) if args.blob_dir else None
+            ),
+            profiler=LatencyProfiler() if args.waterfall or args.folded_stacks else None,
+            profile_history=args.profile_history
+        )
+        
+        # Results are reported as they complete; only end-of-run formats keep them all
+        streaming = args.format in STREAMING_FORMATS
+        reporter = EventReporter(
+            "workflows",
+            args.format,
+            to_event=vars,
+            is_success=lambda result: result.success,
+            annotations=github_annotations,
+            events_path=args.events,
+            title="Workflow Test Results"
+        )
+        
+        # Run tests based on arguments
+        if args.workflow:
+            results = iter([tester.test_workflow(args.workflow)])
+        elif args.shard:
+            history = load_durations(args.shard_durations, "workflows") if args.shard_durations else {}
+            workflows = tester.affected_workflows(impact, index) if args.changed_since else api.iter_workflows(args.tag)
+            results = tester.iter_shard_results(workflows, args.shard, history, ordered=not streaming)
+        elif args.changed_since:
+            results = tester.iter_changed_workflow_results(impact, index, ordered=not streaming)
+        else:  # args.tag or args.all
+            results = tester.iter_workflow_results(args.tag, ordered=not streaming)
+        results = reporter.track(results)
+        
+        regressions = []
+        if args.benchmark_db:
+            regressions = record_benchmarks(results, args.benchmark_db, args.env, args.check_regressions)
+        else:
+            for _ in results:
+                pass
+        reporter.finish()
+        if index is not None:
+            index.save()
+        
+        # Generate report
+        if not streaming:
+            generate_report(reporter.results, args.format)
+        report_profiles(tester.profiler, args)
+        logger.info(f"n8n API connection stats: {tester.api.connection_stats()}")
+        logger.info(f"Workflow cache: {api.workflow_cache.hits} hits, {api.workflow_cache.misses} misses")
+        if isinstance(completion_source, BatchCompletionSource):
+            logger.info(
+                f"Execution tracker: {completion_source.list_queries} list queries, "
+                f"{completion_source.detail_fetches} detail fetches"
+            )
+    finally:
+        if api is not None:
+            api.close()
+        if mock_server:
+            mock_server.stop()
     
-    # Generate report
-    generate_report(results, args.format)
+    if args.check_regressions:
+        report_regressions(regressions, args.format)
+    
+    # An empty run means the instance (or the stand-in's workflow directory) is misconfigured
+    if args.all and reporter.total == 0:
+        logger.error("No workflows found to test")
+        sys.exit(1)
     
-    # Exit with error code if any tests failed
-    if any(not r.success for r in results):
+    # Exit with error code if any tests failed or timings regressed
+    if reporter.failed or regressions:
         sys.exit(1)
 
 
@@ -0,0 +1,64 @@
+"""Shared fixtures for the NEXUS unit tests."""
+
+import os
+import sys
+import importlib.util
+
+import pytest
+
+NEXUS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# The tools import their sibling modules directly, as when run from NEXUS/
+sys.path.insert(0, NEXUS_DIR)
+
+
+def _load_script(filename: str, module_name: str):
+    """Import one of the CLI scripts, whose file names are not valid module names."""
+    if module_name not in sys.modules:
+        spec = importlib.util.spec_from_file_location(module_name, os.path.join(NEXUS_DIR, filename))
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        spec.loader.exec_module(module)
+    return sys.modules[module_name]
+
+
+@pytest.fixture(scope="session")
+def nodes_cli():
+    """The test_nodes-file.py module."""
+    return _load_script("test_nodes-file.py", "nexus_test_nodes")
+
+
+@pytest.fixture(scope="session")
+def workflows_cli():
+    """The test-workflows-file.py module."""
+    return _load_script("test-workflows-file.py", "nexus_test_workflows")
+
+
+def simple_workflow(workflow_id: str, name: str = None) -> dict:
+    """A two-node workflow the n8n stand-in runs with pass-through handlers."""
+    return {
+        "id": workflow_id,
+        "name": name or f"Workflow {workflow_id}",
+        "nodes": [
+            {"name": "Start", "type": "n8n-nodes-base.manualTrigger", "parameters": {}},
+            {"name": "Set", "type": "n8n-nodes-base.set", "parameters": {}},
+        ],
+        "connections": {"Start": {"main": [[{"node": "Set", "type": "main", "index": 0}]]}},
+    }
+
+
+@pytest.fixture
+def n8n_server():
+    """Factory starting n8n stand-ins that are stopped when the test ends."""
+    from mock_n8n_server import MockN8nServer
+
+    servers = []
+
+    def start(workflows=None, **kwargs):
+        server = MockN8nServer(workflows, **kwargs).start(timeout=5)
+        servers.append(server)
+        return server
+
+    yield start
+    for server in servers:
+        server.stop()
@@ -0,0 +1,91 @@
+"""Tests for batched execution status lookups."""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from conftest import simple_workflow
+from mock_n8n_server import WorkflowInterpreter
+
+
+class _ListingAPI:
+    """Lists the given executions newest first and serves their details."""
+
+    def __init__(self, statuses, listed=True, broken=()):
+        self.statuses = statuses
+        self.listed = listed
+        self.broken = set(broken)
+        self.detail_calls = []
+
+    def list_executions(self, limit=100, cursor=None):
+        if not self.listed:
+            return {"data": [], "nextCursor": None}
+        executions = [{"id": i, "status": s} for i, s in sorted(self.statuses.items(), reverse=True)]
+        return {"data": executions[:limit], "nextCursor": None}
+
+    def get_execution(self, execution_id):
+        self.detail_calls.append(execution_id)
+        if execution_id in self.broken:
+            raise ConnectionError(f"lost execution {execution_id}")
+        return {"id": execution_id, "status": self.statuses[execution_id], "nodeExecutions": {}}
+
+
+def _wait_all(source, api, execution_ids, timeout=5):
+    with ThreadPoolExecutor(max_workers=len(execution_ids)) as executor:
+        futures = [executor.submit(source.wait, api, execution_id, timeout) for execution_id in execution_ids]
+        return [future.result() for future in futures]
+
+
+def test_many_executions_share_list_queries(workflows_cli, n8n_server):
+    server = n8n_server([simple_workflow("1")], interpreter=WorkflowInterpreter(node_latency_ms=20))
+    source = workflows_cli.BatchCompletionSource(tick_interval=0.02)
+    api = workflows_cli.N8nAPI(base_url=server.base_url, completion_source=source)
+    try:
+        execution_ids = [api.execute_workflow("1")["executionId"] for _ in range(20)]
+        executions = _wait_all(source, api, execution_ids)
+    finally:
+        api.close()
+
+    assert [execution["id"] for execution in executions] == execution_ids
+    assert all(execution["status"] == "success" for execution in executions)
+    # Full records are fetched once per finished execution, and they include node data
+    assert source.detail_fetches == len(execution_ids)
+    assert all("Set" in execution["nodeExecutions"] for execution in executions)
+    assert source.list_queries < len(execution_ids)
+
+
+def test_unlisted_executions_are_checked_individually(workflows_cli):
+    source = workflows_cli.BatchCompletionSource(tick_interval=0.01, fallback_after_ticks=2)
+    api = _ListingAPI({"5": "success"}, listed=False)
+    try:
+        assert source.wait(api, "5", timeout=5)["status"] == "success"
+    finally:
+        source.close()
+    assert api.detail_calls == ["5"]
+    assert source.list_queries >= 2
+
+
+def test_running_executions_are_not_fetched(workflows_cli):
+    source = workflows_cli.BatchCompletionSource(tick_interval=0.01)
+    api = _ListingAPI({"5": "running"})
+    try:
+        with pytest.raises(TimeoutError):
+            source.wait(api, "5", timeout=0.1)
+    finally:
+        source.close()
+    assert api.detail_calls == []
+    assert source._pending == {}
+
+
+def test_failed_detail_fetch_only_fails_its_own_waiter(workflows_cli):
+    source = workflows_cli.BatchCompletionSource(tick_interval=0.01)
+    api = _ListingAPI({"5": "success", "6": "error"}, broken={"5"})
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        failing = executor.submit(source.wait, api, "5", 5)
+        passing = executor.submit(source.wait, api, "6", 5)
+        try:
+            assert passing.result()["status"] == "error"
+            with pytest.raises(ConnectionError):
+                failing.result()
+        finally:
+            source.close()
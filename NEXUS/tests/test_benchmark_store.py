@@ -0,0 +1,84 @@
+"""Tests for the benchmark baseline store and its regression gate."""
+
+import random
+
+import pytest
+
+from benchmark_store import (
+    BASELINE_MIN_RUNS, NODE_METRICS, BenchmarkStore, compare, mann_whitney_u, node_metrics, prediction_interval
+)
+
+
+def _noisy(center, spread, count, seed):
+    rng = random.Random(seed)
+    return [rng.gauss(center, spread) for _ in range(count)]
+
+
+def test_single_value_within_run_to_run_noise_is_not_a_regression():
+    # A long history narrows a confidence interval for the median, but not a prediction interval
+    baseline = _noisy(100, 10, 200, seed=1)
+    assert compare(baseline, [115], higher_is_better=False) is None
+
+
+def test_single_value_far_outside_history_is_a_regression():
+    baseline = _noisy(100, 5, 20, seed=2)
+    verdict = compare(baseline, [150], higher_is_better=False)
+    assert verdict["method"] == "prediction-interval"
+    assert verdict["ci_high"] < 150
+    assert verdict["change"] == pytest.approx(0.5, abs=0.05)
+
+
+def test_lower_throughput_is_a_regression_when_higher_is_better():
+    baseline = _noisy(1000, 20, 20, seed=3)
+    assert compare(baseline, [600], higher_is_better=True)["method"] == "prediction-interval"
+    assert compare(baseline, [1400], higher_is_better=True) is None
+
+
+def test_prediction_interval_does_not_shrink_with_history():
+    short_low, short_high = prediction_interval(_noisy(100, 10, 20, seed=4))
+    long_low, long_high = prediction_interval(_noisy(100, 10, 2000, seed=4))
+    assert long_high - long_low > 0.8 * (short_high - short_low)
+
+
+def test_samples_shifted_upwards_fail_the_rank_test():
+    baseline = _noisy(100, 10, 100, seed=5)
+    current = _noisy(130, 10, 50, seed=6)
+    verdict = compare(baseline, current, higher_is_better=False)
+    assert verdict["method"] == "mann-whitney"
+    assert verdict["p_value"] < 0.05
+
+
+def test_samples_from_the_same_distribution_pass_the_rank_test():
+    baseline = _noisy(100, 10, 100, seed=9)
+    current = _noisy(100, 10, 50, seed=10)
+    assert compare(baseline, current, higher_is_better=False) is None
+    assert mann_whitney_u(baseline, current) > 0.05
+
+
+def test_node_metrics_keep_per_iteration_latencies():
+    result = {"tests": {"performance_benchmark": {"success": True, "results": {
+        "average_execution_time": 12.0,
+        "throughput": 80.0,
+        "latency_samples": [10.0, 11.5, 14.5],
+    }}}}
+    metrics = node_metrics(result)
+    assert metrics["latency"] == [10.0, 11.5, 14.5]
+    assert metrics["average_execution_time"] == [12.0]
+    assert "latency" in NODE_METRICS
+
+
+def test_check_needs_enough_runs_not_enough_rows(tmp_path):
+    path = str(tmp_path / "benchmarks.db")
+    for run in range(BASELINE_MIN_RUNS + 1):
+        store = BenchmarkStore(path, environment="test")
+        store.run_id = f"run-{run}"
+        current = {"latency": _noisy(100 if run < BASELINE_MIN_RUNS else 150, 5, 50, seed=run)}
+        regressions = store.check("node", "openai_node", current, NODE_METRICS)
+        store.record("node", "openai_node", current)
+        store.close()
+
+        if run < BASELINE_MIN_RUNS:
+            # Each earlier run stored 50 rows, but fewer than BASELINE_MIN_RUNS runs
+            assert regressions == []
+    assert [r.metric for r in regressions] == ["latency"]
+    assert regressions[0].method == "mann-whitney"
@@ -0,0 +1,106 @@
+"""Tests for the incremental node build cache."""
+
+import os
+import sys
+
+import pytest
+
+FAKE_TSC = """#!{python}
+import os, sys
+if "--version" in sys.argv:
+    print("Version 5.4.0")
+    sys.exit(0)
+with open(os.environ["FAKE_TSC_LOG"], "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+os.makedirs("dist", exist_ok=True)
+with open(os.path.join("dist", "index.js"), "w") as f:
+    f.write("module.exports = {{}};\\n")
+if os.environ.get("FAKE_TSC_FAIL"):
+    print("error TS2304: Cannot find name 'x'.", file=sys.stderr)
+    sys.exit(2)
+"""
+
+
+@pytest.fixture
+def fake_tsc(tmp_path, monkeypatch):
+    """Put a fake tsc alone on PATH; returns a function listing its build invocations."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tsc = bin_dir / "tsc"
+    tsc.write_text(FAKE_TSC.format(python=sys.executable))
+    tsc.chmod(0o755)
+    log = tmp_path / "tsc.log"
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setenv("FAKE_TSC_LOG", str(log))
+    return lambda: log.read_text().splitlines() if log.exists() else []
+
+
+def _tester(nodes_cli, tmp_path):
+    node = tmp_path / "nodes" / "openai_node"
+    node.mkdir(parents=True)
+    (node / "package.json").write_text('{"name": "openai_node"}')
+    (node / "tsconfig.json").write_text('{"compilerOptions": {"outDir": "dist"}}')
+    (node / "OpenAi.node.ts").write_text("export class OpenAi {}\n")
+    tester = nodes_cli.NodeTester(
+        node_dir=str(tmp_path / "nodes"), build_cache_dir=str(tmp_path / "cache"), ast_cache_dir=None
+    )
+    return tester, node
+
+
+def test_unchanged_sources_replay_the_cached_build(nodes_cli, tmp_path, fake_tsc):
+    tester, node = _tester(nodes_cli, tmp_path)
+    assert tester.compile_node("openai_node") is True
+    assert tester.compile_node("openai_node") is True
+    builds = fake_tsc()
+    assert len(builds) == 1
+    # tsc keeps its incremental state in the cache directory
+    assert "--incremental" in builds[0]
+    assert tester.build_cache.tsbuildinfo_path("openai_node") in builds[0]
+
+
+def test_edited_source_invalidates_the_cache(nodes_cli, tmp_path, fake_tsc):
+    tester, node = _tester(nodes_cli, tmp_path)
+    tester.compile_node("openai_node")
+    (node / "OpenAi.node.ts").write_text("export class OpenAi { renamed = true; }\n")
+    tester.compile_node("openai_node")
+    assert len(fake_tsc()) == 2
+
+
+def test_build_config_change_invalidates_the_cache(nodes_cli, tmp_path, fake_tsc):
+    tester, node = _tester(nodes_cli, tmp_path)
+    tester.compile_node("openai_node")
+    (node / "tsconfig.json").write_text('{"compilerOptions": {"outDir": "dist", "strict": true}}')
+    tester.compile_node("openai_node")
+    assert len(fake_tsc()) == 2
+
+
+def test_missing_outputs_force_a_rebuild(nodes_cli, tmp_path, fake_tsc):
+    tester, node = _tester(nodes_cli, tmp_path)
+    tester.compile_node("openai_node")
+    os.remove(node / "dist" / "index.js")
+    tester.compile_node("openai_node")
+    assert len(fake_tsc()) == 2
+
+
+def test_failed_build_is_replayed_as_a_failure(nodes_cli, tmp_path, fake_tsc, monkeypatch):
+    monkeypatch.setenv("FAKE_TSC_FAIL", "1")
+    tester, node = _tester(nodes_cli, tmp_path)
+    assert tester.compile_node("openai_node") is False
+    assert tester.compile_node("openai_node") is False
+    assert len(fake_tsc()) == 1
+
+
+def test_compiler_version_is_part_of_the_key(nodes_cli, tmp_path):
+    tester, node = _tester(nodes_cli, tmp_path)
+    cache = tester.build_cache
+    key = cache.compute_key(str(node), "tsc", "Version 5.4.0")
+    assert cache.compute_key(str(node), "tsc", "Version 5.5.0") != key
+    assert cache.compute_key(str(node), "n8n-node-dev", "Version 5.4.0") != key
+
+
+def test_index_hashes_give_the_same_key_as_reading_the_sources(nodes_cli, tmp_path):
+    tester, node = _tester(nodes_cli, tmp_path)
+    sources = tester.source_index.files("openai_node")
+    assert tester.build_cache.compute_key(str(node), "tsc", "5", sources) == tester.build_cache.compute_key(
+        str(node), "tsc", "5"
+    )
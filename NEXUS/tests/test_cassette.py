@@ -0,0 +1,47 @@
+"""Tests for cassette request normalization and keys."""
+
+from cassette import normalize_request, request_key
+
+
+def _chat(user, request_id, message_id, text="Summarize this"):
+    return {
+        "model": "gpt-4o-mini",
+        "user": user,
+        "id": request_id,
+        "messages": [{"id": message_id, "role": "user", "content": text}],
+    }
+
+
+def test_caller_identifiers_do_not_change_the_key():
+    assert request_key("openai", _chat("alice", "req-1", 1)) == request_key("openai", _chat("bob", "req-2", 1))
+
+
+def test_nested_ids_keep_requests_apart():
+    assert request_key("openai", _chat("alice", "req-1", 1)) != request_key("openai", _chat("alice", "req-1", 2))
+
+
+def test_volatile_values_are_normalized_at_any_depth():
+    first = {"url": "https://example.com", "body": {
+        "sent": "2024-05-01T10:00:00Z",
+        "trace": "123e4567-e89b-12d3-a456-426614174000",
+        "timestamp": 1714557600,
+        "text": "hello   world\n",
+    }}
+    second = {"url": "https://example.com", "body": {
+        "sent": "2025-01-02 03:04:05",
+        "trace": "00000000-0000-0000-0000-000000000000",
+        "timestamp": 1735787045,
+        "text": "hello world",
+    }}
+    assert normalize_request(first) == normalize_request(second)
+    assert request_key("http", first) == request_key("http", second)
+
+
+def test_key_depends_on_service_and_content():
+    request = _chat("alice", "req-1", 1)
+    assert request_key("openai", request) != request_key("langchain", request)
+    assert request_key("openai", request) != request_key("openai", _chat("alice", "req-1", 1, text="Translate this"))
+
+
+def test_normalization_is_key_order_independent():
+    assert request_key("http", {"a": 1, "b": [1, 2]}) == request_key("http", {"b": [1, 2], "a": 1})
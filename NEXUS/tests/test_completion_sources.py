@@ -0,0 +1,119 @@
+"""Tests for adaptive polling and webhook completion of executions."""
+
+import itertools
+import threading
+
+import pytest
+import requests
+
+
+class _ExecutionAPI:
+    """Reports each execution's current status and counts the lookups."""
+
+    def __init__(self, statuses=None):
+        self.statuses = dict(statuses or {})
+        self.lookups = 0
+
+    def get_execution(self, execution_id):
+        self.lookups += 1
+        status = self.statuses.get(execution_id, "running")
+        if isinstance(status, list):
+            status = status.pop(0) if len(status) > 1 else status[0]
+        return {"id": execution_id, "status": status}
+
+
+def _first(intervals, count):
+    return [round(interval, 6) for interval in itertools.islice(intervals, count)]
+
+
+def test_polling_backs_off_exponentially_up_to_the_cap(workflows_cli):
+    strategy = workflows_cli.AdaptivePollingStrategy(min_interval=0.1, max_interval=1, backoff_factor=2)
+    assert _first(strategy.intervals(), 6) == [0.1, 0.2, 0.4, 0.8, 1, 1]
+
+
+def test_expected_duration_skips_ahead_to_just_before_the_end(workflows_cli):
+    strategy = workflows_cli.AdaptivePollingStrategy(min_interval=0.1, max_interval=1, backoff_factor=2)
+    # One fast check, a jump to 80% of the expected 10s, then fast polls again
+    assert _first(strategy.intervals(expected_duration=10), 4) == [0.1, 7.9, 0.1, 0.2]
+    # Durations too short to skip ahead use the plain schedule
+    assert _first(strategy.intervals(expected_duration=0.15), 3) == [0.1, 0.2, 0.4]
+
+
+def test_strategy_rejects_shrinking_schedules(workflows_cli):
+    strategy = workflows_cli.AdaptivePollingStrategy(min_interval=1, max_interval=0.5, backoff_factor=0.5)
+    assert _first(strategy.intervals(), 3) == [1, 1, 1]
+
+
+def test_polling_returns_the_terminal_execution(workflows_cli):
+    api = _ExecutionAPI({"7": ["running", "running", "success"]})
+    strategy = workflows_cli.AdaptivePollingStrategy(min_interval=0.001, max_interval=0.01)
+    execution = workflows_cli.PollingCompletionSource(strategy).wait(api, "7", timeout=5)
+    assert execution["status"] == "success"
+    assert api.lookups == 3
+
+
+def test_polling_times_out(workflows_cli):
+    strategy = workflows_cli.AdaptivePollingStrategy(min_interval=0.01, max_interval=0.01)
+    with pytest.raises(TimeoutError):
+        workflows_cli.PollingCompletionSource(strategy).wait(_ExecutionAPI(), "7", timeout=0.05)
+
+
+@pytest.fixture
+def webhook_source(workflows_cli):
+    source = workflows_cli.WebhookCompletionSource(port=0, secret="s3cret", fallback_interval=30)
+    source.start()
+    yield source
+    source.close()
+
+
+def _callback(source, path="/executions/7", secret="s3cret", **kwargs):
+    url = f"http://127.0.0.1:{source.port}{path}"
+    return requests.post(url, headers={"X-Callback-Secret": secret}, timeout=5, **kwargs).status_code
+
+
+def test_webhook_source_requires_a_secret(workflows_cli):
+    with pytest.raises(ValueError):
+        workflows_cli.WebhookCompletionSource(secret="")
+
+
+def test_callback_wakes_the_waiter_before_the_fallback_poll(webhook_source):
+    api = _ExecutionAPI({"7": "running"})
+    timer = threading.Timer(0.1, lambda: (api.statuses.update({"7": "success"}), _callback(webhook_source)))
+    timer.start()
+    try:
+        execution = webhook_source.wait(api, "7", timeout=5)
+    finally:
+        timer.join()
+    assert execution["status"] == "success"
+    assert api.lookups == 1
+
+
+def test_callback_before_the_waiter_registers_is_kept(webhook_source):
+    assert _callback(webhook_source, path="/executions/", json={"executionId": "7"}) == 204
+    api = _ExecutionAPI({"7": "success"})
+    assert webhook_source.wait(api, "7", timeout=1)["status"] == "success"
+
+
+def test_early_callbacks_expire(webhook_source):
+    webhook_source.early_callback_ttl = 0
+    _callback(webhook_source, path="/executions/8")
+    _callback(webhook_source, path="/executions/9")
+    assert set(webhook_source._early) == {"9"}
+
+
+def test_callbacks_are_rejected_without_the_secret_or_an_id(webhook_source):
+    assert _callback(webhook_source, secret="wrong") == 403
+    assert _callback(webhook_source, path="/executions/", data=b"not json") == 400
+    assert webhook_source._early == {}
+
+
+def test_early_callback_for_an_unfinished_execution_falls_back_to_polling(workflows_cli):
+    strategy = workflows_cli.AdaptivePollingStrategy(min_interval=0.001, max_interval=0.01)
+    source = workflows_cli.WebhookCompletionSource(port=0, secret="s3cret", fallback_interval=30, strategy=strategy)
+    try:
+        source._signal("7")
+        api = _ExecutionAPI({"7": ["running", "running", "success"]})
+        assert source.wait(api, "7", timeout=5)["status"] == "success"
+    finally:
+        source.close()
+    assert api.lookups == 3
@@ -0,0 +1,120 @@
+"""Tests for streaming result reporting and bounded result mapping."""
+
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from conftest import NEXUS_DIR, simple_workflow
+from event_reporter import EventReporter, bounded_map
+
+
+def _events(text):
+    return [json.loads(line) for line in text.splitlines()]
+
+
+def test_jsonl_results_are_written_as_they_are_added(capsys):
+    reporter = EventReporter("nodes", "jsonl")
+    reporter.add({"node": "a", "success": True})
+    assert [event["event"] for event in _events(capsys.readouterr().out)] == ["start", "result"]
+
+    reporter.add({"node": "b", "success": False})
+    assert _events(capsys.readouterr().out) == [{"event": "result", "suite": "nodes", "node": "b", "success": False}]
+
+    summary = reporter.finish()
+    event = _events(capsys.readouterr().out)[0]
+    assert event["event"] == "summary"
+    assert (event["total"], event["passed"], event["failed"]) == (2, 1, 1)
+    assert summary["success_rate"] == 50
+
+
+def test_streaming_formats_keep_no_results(capsys):
+    reporter = EventReporter("nodes", "jsonl")
+    for index in range(3):
+        reporter.add({"node": str(index), "success": True})
+    assert reporter.results is None
+    assert reporter.total == 3
+
+
+def test_end_of_run_formats_keep_results_and_leave_stdout_alone(capsys):
+    reporter = EventReporter("nodes", "json")
+    results = list(reporter.track([{"node": "a", "success": True}]))
+    reporter.finish()
+    assert reporter.results == results
+    assert capsys.readouterr().out == ""
+
+
+def test_events_file_is_flushed_after_every_result(tmp_path, capsys):
+    path = tmp_path / "events.jsonl"
+    reporter = EventReporter("workflows", "text", events_path=str(path))
+    reporter.add({"workflow_id": "1", "success": True})
+    assert [event["event"] for event in _events(path.read_text())] == ["start", "result"]
+    reporter.finish()
+    assert _events(path.read_text())[-1]["event"] == "summary"
+    assert capsys.readouterr().out == ""
+
+
+def test_github_annotations_are_printed_live(capsys):
+    reporter = EventReporter("nodes", "github", annotations=lambda result: [f"::error file={result['node']}::broken"])
+    reporter.add({"node": "a", "success": False})
+    assert capsys.readouterr().out == "::error file=a::broken\n"
+    reporter.finish()
+    assert "Total: 1, Passed: 0, Failed: 1" in capsys.readouterr().out
+
+
+def _delayed(item):
+    # Earlier items take longer, so completion order is the reverse of input order
+    time.sleep(0.02 * (5 - item))
+    return item
+
+
+def test_bounded_map_keeps_input_order():
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        assert list(bounded_map(executor, _delayed, range(5), window=5)) == [0, 1, 2, 3, 4]
+
+
+def test_unordered_bounded_map_yields_in_completion_order():
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        assert list(bounded_map(executor, _delayed, range(5), window=5, ordered=False)) == [4, 3, 2, 1, 0]
+
+
+def test_bounded_map_submits_at_most_a_window_ahead():
+    submitted = []
+    lock = threading.Lock()
+
+    def items():
+        for item in range(10):
+            with lock:
+                submitted.append(item)
+            yield item
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = bounded_map(executor, lambda item: item, items(), window=3)
+        assert next(results) == 0
+        assert len(submitted) == 3
+        assert list(results) == list(range(1, 10))
+
+
+def test_workflow_cli_streams_jsonl_events(tmp_path):
+    workflows_dir = tmp_path / "workflows"
+    workflows_dir.mkdir()
+    for workflow_id in ("1", "2"):
+        (workflows_dir / f"w{workflow_id}-workflow.json").write_text(json.dumps(simple_workflow(workflow_id)))
+
+    env = dict(os.environ)
+    env.pop("LOG_CONSOLE", None)
+    result = subprocess.run(
+        [sys.executable, os.path.join(NEXUS_DIR, "test-workflows-file.py"), "--all", "--format", "jsonl",
+         "--mock-server", "--workflows-dir", str(workflows_dir), "--concurrency", "2",
+         "--events", str(tmp_path / "events.jsonl")],
+        cwd=tmp_path, env=env, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    events = _events(result.stdout)
+    assert [event["event"] for event in events] == ["start", "result", "result", "summary"]
+    assert sorted(event["workflow_id"] for event in events[1:3]) == ["1", "2"]
+    assert events[-1]["passed"] == 2
+    assert _events((tmp_path / "events.jsonl").read_text()) == events
@@ -0,0 +1,100 @@
+"""Tests for mapping changed files to node packages and affected workflows."""
+
+import json
+import shutil
+import subprocess
+
+import pytest
+
+from impact_analysis import WorkflowIndex, analyze_changes, changed_node_packages, package_node_types
+
+
+def _workflow(workflow_id, *node_types):
+    return {
+        "id": workflow_id,
+        "name": workflow_id,
+        "nodes": [{"name": f"Node {i}", "type": node_type} for i, node_type in enumerate(node_types)],
+        "connections": {},
+    }
+
+
+@pytest.fixture
+def repo(tmp_path):
+    node_dir = tmp_path / "custom-nodes"
+    for package in ("openai_node", "langchain_node"):
+        (node_dir / package).mkdir(parents=True)
+        (node_dir / package / "index.ts").write_text("export {};\n")
+    (node_dir / "langchain_node" / "package.json").write_text(json.dumps({
+        "name": "n8n-nodes-langchain",
+        "n8n": {"nodes": ["dist/nodes/LangChainAgent.node.js"]},
+    }))
+
+    workflows_dir = tmp_path / "workflows"
+    workflows_dir.mkdir()
+    for workflow in (
+        _workflow("summarize", "n8n-nodes-base.webhook", "nexus-nodes.openai"),
+        _workflow("agent", "n8n-nodes-base.cron", "n8n-nodes-langchain.LangChainAgent"),
+        _workflow("plain", "n8n-nodes-base.httpRequest"),
+    ):
+        (workflows_dir / f"{workflow['id']}-workflow.json").write_text(json.dumps(workflow))
+    return tmp_path
+
+
+def test_changed_files_map_to_their_packages(repo):
+    node_dir = str(repo / "custom-nodes")
+    files = [str(repo / "custom-nodes" / "openai_node" / "index.ts"), str(repo / "README.md")]
+    assert changed_node_packages(files, node_dir) == {"openai_node"}
+
+
+def test_shared_file_at_the_top_affects_every_package(repo):
+    node_dir = str(repo / "custom-nodes")
+    assert changed_node_packages([str(repo / "custom-nodes" / "tsconfig.json")], node_dir) == {
+        "openai_node", "langchain_node"
+    }
+
+
+def test_package_node_types_use_directory_and_package_json(repo):
+    node_dir = str(repo / "custom-nodes")
+    assert "nexus-nodes.openai" in package_node_types(node_dir, "openai_node")
+    types = package_node_types(node_dir, "langchain_node")
+    assert "n8n-nodes-langchain.langchainagent" in types
+    assert "nexus-nodes.langchain" in types
+
+
+def test_index_finds_workflows_using_changed_node_types(repo):
+    index = WorkflowIndex(None)
+    index.scan_directory(str(repo / "workflows"))
+    node_types = package_node_types(str(repo / "custom-nodes"), "langchain_node")
+    assert index.affected_workflows(node_types) == {"agent"}
+    assert index.uses_any("summarize", {"nexus-nodes.openai"})
+    assert not index.uses_any("plain", node_types)
+
+
+def test_index_persists_and_skips_unchanged_files(repo):
+    path = str(repo / "index.json")
+    index = WorkflowIndex(path)
+    index.scan_directory(str(repo / "workflows"))
+    index.save()
+
+    reloaded = WorkflowIndex(path)
+    reloaded.scan_directory(str(repo / "workflows"))
+    assert reloaded.updated == 0
+    assert reloaded.file_workflow(str(repo / "workflows" / "plain-workflow.json")) == "plain"
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git is not installed")
+def test_analyze_changes_since_a_ref(repo):
+    def git(*args):
+        subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+    git("init", "-q")
+    git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "--allow-empty", "-m", "base")
+    git("add", ".")
+    git("-c", "user.name=test", "-c", "user.email=test@example.com", "commit", "-q", "-m", "nodes and workflows")
+    git("tag", "before-change")
+    (repo / "custom-nodes" / "openai_node" / "index.ts").write_text("export const changed = true;\n")
+    (repo / "workflows" / "plain-workflow.json").write_text(json.dumps(_workflow("plain", "n8n-nodes-base.set")))
+
+    impact = analyze_changes("before-change", str(repo / "custom-nodes"), str(repo / "workflows"), WorkflowIndex(None))
+    assert impact.nodes == {"openai_node"}
+    assert impact.workflows == {"summarize", "plain"}
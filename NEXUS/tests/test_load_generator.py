@@ -0,0 +1,109 @@
+"""Tests for the open-loop load generator."""
+
+import asyncio
+import itertools
+import threading
+import time
+
+import pytest
+
+from load_generator import ArrivalProfile, LatencyHistogram, LoadGenerator, LoadWindow, find_saturation
+
+
+def test_small_latencies_are_recorded_exactly():
+    histogram = LatencyHistogram()
+    for microseconds in (1, 2, 3, 500):
+        histogram.record(microseconds / 1_000_000)
+    assert histogram.percentile(50) == 2 / 1_000_000
+    assert histogram.percentile(100) == 500 / 1_000_000
+    assert histogram.count == 4
+
+
+def test_large_latencies_stay_within_the_relative_error():
+    histogram = LatencyHistogram(significant_bits=10)
+    for seconds in (0.1234, 1.5, 42.0):
+        single = LatencyHistogram(significant_bits=10)
+        single.record(seconds)
+        single.record(seconds * 2)
+        assert single.percentile(50) == pytest.approx(seconds, rel=1 / 2 ** 10)
+        histogram.merge(single)
+    assert histogram.count == 6
+    assert histogram.max == 84_000_000
+
+
+def test_constant_profile_schedules_the_requested_rate():
+    arrivals = list(ArrivalProfile("constant", rate=200).arrivals(duration=1))
+    assert arrivals[0] == 0
+    assert len(arrivals) == 200
+    assert arrivals == sorted(arrivals)
+
+
+def test_ramp_from_zero_reaches_the_end_rate():
+    arrivals = list(ArrivalProfile("ramp", rate=0, end_rate=100).arrivals(duration=2))
+    # The average rate of a linear ramp is half the end rate
+    assert len(arrivals) == pytest.approx(100, abs=2)
+    first_half = sum(1 for offset in arrivals if offset < 1)
+    assert first_half == pytest.approx(25, abs=2)
+
+
+def test_step_profile_raises_the_rate_each_step():
+    profile = ArrivalProfile("step", rate=10, step=10, step_duration=1)
+    arrivals = list(profile.arrivals(duration=3))
+    per_second = [sum(1 for offset in arrivals if second <= offset < second + 1) for second in range(3)]
+    assert per_second == [10, 20, 30]
+
+
+def test_run_counts_requests_and_errors():
+    counter = itertools.count()
+    lock = threading.Lock()
+
+    def send():
+        with lock:
+            index = next(counter)
+        if index % 4 == 3:
+            raise ConnectionError("refused")
+
+    result = asyncio.run(LoadGenerator(send, ArrivalProfile("constant", rate=200), duration=0.2).run())
+    assert result.requests == 40
+    assert result.errors == 10
+    assert result.error_samples == {"refused": 10}
+    assert result.histogram.count == 30
+    assert result.to_dict()["error_rate"] == 0.25
+
+
+def test_waiting_for_a_free_worker_counts_as_latency():
+    # One worker taking 20ms per request cannot keep up with 10 arrivals in 50ms
+    result = asyncio.run(LoadGenerator(
+        lambda: time.sleep(0.02), ArrivalProfile("constant", rate=200), duration=0.05, max_in_flight=1
+    ).run())
+    assert result.requests == 10
+    assert result.histogram.percentile(100) >= 0.15
+    assert result.elapsed >= 0.2
+
+
+def _window(start, offered, succeeded, p99_seconds, errors=0):
+    window = LoadWindow(start=start, offered=offered, succeeded=succeeded, errors=errors)
+    for _ in range(succeeded):
+        window.histogram.record(p99_seconds)
+    return window
+
+
+def test_saturation_is_the_first_window_that_falls_behind():
+    windows = [
+        _window(0, 10, 10, 0.01),
+        _window(1, 20, 20, 0.012),
+        _window(2, 30, 20, 0.015),
+        _window(3, 40, 10, 0.2),
+        _window(4, 5, 1, 0.2),
+    ]
+    assert find_saturation(windows) == 30
+
+
+def test_latency_growth_marks_saturation():
+    windows = [_window(0, 10, 10, 0.01), _window(1, 20, 20, 0.05), _window(2, 5, 5, 0.01)]
+    assert find_saturation(windows) == 20
+
+
+def test_no_saturation_while_keeping_up():
+    windows = [_window(0, 10, 10, 0.01), _window(1, 20, 20, 0.011), _window(2, 5, 1, 0.5)]
+    assert find_saturation(windows) is None
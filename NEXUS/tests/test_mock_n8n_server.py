@@ -0,0 +1,28 @@
+"""Tests for the local n8n stand-in's lifecycle."""
+
+import socket
+
+import pytest
+
+from mock_n8n_server import MockN8nServer
+
+
+def test_start_raises_when_the_port_is_in_use():
+    with socket.socket() as taken:
+        taken.bind(("127.0.0.1", 0))
+        taken.listen()
+        server = MockN8nServer([], port=taken.getsockname()[1])
+        with pytest.raises(OSError):
+            server.start(timeout=5)
+    # Nothing to stop; the failed start left no loop behind
+    server.stop()
+
+
+def test_start_and_stop():
+    server = MockN8nServer([]).start(timeout=5)
+    try:
+        assert server.port != 0
+        with socket.create_connection(("127.0.0.1", server.port), timeout=5):
+            pass
+    finally:
+        server.stop()
@@ -0,0 +1,115 @@
+"""Tests for the pooled, retrying N8nAPI client."""
+
+import pytest
+import requests
+
+from conftest import simple_workflow
+
+
+class _Response:
+    def __init__(self, status_code, body=None, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self._body = body
+        self.closed = False
+
+    def json(self):
+        return self._body
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+
+    def close(self):
+        self.closed = True
+
+
+def _stubbed_api(workflows_cli, monkeypatch, outcomes, **kwargs):
+    """An N8nAPI whose session replays outcomes (responses or exceptions) in order."""
+    kwargs.setdefault("backoff_base", 0)
+    api = workflows_cli.N8nAPI(base_url="http://n8n.invalid/api/v1", **kwargs)
+    calls = []
+
+    def request(method, url, **request_kwargs):
+        calls.append((method, url))
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(api.session, "request", request)
+    return api, calls
+
+
+def test_idempotent_request_is_retried_on_server_errors(workflows_cli, monkeypatch):
+    failed = _Response(503)
+    api, calls = _stubbed_api(workflows_cli, monkeypatch, [failed, _Response(502), _Response(200, {"id": "1"})])
+    assert api.get_execution("1") == {"id": "1"}
+    assert len(calls) == 3
+    assert failed.closed
+    assert api.connection_stats()["retries"] == 2
+
+
+def test_retries_stop_at_max_retries(workflows_cli, monkeypatch):
+    api, calls = _stubbed_api(workflows_cli, monkeypatch, [_Response(500)] * 3, max_retries=2)
+    with pytest.raises(requests.HTTPError):
+        api.get_execution("1")
+    assert len(calls) == 3
+
+
+def test_post_is_not_retried_on_server_errors(workflows_cli, monkeypatch):
+    api, calls = _stubbed_api(workflows_cli, monkeypatch, [_Response(503)])
+    with pytest.raises(requests.HTTPError):
+        api.execute_workflow("1")
+    assert len(calls) == 1
+
+
+def test_post_is_retried_when_rate_limited(workflows_cli, monkeypatch):
+    outcomes = [_Response(429, headers={"Retry-After": "0"}), _Response(200, {"executionId": "7"})]
+    api, calls = _stubbed_api(workflows_cli, monkeypatch, outcomes)
+    assert api.execute_workflow("1") == {"executionId": "7"}
+    assert len(calls) == 2
+
+
+def test_post_is_only_resent_when_it_never_connected(workflows_cli, monkeypatch):
+    outcomes = [requests.ConnectTimeout("connect timed out"), _Response(200, {"executionId": "7"})]
+    api, calls = _stubbed_api(workflows_cli, monkeypatch, outcomes)
+    assert api.execute_workflow("1") == {"executionId": "7"}
+
+    api, calls = _stubbed_api(workflows_cli, monkeypatch, [requests.ReadTimeout("read timed out")])
+    with pytest.raises(requests.ReadTimeout):
+        api.execute_workflow("1")
+    assert len(calls) == 1
+
+
+def test_get_is_retried_after_connection_errors(workflows_cli, monkeypatch):
+    outcomes = [requests.ConnectionError("reset"), _Response(200, {"id": "1"})]
+    api, calls = _stubbed_api(workflows_cli, monkeypatch, outcomes)
+    assert api.get_execution("1") == {"id": "1"}
+    assert len(calls) == 2
+
+
+def test_backoff_honours_retry_after_up_to_the_cap(workflows_cli):
+    api = workflows_cli.N8nAPI(base_url="http://n8n.invalid/api/v1", backoff_base=1, backoff_max=4)
+    assert api._backoff(0, _Response(429, headers={"Retry-After": "3"})) == 3
+    assert api._backoff(0, _Response(429, headers={"Retry-After": "60"})) == 4
+
+
+def test_backoff_jitter_grows_exponentially_up_to_the_cap(workflows_cli):
+    api = workflows_cli.N8nAPI(base_url="http://n8n.invalid/api/v1", backoff_base=1, backoff_max=4)
+    for attempt, ceiling in [(0, 1), (1, 2), (2, 4), (5, 4)]:
+        delays = [api._backoff(attempt) for _ in range(200)]
+        assert all(0 <= delay <= ceiling for delay in delays)
+        assert max(delays) > ceiling / 2
+
+
+def test_requests_reuse_pooled_connections(workflows_cli, n8n_server):
+    server = n8n_server([simple_workflow("1")])
+    api = workflows_cli.N8nAPI(base_url=server.base_url)
+    try:
+        for _ in range(5):
+            api.get_workflow("1", refresh=True)
+        stats = api.connection_stats()
+    finally:
+        api.close()
+    assert stats == {"requests": 5, "connections_opened": 1, "connections_reused": 4, "retries": 0}
@@ -0,0 +1,48 @@
+"""Tests for how skipped node benchmarks are reported and recorded."""
+
+import sqlite3
+
+
+def _tester(nodes_cli, tmp_path):
+    (tmp_path / "openai_node").mkdir()
+    (tmp_path / "openai_node" / "package.json").write_text('{"name": "openai_node"}')
+    return nodes_cli.NodeTester(node_dir=str(tmp_path), build_cache_dir=None, ast_cache_dir=None)
+
+
+def test_missing_runtime_is_an_explicit_skip(nodes_cli, tmp_path, monkeypatch):
+    tester = _tester(nodes_cli, tmp_path)
+    monkeypatch.setattr(tester.toolchain, "resolve", lambda tool: None)
+    result = tester.run_performance_benchmark("openai_node")
+    assert result["skipped"] is True
+    assert result["success"] is True
+    assert result["results"] == {}
+    assert "Node.js runtime not found" in result["message"]
+
+
+def test_missing_compiled_module_is_an_explicit_skip(nodes_cli, tmp_path, monkeypatch):
+    tester = _tester(nodes_cli, tmp_path)
+    monkeypatch.setattr(tester.toolchain, "resolve", lambda tool: {"path": "/usr/bin/node", "version": "v20"})
+    result = tester.run_performance_benchmark("openai_node")
+    assert result["skipped"] is True
+    assert "no compiled node module" in result["message"]
+
+
+def _skipped_result():
+    return {"node": "openai_node", "success": True, "tests": {"performance_benchmark": {
+        "success": True, "skipped": True, "message": "Performance benchmark skipped: no compiled node module found",
+        "results": {},
+    }}}
+
+
+def test_skipped_benchmark_is_annotated_on_github(nodes_cli):
+    assert nodes_cli.github_annotations(_skipped_result()) == [
+        "::warning file=openai_node::performance_benchmark: "
+        "Performance benchmark skipped: no compiled node module found"
+    ]
+
+
+def test_skipped_benchmark_is_not_recorded(nodes_cli, tmp_path):
+    db_path = str(tmp_path / "benchmarks.db")
+    assert nodes_cli.record_benchmarks([_skipped_result()], db_path, check=True) == []
+    with sqlite3.connect(db_path) as connection:
+        assert connection.execute("SELECT COUNT(*) FROM measurements").fetchone() == (0,)
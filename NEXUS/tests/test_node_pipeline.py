@@ -0,0 +1,84 @@
+"""Tests for the parallel node test pipeline."""
+
+import pickle
+import time
+
+SOURCE = "export class OpenAi { description = { displayName: 'OpenAI', name: 'openAi', properties: [] }; }\n"
+
+
+def _node_dir(tmp_path, count=3):
+    tmp_path.mkdir(exist_ok=True)
+    for index in range(count):
+        node = tmp_path / f"node{index}_node"
+        node.mkdir()
+        (node / "package.json").write_text('{"name": "node%d", "version": "1.0.0"}' % index)
+        (node / "Node.node.ts").write_text(SOURCE + f"// {'padding ' * 2000}{index}\n")
+    return str(tmp_path)
+
+
+def _outcomes(results):
+    return {
+        result["node"]: {name: (test["success"], test.get("message")) for name, test in result["tests"].items()}
+        for result in results
+    }
+
+
+def test_pickled_tester_leaves_source_text_behind(nodes_cli, tmp_path):
+    tester = nodes_cli.NodeTester(node_dir=_node_dir(tmp_path), build_cache_dir=None, ast_cache_dir=None)
+    assert tester.source_index.ts_files("node0_node")[0].text is not None
+
+    data = pickle.dumps(tester)
+    assert b"padding padding" not in data
+    copy = pickle.loads(data)
+    assert copy.node_modules == tester.node_modules
+    assert copy.source_index.files("node0_node") == []
+
+    copy.source_index.refresh("node0_node")
+    assert [f.sha256 for f in copy.source_index.files("node0_node")] == [
+        f.sha256 for f in tester.source_index.files("node0_node")
+    ]
+
+
+def test_worker_processes_match_the_serial_run(nodes_cli, tmp_path, monkeypatch):
+    # Worker processes start logging to node_tests.log in the working directory
+    monkeypatch.chdir(tmp_path)
+    tester = nodes_cli.NodeTester(node_dir=_node_dir(tmp_path / "nodes"), build_cache_dir=None, ast_cache_dir=None)
+    serial = list(tester.iter_all_nodes(jobs=1))
+    parallel = list(tester.iter_all_nodes(jobs=2))
+    assert [result["node"] for result in parallel] == [result["node"] for result in serial]
+    assert _outcomes(parallel) == _outcomes(serial)
+
+
+def test_node_names_restrict_and_order_the_run(nodes_cli, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tester = nodes_cli.NodeTester(node_dir=_node_dir(tmp_path / "nodes"), build_cache_dir=None, ast_cache_dir=None)
+    results = tester.iter_all_nodes(jobs=1, node_names=["node2_node", "missing_node", "node0_node"])
+    assert [result["node"] for result in results] == ["node2_node", "node0_node"]
+
+
+def test_unordered_parallel_run_yields_every_node(nodes_cli, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    tester = nodes_cli.NodeTester(node_dir=_node_dir(tmp_path / "nodes"), build_cache_dir=None, ast_cache_dir=None)
+    results = list(tester.iter_all_nodes(jobs=2, ordered=False))
+    assert sorted(result["node"] for result in results) == ["node0_node", "node1_node", "node2_node"]
+
+
+def test_compilation_runs_alongside_the_static_checks(nodes_cli, tmp_path, monkeypatch):
+    tester = nodes_cli.NodeTester(node_dir=_node_dir(tmp_path, count=1), build_cache_dir=None, ast_cache_dir=None)
+
+    def stage(result, seconds=0.0):
+        def run(node_name):
+            time.sleep(seconds)
+            return dict(result) if isinstance(result, dict) else result
+        return run
+
+    monkeypatch.setattr(tester, "compile_node", stage(True, seconds=0.2))
+    monkeypatch.setattr(tester, "run_schema_validation", stage({"success": True}, seconds=0.2))
+    for name in ("validate_credentials", "run_unit_tests", "run_performance_benchmark"):
+        monkeypatch.setattr(tester, name, stage({"success": True}))
+
+    result = tester.test_node("node0_node")
+    assert result["success"] is True
+    assert result["tests"]["compilation"]["duration"] >= 0.2
+    assert result["tests"]["schema_validation"]["duration"] >= 0.2
+    assert result["duration"] < 0.35
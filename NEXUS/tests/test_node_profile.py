@@ -0,0 +1,81 @@
+"""Tests for per-node timings and queue-wait attribution."""
+
+import pytest
+
+from node_profile import LatencyProfiler, node_timings
+
+
+def _run(start, duration, previous=None, items=1):
+    run = {"startTime": start, "executionTime": duration, "data": {"main": [[{}] * items]}}
+    if previous:
+        run["source"] = [{"previousNode": previous}]
+    return run
+
+
+def _execution(run_data, started_at=1_000):
+    return {"startedAt": started_at, "data": {"resultData": {"runData": run_data}}}
+
+
+def _by_node(timings):
+    return {timing.node: timing for timing in timings}
+
+
+def test_queue_wait_is_measured_from_the_predecessor_finishing():
+    timings = _by_node(node_timings(_execution({
+        "Trigger": [_run(1_000, 5)],
+        "OpenAI": [_run(1_025, 300, previous="Trigger", items=3)],
+    })))
+    assert timings["OpenAI"].start == 25
+    assert timings["OpenAI"].queue_wait == 20  # ready at 1005, started at 1025
+    assert timings["OpenAI"].run_time == 300
+    assert timings["OpenAI"].items == 3
+
+
+def test_ready_time_is_the_last_of_several_predecessors():
+    timings = _by_node(node_timings(_execution({
+        "Trigger": [_run(1_000, 0)],
+        "Fast": [_run(1_000, 10, previous="Trigger")],
+        "Slow": [_run(1_000, 100, previous="Trigger")],
+        "Merge": [{**_run(1_130, 5), "source": [{"previousNode": "Fast"}, {"previousNode": "Slow"}]}],
+    })))
+    assert timings["Merge"].queue_wait == 30  # waits on Slow (done at 1100), not Fast
+
+
+def test_workflow_connections_are_used_without_source_entries():
+    workflow = {
+        "nodes": [{"name": "Trigger", "type": "n8n-nodes-base.webhook"},
+                  {"name": "Unrelated", "type": "n8n-nodes-base.set"},
+                  {"name": "OpenAI", "type": "nexus-nodes.openai"}],
+        "connections": {"Trigger": {"main": [[{"node": "OpenAI", "type": "main", "index": 0}]]}},
+    }
+    timings = _by_node(node_timings(_execution({
+        "Trigger": [_run(1_000, 10)],
+        "Unrelated": [_run(1_010, 40)],
+        "OpenAI": [_run(1_060, 100)],
+    }), workflow))
+    assert timings["OpenAI"].queue_wait == 50  # from Trigger at 1010, ignoring Unrelated
+
+
+def test_first_node_waits_from_the_execution_start():
+    timings = node_timings(_execution({"Trigger": [_run(1_015, 1)]}, started_at=1_000))
+    assert timings[0].start == 15
+    assert timings[0].queue_wait == 15
+
+
+def test_iso_timestamps_and_missing_run_data():
+    execution = {"startedAt": "2024-05-01T10:00:00.000Z", "data": {"resultData": {"runData": {
+        "Trigger": [_run("2024-05-01T10:00:00.250Z", 50)],
+    }}}}
+    assert node_timings(execution)[0].queue_wait == pytest.approx(250)
+    assert node_timings({"data": {}}) == []
+
+
+def test_profiler_aggregates_percentiles_across_executions():
+    profiler = LatencyProfiler()
+    for wait in (10, 20, 30, 40):
+        profiler.add("wf", _execution({
+            "Trigger": [_run(1_000, 0)],
+            "OpenAI": [_run(1_000 + wait, 100, previous="Trigger")],
+        }))
+    entry = next(entry for entry in profiler.profile("wf") if entry["node"] == "OpenAI")
+    assert entry["queue_wait_p50"] == 20
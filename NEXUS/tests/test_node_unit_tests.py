@@ -0,0 +1,84 @@
+"""Tests for out-of-process node unit test runs and their JUnit summaries."""
+
+import os
+
+JUNIT = """<?xml version="1.0" encoding="utf-8"?>
+<testsuites><testsuite name="pytest">
+  <testcase classname="test_a" name="test_ok" time="0.25"/>
+  <testcase classname="test_a" name="test_broken" time="0.5"><failure message="assert 1 == 2"/></testcase>
+  <testcase classname="test_b" name="test_setup" time="0"><error message="fixture missing"/></testcase>
+  <testcase classname="test_b" name="test_later" time="0"><skipped message="not yet"/></testcase>
+</testsuite></testsuites>
+"""
+
+
+def _node(tmp_path, modules):
+    test_dir = tmp_path / "nodes" / "openai_node" / "test"
+    test_dir.mkdir(parents=True)
+    for name, source in modules.items():
+        (test_dir / name).write_text(source)
+    return str(tmp_path / "nodes")
+
+
+def _tester(nodes_cli, tmp_path, monkeypatch, modules, workers=1):
+    monkeypatch.setattr(nodes_cli, "TEST_RESULTS_DIR", str(tmp_path / "test-results"))
+    return nodes_cli.NodeTester(
+        node_dir=_node(tmp_path, modules), build_cache_dir=None, test_workers=workers, ast_cache_dir=None
+    )
+
+
+def test_junit_report_is_summarized(nodes_cli, tmp_path):
+    path = tmp_path / "report.xml"
+    path.write_text(JUNIT)
+    summary = nodes_cli.NodeTester._parse_junit(str(path))
+    assert (summary["tests"], summary["failures"], summary["errors"], summary["skipped"]) == (4, 1, 1, 1)
+    assert summary["failed_tests"] == ["test_a::test_broken", "test_b::test_setup"]
+    assert summary["timings"]["test_a::test_broken"] == 0.5
+
+
+def test_missing_junit_report_is_empty(nodes_cli, tmp_path):
+    summary = nodes_cli.NodeTester._parse_junit(str(tmp_path / "missing.xml"))
+    assert summary["tests"] == 0 and summary["failed_tests"] == []
+
+
+def test_passing_suite(nodes_cli, tmp_path, monkeypatch):
+    modules = {"test_math.py": "import pytest\n\ndef test_add():\n    assert 1 + 1 == 2\n\n"
+                               "@pytest.mark.skip\ndef test_later():\n    pass\n"}
+    tester = _tester(nodes_cli, tmp_path, monkeypatch, modules)
+    result = tester.run_unit_tests("openai_node")
+    assert result["success"] is True
+    assert result["results"]["tests"] == 2
+    assert result["results"]["skipped"] == 1
+    assert result["results"]["workers"] == 1
+
+
+def test_failures_across_shards_are_merged(nodes_cli, tmp_path, monkeypatch):
+    modules = {
+        "test_a.py": "def test_ok():\n    pass\n",
+        "test_b.py": "def test_broken():\n    assert 1 == 2\n",
+        "test_c.py": "def test_also_ok():\n    pass\n",
+    }
+    tester = _tester(nodes_cli, tmp_path, monkeypatch, modules, workers=2)
+    result = tester.run_unit_tests("openai_node")
+    assert result["success"] is False
+    assert result["results"]["workers"] == 2
+    assert result["results"]["tests"] == 3
+    assert result["results"]["failed_tests"] == ["test.test_b::test_broken"]
+    assert len(list((tmp_path / "test-results").glob("openai_node.*.xml"))) == 2
+
+
+def test_shards_are_balanced_by_size(nodes_cli, tmp_path, monkeypatch):
+    modules = {"test_big.py": "#" * 300, "test_mid.py": "#" * 200, "test_small.py": "#" * 100}
+    tester = _tester(nodes_cli, tmp_path, monkeypatch, modules, workers=2)
+    test_files = tester._collect_test_files(str(tmp_path / "nodes" / "openai_node" / "test"))
+    shards = tester._split_test_files(test_files, 2)
+    assert [[os.path.basename(path) for path in shard] for shard in shards] == [
+        ["test_big.py"], ["test_mid.py", "test_small.py"]
+    ]
+
+
+def test_missing_test_directory(nodes_cli, tmp_path, monkeypatch):
+    tester = _tester(nodes_cli, tmp_path, monkeypatch, {})
+    (tmp_path / "nodes" / "openai_node" / "test").rmdir()
+    result = tester.run_unit_tests("openai_node")
+    assert result == {"success": False, "message": "No tests found", "results": {}}
@@ -0,0 +1,71 @@
+"""Tests for bounded node output capture and the blob store."""
+
+import base64
+
+import pytest
+
+from output_capture import BlobStore, OutputCapture
+
+
+def _output(text, binary=None):
+    item = {"json": {"text": text}}
+    if binary is not None:
+        item["binary"] = {"file": {"mimeType": "application/pdf", "data": base64.b64encode(binary).decode()}}
+    return [[item]]
+
+
+def test_small_outputs_stay_inline():
+    output = _output("short")
+    assert OutputCapture("full", limit=1024).capture(output) == output
+    assert OutputCapture("truncated", limit=1024).capture(output) == output
+
+
+def test_truncated_replaces_binary_data_with_its_digest():
+    captured = OutputCapture("truncated", limit=1 << 20).capture(_output("doc", binary=b"%PDF" * 100))
+    data = captured[0][0]["binary"]["file"]["data"]
+    assert set(data) == {"size", "sha256"}
+    assert captured[0][0]["binary"]["file"]["mimeType"] == "application/pdf"
+
+
+def test_large_output_is_truncated_to_the_limit():
+    captured = OutputCapture("truncated", limit=100).capture(_output("x" * 1000))
+    assert captured["truncated"] is True
+    assert len(captured["preview"]) == 100
+    assert captured["items"] == 1
+    assert captured["size"] > 1000
+
+
+def test_digest_keeps_no_content():
+    captured = OutputCapture("digest").capture(_output("secret"))
+    assert set(captured) == {"size", "items", "sha256"}
+
+
+def test_large_output_spills_to_the_blob_store(tmp_path):
+    store = BlobStore(str(tmp_path / "blobs"))
+    capture = OutputCapture("full", limit=100, blob_store=store)
+    output = _output("y" * 1000)
+    captured = capture.capture(output)
+    assert capture.spilled == 1
+    assert store.get(captured["blob"]) == output
+    # Identical outputs are stored once
+    assert capture.capture(output)["blob"] == captured["blob"]
+    assert len(list((tmp_path / "blobs").rglob("*.json.gz"))) == 1
+
+
+def test_full_keeps_large_output_without_a_blob_store():
+    output = _output("z" * 1000)
+    assert OutputCapture("full", limit=100).capture(output) == output
+
+
+def test_blob_directory_is_only_created_on_first_spill(tmp_path):
+    directory = tmp_path / "test-results" / "blobs"
+    capture = OutputCapture("truncated", limit=1024, blob_store=BlobStore(str(directory)))
+    capture.capture(_output("small"))
+    assert not directory.exists()
+    capture.capture(_output("w" * 2000))
+    assert directory.exists()
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError):
+        OutputCapture("everything")
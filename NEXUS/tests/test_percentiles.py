@@ -0,0 +1,48 @@
+"""Tests for the shared nearest-rank percentile helper."""
+
+import math
+
+import pytest
+
+from percentiles import nearest_rank, percentile
+
+
+@pytest.mark.parametrize("count", [1, 2, 7, 10, 50, 99, 100, 1000])
+@pytest.mark.parametrize("pct", [1, 25, 50, 90, 95, 99, 100])
+def test_nearest_rank_matches_ceil(pct, count):
+    assert nearest_rank(pct, count) == max(1, math.ceil(pct / 100 * count))
+
+
+def test_percentile_is_not_off_by_one():
+    values = list(range(1, 51))
+    assert percentile(values, 50) == 25
+    hundred = list(range(1, 101))
+    assert percentile(hundred, 99) == 99
+    assert percentile(hundred, 100) == 100
+
+
+def test_percentile_edge_cases():
+    assert percentile([], 50) == 0.0
+    assert percentile([], 100) == 0.0
+    assert percentile([7.5], 0) == 7.5
+    assert percentile([7.5], 1) == 7.5
+    assert percentile([7.5], 100) == 7.5
+
+
+def test_p0_and_p100_are_the_extremes():
+    values = [42, 3, 17, 8, 99, 23]
+    assert percentile(values, 0) == 3
+    assert percentile(values, 100) == 99
+
+
+def test_even_length_median_is_the_lower_middle_sample():
+    # Nearest rank never interpolates: rank ceil(0.5 * 4) = 2
+    assert percentile([4, 1, 3, 2], 50) == 2
+    assert percentile([10, 20], 50) == 10
+    assert percentile([10, 20], 51) == 20
+
+
+def test_node_benchmark_percentiles_use_nearest_rank(nodes_cli):
+    latencies = [float(value) for value in range(1, 21)]
+    assert nodes_cli.percentile(latencies, 95) == 19.0
+    assert nodes_cli.percentile(latencies, 99) == 20.0
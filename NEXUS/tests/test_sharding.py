@@ -0,0 +1,57 @@
+"""Tests for shard specifications and duration-balanced shard assignment."""
+
+import argparse
+import json
+
+import pytest
+
+from sharding import assign_shards, estimate_durations, load_report, parse_shard, select_shard
+
+
+@pytest.mark.parametrize("value, expected", [("1/1", (1, 1)), ("2/4", (2, 4)), ("4/4", (4, 4))])
+def test_parse_shard_accepts_valid_specs(value, expected):
+    assert parse_shard(value) == expected
+
+
+@pytest.mark.parametrize("value", ["0/4", "5/4", "1/0", "1", "a/b", "1/2/3"])
+def test_parse_shard_rejects_invalid_specs(value):
+    with pytest.raises(argparse.ArgumentTypeError):
+        parse_shard(value)
+
+
+def test_lpt_balances_expected_durations():
+    history = {"a": 6.0, "b": 5.0, "c": 4.0, "d": 3.0, "e": 2.0, "f": 1.0}
+    shards = assign_shards(history, 3, history)
+    assert [sum(history[item] for item in shard) for shard in shards] == [7.0, 7.0, 7.0]
+    assert shards == [["a", "f"], ["b", "e"], ["c", "d"]]
+
+
+def test_longest_item_goes_first_into_its_shard():
+    history = {"slow": 60.0, "x": 1.0, "y": 1.0, "z": 1.0}
+    shards = assign_shards(history, 2, history)
+    assert ["slow"] in shards
+    assert sorted(next(shard for shard in shards if shard != ["slow"])) == ["x", "y", "z"]
+
+
+def test_assignment_ignores_listing_order():
+    items = [f"workflow-{i}" for i in range(20)]
+    history = {item: float(i % 7 + 1) for i, item in enumerate(items)}
+    assert assign_shards(items, 3, history) == assign_shards(list(reversed(items)), 3, history)
+
+
+def test_select_shard_partitions_items():
+    items = [f"node-{i}" for i in range(11)]
+    selected = [select_shard(items, (index, 3), {}) for index in range(1, 4)]
+    assert sorted(item for shard in selected for item in shard) == sorted(items)
+    assert max(len(shard) for shard in selected) - min(len(shard) for shard in selected) <= 1
+
+
+def test_unknown_items_are_estimated_at_the_median():
+    estimates = estimate_durations(["a", "b", "c", "new"], {"a": 1.0, "b": 3.0, "c": 10.0})
+    assert estimates["new"] == 3.0
+
+
+def test_load_report_reads_plain_json(tmp_path):
+    path = tmp_path / "shard-1.json"
+    path.write_text(json.dumps({"results": [{"workflow_id": "w1"}]}))
+    assert load_report(str(path)) == {"results": [{"workflow_id": "w1"}]}
@@ -0,0 +1,74 @@
+"""Tests for the single-pass node source index."""
+
+import os
+
+NODE_SOURCE = """import { INodeType } from 'n8n-workflow';
+export class OpenAi implements INodeType {
+    description = { properties: [], credentials: [] };
+    async execute() { const c = await this.getCredentials('openAiApi'); }
+}
+"""
+
+
+def _index(nodes_cli, tmp_path):
+    node = tmp_path / "openai_node"
+    (node / "nested").mkdir(parents=True)
+    (node / "node_modules" / "dep").mkdir(parents=True)
+    (node / "OpenAi.node.ts").write_text(NODE_SOURCE)
+    (node / "helpers.ts").write_text("export const x = 1;\n")
+    (node / "nested" / "Options.ts").write_text("export const options = { properties: [] };\n")
+    (node / "node_modules" / "dep" / "index.ts").write_text(NODE_SOURCE)
+    (node / "package.json").write_text('{"name": "openai_node"}')
+    (node / "README.md").write_text("not a build input")
+    return nodes_cli.SourceIndex(str(tmp_path)).build(), node
+
+
+def test_all_rules_are_matched_in_one_pass(nodes_cli, tmp_path):
+    index, node = _index(nodes_cli, tmp_path)
+    main = next(f for f in index.files("openai_node") if f.path.name == "OpenAi.node.ts")
+    assert main.rules == set(nodes_cli.STATIC_RULES)
+    assert main.text == NODE_SOURCE
+
+
+def test_overlapping_snippets_each_match_their_rule(nodes_cli, tmp_path):
+    index = nodes_cli.SourceIndex(str(tmp_path), rules={"outer": ("async execute(",), "inner": ("execute(",)})
+    assert index._scan("async execute() {}") == {"outer", "inner"}
+
+
+def test_only_build_inputs_outside_skipped_directories_are_indexed(nodes_cli, tmp_path):
+    index, node = _index(nodes_cli, tmp_path)
+    indexed = sorted(str(f.path.relative_to(node)) for f in index.files("openai_node"))
+    assert indexed == ["OpenAi.node.ts", "helpers.ts", os.path.join("nested", "Options.ts"), "package.json"]
+    package = next(f for f in index.files("openai_node") if f.path.name == "package.json")
+    assert package.text is None and package.rules == set()
+
+
+def test_top_level_lookups(nodes_cli, tmp_path):
+    index, node = _index(nodes_cli, tmp_path)
+    assert sorted(f.path.name for f in index.ts_files("openai_node")) == ["OpenAi.node.ts", "helpers.ts"]
+    assert index.has_file("openai_node", "package.json")
+    assert not index.has_file("openai_node", "Options.ts")
+    assert index.files("unknown_node") == []
+
+
+def test_refresh_only_rereads_changed_files(nodes_cli, tmp_path):
+    index, node = _index(nodes_cli, tmp_path)
+    before = {f.path.name: f for f in index.files("openai_node")}
+    (node / "helpers.ts").write_text("export const x = 2; // changed size\n")
+    (node / "added.ts").write_text("export const y = 1;\n")
+    index.refresh("openai_node")
+
+    after = {f.path.name: f for f in index.files("openai_node")}
+    assert after["OpenAi.node.ts"] is before["OpenAi.node.ts"]
+    assert after["helpers.ts"] is not before["helpers.ts"]
+    assert after["helpers.ts"].sha256 != before["helpers.ts"].sha256
+    assert "added.ts" in after
+
+
+def test_tester_discovers_nodes_from_the_index(nodes_cli, tmp_path):
+    _index(nodes_cli, tmp_path)
+    (tmp_path / "empty_dir").mkdir()
+    (tmp_path / "package_only").mkdir()
+    (tmp_path / "package_only" / "package.json").write_text("{}")
+    tester = nodes_cli.NodeTester(node_dir=str(tmp_path), build_cache_dir=None, ast_cache_dir=None)
+    assert tester.node_modules == ["openai_node", "package_only"]
@@ -0,0 +1,49 @@
+"""Tests for the CLI startup import check."""
+
+import sys
+
+import pytest
+
+import startup_benchmark
+from startup_benchmark import SCRIPTS, measure
+
+
+def _script(tmp_path, source):
+    path = tmp_path / "cli.py"
+    path.write_text(source)
+    return str(path)
+
+
+def test_import_times_are_read_from_importtime_output():
+    times, wall_time = startup_benchmark._import_times(["-c", "import json"])
+    assert times["json"] > 0
+    assert wall_time > 0
+
+
+def test_eager_heavy_import_is_reported(tmp_path):
+    result = measure(_script(tmp_path, "import asyncio\nimport argparse\n"), repeat=1)
+    assert result["lazy_violations"] == ["asyncio"]
+    assert "asyncio" in result["imports"]
+    # Modules the bare interpreter already imports are not charged to the script
+    assert "encodings" not in result["imports"]
+
+
+def test_lazy_import_is_not_reported(tmp_path):
+    source = "import sys\nif '--help' not in sys.argv:\n    import asyncio\n"
+    assert measure(_script(tmp_path, source), repeat=1)["lazy_violations"] == []
+
+
+@pytest.mark.parametrize("script", SCRIPTS, ids=lambda path: path.rsplit("/", 1)[-1])
+def test_clis_defer_heavy_imports(script):
+    result = measure(script, repeat=1)
+    assert result["lazy_violations"] == []
+    assert result["imports"]
+
+
+def test_exceeding_the_budget_fails(tmp_path, monkeypatch, capsys):
+    script = _script(tmp_path, "import json\n")
+    monkeypatch.setattr(sys, "argv", ["startup_benchmark.py", script, "--budget-ms", "0", "--repeat", "1"])
+    with pytest.raises(SystemExit) as exit_info:
+        startup_benchmark.main()
+    assert exit_info.value.code == 1
+    assert "❌ cli.py" in capsys.readouterr().out
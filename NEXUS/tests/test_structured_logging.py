@@ -0,0 +1,107 @@
+"""Tests for the queued structured logging pipeline."""
+
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+
+from conftest import NEXUS_DIR, simple_workflow
+from structured_logging import DebugRateLimiter, StructuredQueueHandler
+
+
+def _record(level=logging.DEBUG, lineno=10, msg="message"):
+    return logging.LogRecord("nexus-test", level, "/src/module.py", lineno, msg, None, None)
+
+
+def test_debug_records_are_rate_limited_per_call_site():
+    limiter = DebugRateLimiter(rate=2, sample=1)
+    assert [limiter.filter(_record()) for _ in range(3)] == [True, True, False]
+    # Another call site has its own budget
+    assert limiter.filter(_record(lineno=20))
+    assert limiter.suppressed == 1
+
+
+def test_records_above_debug_are_never_limited():
+    limiter = DebugRateLimiter(rate=1, sample=0)
+    assert all(limiter.filter(_record(level=logging.INFO)) for _ in range(5))
+    assert limiter.suppressed == 0
+
+
+def test_debug_sampling_and_unlimited_rate():
+    assert not DebugRateLimiter(rate=0, sample=0).filter(_record())
+    unlimited = DebugRateLimiter(rate=0, sample=1)
+    assert all(unlimited.filter(_record()) for _ in range(100))
+
+
+def test_full_queue_drops_records_instead_of_blocking():
+    handler = StructuredQueueHandler(queue.Queue(1))
+    for _ in range(3):
+        handler.emit(_record(level=logging.INFO))
+    assert handler.queue.qsize() == 1
+    assert handler.dropped == 2
+
+
+LOGGING_SCRIPT = """
+import logging, sys
+sys.path.insert(0, {nexus_dir!r})
+from structured_logging import log_context, start_logging, stop_logging
+start_logging("run.log", console=sys.argv[1])
+with log_context(workflow_id="42"):
+    logging.getLogger("nexus-test").info("testing workflow")
+print("report")
+stop_logging()
+"""
+
+
+def _run_logging(tmp_path, console, **env):
+    environment = {key: value for key, value in os.environ.items() if key not in ("LOG_CONSOLE", "NEXUS_RUN_ID")}
+    environment.update(env)
+    return subprocess.run(
+        [sys.executable, "-c", LOGGING_SCRIPT.format(nexus_dir=NEXUS_DIR), console],
+        cwd=tmp_path, env=environment, capture_output=True, text=True, timeout=30
+    )
+
+
+def test_stderr_console_keeps_stdout_for_the_report(tmp_path):
+    result = _run_logging(tmp_path, "stderr")
+    assert result.stdout == "report\n"
+    assert "testing workflow" in result.stderr
+
+
+def test_text_console_logs_to_stdout(tmp_path):
+    result = _run_logging(tmp_path, "stdout")
+    assert "testing workflow" in result.stdout
+    assert result.stderr == ""
+
+
+def test_log_console_environment_overrides_the_caller(tmp_path):
+    result = _run_logging(tmp_path, "stdout", LOG_CONSOLE="stderr")
+    assert result.stdout == "report\n"
+
+
+def test_log_file_has_one_json_record_per_line_with_context(tmp_path):
+    _run_logging(tmp_path, "stderr", NEXUS_RUN_ID="run123")
+    entries = [json.loads(line) for line in (tmp_path / "run.log").read_text().splitlines()]
+    assert len(entries) == 1
+    assert entries[0]["message"] == "testing workflow"
+    assert entries[0]["workflow_id"] == "42"
+    assert entries[0]["run_id"] == "run123"
+
+
+def test_workflow_cli_json_report_is_the_only_stdout(tmp_path):
+    workflows_dir = tmp_path / "workflows"
+    workflows_dir.mkdir()
+    (workflows_dir / "w1-workflow.json").write_text(json.dumps(simple_workflow("1")))
+    environment = {key: value for key, value in os.environ.items() if key != "LOG_CONSOLE"}
+
+    result = subprocess.run(
+        [sys.executable, os.path.join(NEXUS_DIR, "test-workflows-file.py"), "--all", "--format", "json",
+         "--mock-server", "--workflows-dir", str(workflows_dir)],
+        cwd=tmp_path, env=environment, capture_output=True, text=True, timeout=60
+    )
+    assert result.returncode == 0, result.stderr
+    report = json.loads(result.stdout)
+    assert report["summary"]["passed"] == 1
+    assert "n8n API connection stats" in result.stderr
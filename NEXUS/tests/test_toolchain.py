@@ -0,0 +1,69 @@
+"""Tests for memoized build tool discovery."""
+
+import pickle
+import sys
+
+FAKE_TOOL = """#!{python}
+import os, sys
+with open(os.environ["FAKE_TOOL_LOG"], "a") as log:
+    log.write(" ".join(sys.argv[1:]) + "\\n")
+print("v20.11.1")
+"""
+
+
+def _fake_path(tmp_path, monkeypatch):
+    """PATH holding only a fake node binary; returns a function listing its invocations."""
+    bin_dir = tmp_path / "bin"
+    bin_dir.mkdir()
+    tool = bin_dir / "node"
+    tool.write_text(FAKE_TOOL.format(python=sys.executable))
+    tool.chmod(0o755)
+    log = tmp_path / "tool.log"
+    monkeypatch.setenv("PATH", str(bin_dir))
+    monkeypatch.setenv("FAKE_TOOL_LOG", str(log))
+    return lambda: log.read_text().splitlines() if log.exists() else []
+
+
+def test_installed_tool_is_resolved_with_its_version(nodes_cli, tmp_path, monkeypatch):
+    invocations = _fake_path(tmp_path, monkeypatch)
+    toolchain = nodes_cli.Toolchain()
+    assert toolchain.resolve("node") == {"path": str(tmp_path / "bin" / "node"), "version": "v20.11.1"}
+    assert invocations() == ["--version"]
+
+
+def test_each_tool_is_probed_once(nodes_cli, tmp_path, monkeypatch):
+    invocations = _fake_path(tmp_path, monkeypatch)
+    toolchain = nodes_cli.Toolchain()
+    for _ in range(3):
+        toolchain.resolve("node")
+    assert invocations() == ["--version"]
+
+
+def test_missing_tool_is_remembered(nodes_cli, tmp_path, monkeypatch):
+    _fake_path(tmp_path, monkeypatch)
+    lookups = []
+    monkeypatch.setattr(nodes_cli.shutil, "which", lambda command: lookups.append(command))
+    toolchain = nodes_cli.Toolchain()
+    assert toolchain.resolve("tsc") is None
+    assert toolchain.resolve("tsc") is None
+    assert lookups == ["tsc"]
+
+
+def test_probe_resolves_every_known_tool(nodes_cli, tmp_path, monkeypatch):
+    _fake_path(tmp_path, monkeypatch)
+    toolchain = nodes_cli.Toolchain(tools=("n8n-node-dev", "tsc", "node"))
+    probed = toolchain.probe()
+    assert list(probed) == ["n8n-node-dev", "tsc", "node"]
+    assert probed["n8n-node-dev"] is None and probed["tsc"] is None
+    assert probed["node"]["version"] == "v20.11.1"
+
+
+def test_resolved_tools_travel_with_the_tester(nodes_cli, tmp_path, monkeypatch):
+    invocations = _fake_path(tmp_path, monkeypatch)
+    tester = nodes_cli.NodeTester(node_dir=str(tmp_path), build_cache_dir=None, ast_cache_dir=None)
+    assert tester._check_command_exists("node")
+    assert not tester._check_command_exists("tsc")
+
+    copy = pickle.loads(pickle.dumps(tester))
+    assert copy._get_command_version("node") == "v20.11.1"
+    assert invocations() == ["--version"]
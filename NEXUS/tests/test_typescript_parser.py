@@ -0,0 +1,105 @@
+"""Tests for AST schema validation and its fallback to text rules."""
+
+import json
+import pickle
+import shutil
+
+import pytest
+
+NODE_SOURCE = """import { INodeType } from 'n8n-workflow';
+export class OpenAi implements INodeType {
+    description = { displayName: 'OpenAI', properties: [] };
+    async execute() { return []; }
+}
+"""
+
+
+def _tester(nodes_cli, tmp_path, ast_cache_dir=None):
+    node = tmp_path / "nodes" / "openai_node"
+    node.mkdir(parents=True)
+    (node / "OpenAi.node.ts").write_text(NODE_SOURCE)
+    return nodes_cli.NodeTester(node_dir=str(tmp_path / "nodes"), build_cache_dir=None, ast_cache_dir=ast_cache_dir)
+
+
+def _source(tester):
+    return tester.source_index.ts_files("openai_node")[0]
+
+
+def test_text_rules_are_used_without_a_node_runtime(nodes_cli, tmp_path, monkeypatch):
+    tester = _tester(nodes_cli, tmp_path)
+    monkeypatch.setattr(tester.toolchain, "resolve", lambda tool: None)
+    result = tester.run_schema_validation("openai_node")
+    assert result["success"] is True
+    assert result["results"]["parser"] == "text"
+
+
+@pytest.mark.skipif(shutil.which("node") is None, reason="Node.js runtime not installed")
+def test_text_rules_are_used_without_the_typescript_package(nodes_cli, tmp_path, monkeypatch):
+    # The worker looks for typescript in the node, its parent directory and the working directory
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("NODE_PATH", raising=False)
+    tester = _tester(nodes_cli, tmp_path)
+    try:
+        result = tester.run_schema_validation("openai_node")
+        assert result["results"]["parser"] == "text"
+        assert result["success"] is True
+        # The missing compiler is remembered, so the worker is not asked again
+        assert len(tester.parser._unavailable) == 1
+        requests_sent = tester.parser._next_id
+        tester.run_schema_validation("openai_node")
+        assert tester.parser._next_id == requests_sent
+    finally:
+        tester.parser.close()
+
+
+def test_text_rules_report_a_missing_execute_method(nodes_cli, tmp_path, monkeypatch):
+    tester = _tester(nodes_cli, tmp_path)
+    (tmp_path / "nodes" / "openai_node" / "OpenAi.node.ts").write_text(NODE_SOURCE.replace("async execute", "run"))
+    tester.source_index.refresh("openai_node")
+    monkeypatch.setattr(tester.toolchain, "resolve", lambda tool: None)
+    result = tester.run_schema_validation("openai_node")
+    assert result["success"] is False
+    assert result["results"]["has_execute_method"] is False
+
+
+def test_cached_facts_are_used_without_starting_the_worker(nodes_cli, tmp_path):
+    tester = _tester(nodes_cli, tmp_path, ast_cache_dir=str(tmp_path / "ast"))
+    source = _source(tester)
+    facts = {"imports": {}, "variables": {}, "classes": []}
+    with open(tester.parser._cache_path(source.sha256), "w") as f:
+        json.dump(facts, f)
+
+    assert tester.parser.parse(source, "/nonexistent/node", []) == facts
+    assert tester.parser._process is None and tester.parser._next_id == 0
+
+
+def test_structure_is_validated_from_parsed_facts(nodes_cli, tmp_path, monkeypatch):
+    tester = _tester(nodes_cli, tmp_path)
+    source = _source(tester)
+    tester.parser._memory[source.sha256] = {
+        "imports": {},
+        "variables": {},
+        "classes": [{
+            "name": "OpenAi",
+            "implements": ["INodeType"],
+            "description": {"kind": "object", "keys": ["displayName"], "spreads": []},
+            "methods": ["execute"],
+        }],
+    }
+    monkeypatch.setattr(tester.toolchain, "resolve", lambda tool: {"path": "/nonexistent/node", "version": None})
+    result = tester.run_schema_validation("openai_node")
+    assert result["results"]["parser"] == "typescript"
+    assert result["results"]["node_class"] == "OpenAi"
+    # The description object has no properties key, which the text rules would not notice
+    assert result["success"] is False
+    assert result["results"]["has_properties"] is False
+
+
+def test_pickled_parser_starts_its_own_worker(nodes_cli, tmp_path):
+    tester = _tester(nodes_cli, tmp_path)
+    tester.parser._memory["abc"] = {"classes": []}
+    copy = pickle.loads(pickle.dumps(tester.parser))
+    assert copy._process is None
+    assert copy._memory == {"abc": {"classes": []}}
+    with copy._lock:
+        pass
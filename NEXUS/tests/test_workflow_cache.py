@@ -0,0 +1,66 @@
+"""Tests for the workflow definition cache."""
+
+from conftest import simple_workflow
+
+
+def _workflow(workflow_id="1", version="v1"):
+    return {"id": workflow_id, "updatedAt": version, "nodes": []}
+
+
+def test_put_then_get_is_a_hit(workflows_cli):
+    cache = workflows_cli.WorkflowCache(cache_dir=None)
+    assert cache.get("1") is None
+    cache.put(_workflow())
+    assert cache.get(1) == _workflow()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_expire_after_the_ttl(workflows_cli):
+    cache = workflows_cli.WorkflowCache(ttl=0, cache_dir=None)
+    cache.put(_workflow())
+    assert cache.get("1") is None
+
+
+def test_newer_listed_version_invalidates_the_entry(workflows_cli):
+    cache = workflows_cli.WorkflowCache(cache_dir=None)
+    cache.put(_workflow(version="v1"))
+    cache.seed([{"id": "1", "updatedAt": "v2"}])
+    assert cache.get("1") is None
+    cache.put(_workflow(version="v2"))
+    assert cache.get("1")["updatedAt"] == "v2"
+
+
+def test_least_recently_used_entry_is_evicted(workflows_cli):
+    cache = workflows_cli.WorkflowCache(max_entries=2, cache_dir=None)
+    cache.put(_workflow("1"))
+    cache.put(_workflow("2"))
+    cache.get("1")
+    cache.put(_workflow("3"))
+    assert cache.get("2") is None
+    assert cache.get("1") is not None and cache.get("3") is not None
+
+
+def test_disk_entries_are_reused_only_once_their_version_is_confirmed(workflows_cli, tmp_path):
+    workflows_cli.WorkflowCache(cache_dir=str(tmp_path)).put(_workflow(version="v1"))
+
+    later_run = workflows_cli.WorkflowCache(cache_dir=str(tmp_path))
+    assert later_run.get("1") is None
+    later_run.seed([{"id": "1", "updatedAt": "v1"}])
+    assert later_run.get("1") == _workflow(version="v1")
+
+    changed_run = workflows_cli.WorkflowCache(cache_dir=str(tmp_path))
+    changed_run.seed([{"id": "1", "updatedAt": "v2"}])
+    assert changed_run.get("1") is None
+
+
+def test_listed_definitions_are_not_fetched_again(workflows_cli, n8n_server):
+    server = n8n_server([simple_workflow(str(i)) for i in range(1, 4)])
+    api = workflows_cli.N8nAPI(base_url=server.base_url, workflow_cache=workflows_cli.WorkflowCache(cache_dir=None))
+    tester = workflows_cli.WorkflowTester(api=api, analyze=False)
+    try:
+        results = tester.test_all_workflows()
+    finally:
+        api.close()
+    assert all(result.success for result in results)
+    assert api.workflow_cache.misses == 0
+    assert api.workflow_cache.hits == 3
@@ -0,0 +1,103 @@
+"""Tests for workflow graph critical-path analysis."""
+
+import pytest
+
+from workflow_graph import analyze_workflow
+
+
+def _connect(*targets, output=0):
+    outputs = [[] for _ in range(output + 1)]
+    outputs[output] = [{"node": target, "type": "main", "index": 0} for target in targets]
+    return {"main": outputs}
+
+
+def _node(name, node_type, **parameters):
+    return {"name": name, "type": node_type, "parameters": parameters}
+
+
+def test_critical_path_follows_the_slowest_branch():
+    workflow = {
+        "id": "fanout",
+        "nodes": [
+            _node("Trigger", "n8n-nodes-base.webhook"),
+            _node("Fetch", "n8n-nodes-base.httpRequest"),
+            _node("Summarize", "nexus-nodes.openai"),
+            _node("Notify", "n8n-nodes-base.slack"),
+        ],
+        "connections": {
+            "Trigger": _connect("Fetch", "Notify"),
+            "Fetch": _connect("Summarize"),
+        },
+    }
+    history = {"Trigger": 0, "Fetch": 200, "Summarize": 1500, "Notify": 300}
+    analysis = analyze_workflow(workflow, history)
+    assert analysis.critical_path == ["Trigger", "Fetch", "Summarize"]
+    assert analysis.critical_path_latency == 1700
+    assert analysis.estimated_nodes == []
+    assert analysis.branches[0]["fork"] == "Trigger"
+    assert analysis.branches[0]["dominant"] == "Fetch"
+
+
+def test_independent_sequential_ai_nodes_are_parallelizable():
+    workflow = {
+        "nodes": [
+            _node("Trigger", "n8n-nodes-base.webhook"),
+            _node("Classify", "nexus-nodes.openai", prompt="Classify {{ $json.text }}"),
+            _node("Translate", "nexus-nodes.langchain", prompt="Translate {{ $node[\"Trigger\"].json.text }}"),
+        ],
+        "connections": {
+            "Trigger": _connect("Classify"),
+            "Classify": _connect("Translate"),
+        },
+    }
+    analysis = analyze_workflow(workflow, {"Classify": 1000, "Translate": 2000})
+    assert analysis.critical_path_latency == 3000
+    assert analysis.parallel_latency == 2000
+    assert analysis.parallelizable == [{"upstream": "Classify", "downstream": "Translate", "on_critical_path": True}]
+
+
+def test_ai_node_reading_its_input_is_not_parallelizable():
+    workflow = {
+        "nodes": [
+            _node("Trigger", "n8n-nodes-base.webhook"),
+            _node("Draft", "nexus-nodes.openai", prompt="Draft a reply"),
+            _node("Review", "nexus-nodes.openai", prompt="Review {{ $json.reply }}"),
+        ],
+        "connections": {"Trigger": _connect("Draft"), "Draft": _connect("Review")},
+    }
+    analysis = analyze_workflow(workflow, {"nexus-nodes.openai": 800})
+    assert analysis.parallelizable == []
+    assert analysis.parallel_latency == analysis.critical_path_latency == 1600
+
+
+def test_loops_are_broken_and_reported():
+    workflow = {
+        "nodes": [
+            _node("Trigger", "n8n-nodes-base.manualTrigger"),
+            _node("Fetch page", "n8n-nodes-base.httpRequest"),
+            _node("More pages?", "n8n-nodes-base.if"),
+        ],
+        "connections": {
+            "Trigger": _connect("Fetch page"),
+            "Fetch page": _connect("More pages?"),
+            "More pages?": _connect("Fetch page"),
+        },
+    }
+    analysis = analyze_workflow(workflow)
+    assert analysis.cyclic
+    assert analysis.critical_path == ["Trigger", "Fetch page", "More pages?"]
+    assert analysis.critical_path_latency == pytest.approx(510)
+    assert set(analysis.estimated_nodes) == {"Trigger", "Fetch page", "More pages?"}
+
+
+def test_disabled_nodes_are_left_out():
+    workflow = {
+        "nodes": [
+            _node("Trigger", "n8n-nodes-base.webhook"),
+            {**_node("Old model", "nexus-nodes.openai"), "disabled": True},
+        ],
+        "connections": {"Trigger": _connect("Old model")},
+    }
+    analysis = analyze_workflow(workflow)
+    assert analysis.node_count == 1
+    assert analysis.critical_path == ["Trigger"]
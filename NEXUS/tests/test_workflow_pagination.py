@@ -0,0 +1,88 @@
+"""Tests for paginated, streaming workflow listing."""
+
+import threading
+
+from conftest import simple_workflow
+
+
+def _api(workflows_cli, server):
+    return workflows_cli.N8nAPI(base_url=server.base_url, workflow_cache=workflows_cli.WorkflowCache(cache_dir=None))
+
+
+def test_all_pages_are_listed_in_order(workflows_cli, n8n_server):
+    server = n8n_server([simple_workflow(str(i)) for i in range(1, 6)])
+    api = _api(workflows_cli, server)
+    try:
+        workflow_ids = [workflow["id"] for workflow in api.iter_workflows(page_size=2)]
+    finally:
+        api.close()
+    assert workflow_ids == ["1", "2", "3", "4", "5"]
+
+
+def test_tag_filter_is_applied_to_every_page(workflows_cli, n8n_server):
+    workflows = [dict(simple_workflow(str(i)), tags=[{"name": "ai"}] if i % 2 else []) for i in range(1, 6)]
+    server = n8n_server(workflows)
+    api = _api(workflows_cli, server)
+    try:
+        workflow_ids = [workflow["id"] for workflow in api.iter_workflows(tag="ai", page_size=1)]
+    finally:
+        api.close()
+    assert workflow_ids == ["1", "3", "5"]
+
+
+def test_listed_pages_seed_the_definition_cache(workflows_cli, n8n_server):
+    server = n8n_server([simple_workflow("1")])
+    api = _api(workflows_cli, server)
+    try:
+        page = api.list_workflows_page(limit=10)
+    finally:
+        api.close()
+    assert page["nextCursor"] is None
+    assert api.workflow_cache.get("1") == page["data"][0]
+
+
+def _paged_api(workflows_cli, monkeypatch):
+    """An N8nAPI serving two pages, recording the cursors requested."""
+    api = workflows_cli.N8nAPI(base_url="http://n8n.invalid/api/v1")
+    pages = {None: {"data": [{"id": "1"}, {"id": "2"}], "nextCursor": "2"}, "2": {"data": [{"id": "3"}], "nextCursor": None}}
+    cursors = []
+    second_page_requested = threading.Event()
+
+    def list_workflows_page(tag=None, limit=100, cursor=None):
+        cursors.append(cursor)
+        if cursor:
+            second_page_requested.set()
+        return pages[cursor]
+
+    monkeypatch.setattr(api, "list_workflows_page", list_workflows_page)
+    return api, cursors, second_page_requested
+
+
+def test_next_page_is_prefetched_while_the_current_one_is_consumed(workflows_cli, monkeypatch):
+    api, cursors, second_page_requested = _paged_api(workflows_cli, monkeypatch)
+    workflows = api.iter_workflows()
+    assert cursors == []
+    assert next(workflows) == {"id": "1"}
+    assert second_page_requested.wait(5)
+    assert [workflow["id"] for workflow in workflows] == ["2", "3"]
+    assert cursors == [None, "2"]
+
+
+def test_pages_are_fetched_on_demand_without_prefetch(workflows_cli, monkeypatch):
+    api, cursors, _ = _paged_api(workflows_cli, monkeypatch)
+    workflows = api.iter_workflows(prefetch=False)
+    assert [next(workflows), next(workflows)] == [{"id": "1"}, {"id": "2"}]
+    assert cursors == [None]
+    assert list(workflows) == [{"id": "3"}]
+    assert cursors == [None, "2"]
+
+
+def test_unpaginated_list_responses_are_accepted(workflows_cli, monkeypatch):
+    api = workflows_cli.N8nAPI(base_url="http://n8n.invalid/api/v1")
+
+    class _Response:
+        def json(self):
+            return [{"id": "1"}, {"id": "2"}]
+
+    monkeypatch.setattr(api, "_request", lambda method, path, **kwargs: _Response())
+    assert api.list_workflows() == [{"id": "1"}, {"id": "2"}]
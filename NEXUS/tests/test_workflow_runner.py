@@ -0,0 +1,86 @@
+"""Tests for the concurrent workflow test runner."""
+
+import threading
+import time
+
+from conftest import simple_workflow
+from mock_n8n_server import WorkflowInterpreter
+
+
+def _tester(workflows_cli, server, **kwargs):
+    api = workflows_cli.N8nAPI(base_url=server.base_url, webhook_url=server.webhook_url)
+    return workflows_cli.WorkflowTester(api=api, analyze=False, **kwargs)
+
+
+class _StubAPI:
+    """Serves workflow definitions without a server; executions are stubbed on the tester."""
+
+    def get_workflow(self, workflow_id):
+        return {"id": workflow_id, "name": f"Workflow {workflow_id}"}
+
+
+def _count_in_flight(tester, monkeypatch, duration=0.05):
+    """Replace execution with a sleep and return a dict tracking the peak number running at once."""
+    lock = threading.Lock()
+    counts = {"running": 0, "peak": 0}
+
+    def execute_and_wait(workflow_id, workflow, test_data):
+        with lock:
+            counts["running"] += 1
+            counts["peak"] = max(counts["peak"], counts["running"])
+        time.sleep(duration)
+        with lock:
+            counts["running"] -= 1
+        return f"exec-{workflow_id}", {"status": "success", "nodeExecutions": {}}
+
+    monkeypatch.setattr(tester, "_execute_and_wait", execute_and_wait)
+    return counts
+
+
+def test_concurrent_run_against_the_stand_in_keeps_input_order(workflows_cli, n8n_server):
+    workflows = [simple_workflow(str(i)) for i in range(1, 7)]
+    server = n8n_server(workflows, interpreter=WorkflowInterpreter(node_latency_ms=10))
+    tester = _tester(workflows_cli, server, concurrency=4)
+    try:
+        results = tester.test_all_workflows()
+    finally:
+        tester.api.close()
+
+    assert [result.workflow_id for result in results] == [w["id"] for w in workflows]
+    assert all(result.success for result in results)
+    assert [result.nodes_tested for result in results] == [["Start", "Set"]] * len(workflows)
+
+
+def test_workers_run_workflows_concurrently(workflows_cli, monkeypatch):
+    tester = workflows_cli.WorkflowTester(api=_StubAPI(), concurrency=4, analyze=False)
+    counts = _count_in_flight(tester, monkeypatch)
+    results = tester._run_workflows({"id": str(i)} for i in range(8))
+    assert all(result.success for result in results)
+    assert counts["peak"] > 1
+
+
+def test_execution_slots_cap_executions_in_flight(workflows_cli, monkeypatch):
+    tester = workflows_cli.WorkflowTester(api=_StubAPI(), concurrency=4, max_in_flight=2, analyze=False)
+    counts = _count_in_flight(tester, monkeypatch)
+    results = tester._run_workflows({"id": str(i)} for i in range(8))
+    assert [result.workflow_id for result in results] == [str(i) for i in range(8)]
+    assert counts["peak"] == 2
+
+
+def test_serial_run_tests_one_workflow_at_a_time(workflows_cli, monkeypatch):
+    tester = workflows_cli.WorkflowTester(api=_StubAPI(), concurrency=1, analyze=False)
+    counts = _count_in_flight(tester, monkeypatch, duration=0)
+    results = tester._run_workflows([{"id": "a"}, {"name": "no id"}, {"id": "b"}])
+    assert [result.workflow_id for result in results] == ["a", "b"]
+    assert counts["peak"] == 1
+
+
+def test_failed_test_does_not_stop_the_run(workflows_cli, n8n_server):
+    server = n8n_server([simple_workflow("1")])
+    tester = _tester(workflows_cli, server, concurrency=2)
+    try:
+        results = tester._run_workflows([{"id": "missing"}, {"id": "1"}])
+    finally:
+        tester.api.close()
+    assert [result.success for result in results] == [False, True]
+    assert "404" in results[0].error_message
@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+"""
+Static workflow graph analysis for the n8n AI Workflow Automation Hub.
+
+Builds the node DAG from a workflow's nodes and connections, estimates the
+critical-path latency from historical (or default) per-node latencies, and
+finds AI nodes (nexus-nodes.openai, nexus-nodes.langchain) that run one after
+another although neither uses the other's output, so they could run in
+parallel. Conditional branches are treated as if all of them run, so the
+critical path is a worst case.
+
+Usage:
+    python workflow_graph.py document_processing-workflow.json
+    python workflow_graph.py ./workflows --latencies=node_latencies.json --format=json
+"""
+
+import os
+import re
+import sys
+import json
+import fnmatch
+import logging
+import argparse
+from dataclasses import dataclass, field, asdict
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger('nexus-workflow-graph')
+
+# Workflow definitions: the *-workflow.json files next to these tools unless configured otherwise
+WORKFLOWS_DIR = os.getenv('WORKFLOWS_DIR', os.path.dirname(os.path.abspath(__file__)))
+WORKFLOW_FILE_PATTERN = os.getenv('WORKFLOW_FILE_PATTERN', '*-workflow.json')
+
+# Default latency estimates for nodes without execution history
+AI_NODE_LATENCY_MS = float(os.getenv('AI_NODE_LATENCY_MS', '3000'))
+HTTP_NODE_LATENCY_MS = float(os.getenv('HTTP_NODE_LATENCY_MS', '500'))
+DEFAULT_NODE_LATENCY_MS = float(os.getenv('DEFAULT_NODE_LATENCY_MS', '10'))
+
+AI_NODE_TYPES = ("nexus-nodes.openai", "nexus-nodes.langchain", "openai", "langchain")
+# Node types that call external services, by substring
+IO_NODE_TYPES = ("httpRequest", "twitter", "mongodb", "emailSend", "postgres", "slack", "gmail")
+IGNORED_NODE_TYPES = ("n8n-nodes-base.stickyNote",)
+
+# Expressions naming another node: $node["Name"], $('Name'), $items("Name")
+NODE_REFERENCE_PATTERN = re.compile(r"""\$(?:node\[|\(|items\()\s*["']([^"']+)["']""")
+# Expressions reading the items passed in by the previous node
+INPUT_REFERENCE_PATTERN = re.compile(r"\$json|\$input|\$binary|\$item\b")
+
+
+def _parameter_text(value) -> str:
+    """Concatenate every string inside a node's parameters."""
+    if isinstance(value, dict):
+        return "\n".join(_parameter_text(item) for item in value.values())
+    if isinstance(value, list):
+        return "\n".join(_parameter_text(item) for item in value)
+    return value if isinstance(value, str) else ""
+
+
+def is_ai_node(node_type: str) -> bool:
+    """Whether a node type calls an AI model."""
+    return any(ai_type in node_type for ai_type in AI_NODE_TYPES)
+
+
+def default_latency(node_type: str) -> float:
+    """Latency estimate in milliseconds for a node type with no history."""
+    if is_ai_node(node_type):
+        return AI_NODE_LATENCY_MS
+    if any(io_type in node_type for io_type in IO_NODE_TYPES):
+        return HTTP_NODE_LATENCY_MS
+    if node_type.endswith("Trigger") or node_type.endswith(".webhook"):
+        return 0.0
+    return DEFAULT_NODE_LATENCY_MS
+
+
+def node_run_times(execution: Dict) -> Dict[str, List[float]]:
+    """Per-node run times in milliseconds from an execution record.
+
+    Accepts both the flattened nodeExecutions map and n8n's data.resultData.runData.
+    """
+    run_data = execution.get("nodeExecutions")
+    if run_data is None:
+        run_data = execution.get("data", {}).get("resultData", {}).get("runData", {})
+
+    run_times = {}
+    for node_name, runs in (run_data or {}).items():
+        times = [run["executionTime"] for run in runs if isinstance(run.get("executionTime"), (int, float))]
+        if times:
+            run_times[node_name] = times
+    return run_times
+
+
+def median_node_latencies(executions: List[Dict]) -> Dict[str, float]:
+    """Median per-node latency across executions, summing repeated runs within one execution."""
+    samples: Dict[str, List[float]] = {}
+    for execution in executions:
+        for node_name, times in node_run_times(execution).items():
+            samples.setdefault(node_name, []).append(sum(times))
+
+    latencies = {}
+    for node_name, values in samples.items():
+        values.sort()
+        latencies[node_name] = values[len(values) // 2]
+    return latencies
+
+
+@dataclass
+class WorkflowAnalysis:
+    """Result of analyzing one workflow graph."""
+    workflow_id: str
+    workflow_name: str
+    node_count: int
+    critical_path: List[str]
+    critical_path_latency: float  # milliseconds
+    parallel_latency: float  # milliseconds, if independent AI nodes ran concurrently
+    node_latencies: Dict[str, float] = field(default_factory=dict)
+    estimated_nodes: List[str] = field(default_factory=list)  # latencies not from history
+    parallelizable: List[Dict] = field(default_factory=list)
+    branches: List[Dict] = field(default_factory=list)
+    cyclic: bool = False
+
+
+class WorkflowGraph:
+    """Directed graph of a workflow's enabled nodes and main connections."""
+
+    def __init__(self, workflow: Dict):
+        self.workflow = workflow
+        self.nodes: Dict[str, Dict] = {
+            node["name"]: node
+            for node in workflow.get("nodes", [])
+            if not node.get("disabled") and node.get("type") not in IGNORED_NODE_TYPES
+        }
+        self.successors: Dict[str, List[Tuple[str, int]]] = {name: [] for name in self.nodes}
+        self.predecessors: Dict[str, List[str]] = {name: [] for name in self.nodes}
+
+        for source, outputs in workflow.get("connections", {}).items():
+            if source not in self.nodes:
+                continue
+            for output_index, connections in enumerate(outputs.get("main", [])):
+                for connection in connections or []:
+                    target = connection.get("node")
+                    if target in self.nodes and source not in self.predecessors[target]:
+                        self.successors[source].append((target, output_index))
+                        self.predecessors[target].append(source)
+
+        self.cyclic = False
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        """Order nodes so each comes after its predecessors, dropping back edges of loops."""
+        order: List[str] = []
+        state: Dict[str, int] = {}  # 1 while on the DFS stack, 2 once finished
+
+        def visit(start: str) -> None:
+            stack = [(start, iter(list(self.successors[start])))]
+            state[start] = 1
+            while stack:
+                name, children = stack[-1]
+                for target, output_index in children:
+                    if state.get(target) == 1:
+                        # Loop back to a node still being visited: ignore this edge
+                        self.cyclic = True
+                        self.successors[name].remove((target, output_index))
+                        self.predecessors[target].remove(name)
+                    elif target not in state:
+                        state[target] = 1
+                        stack.append((target, iter(list(self.successors[target]))))
+                        break
+                else:
+                    state[name] = 2
+                    order.append(name)
+                    stack.pop()
+
+        for name in self.nodes:
+            if not self.predecessors[name] and name not in state:
+                visit(name)
+        for name in self.nodes:
+            if name not in state:
+                visit(name)
+
+        order.reverse()
+        return order
+
+    def node_type(self, name: str) -> str:
+        return self.nodes[name].get("type", "")
+
+    def ancestors(self) -> Dict[str, Set[str]]:
+        """All upstream nodes of every node."""
+        ancestors: Dict[str, Set[str]] = {}
+        for name in self.order:
+            upstream = set()
+            for predecessor in self.predecessors[name]:
+                upstream.add(predecessor)
+                upstream |= ancestors[predecessor]
+            ancestors[name] = upstream
+        return ancestors
+
+    def data_dependencies(self) -> Dict[str, Set[str]]:
+        """Nodes whose output each node reads directly.
+
+        A node depends on the nodes its expressions name, and on its predecessors
+        when it reads its input items. Anything but an AI node is assumed to read
+        its input, since code, routing and I/O nodes generally do.
+        """
+        dependencies = {}
+        for name in self.order:
+            node = self.nodes[name]
+            parameters = _parameter_text(node.get("parameters", {}))
+            referenced = {
+                ref for ref in NODE_REFERENCE_PATTERN.findall(parameters)
+                if ref in self.nodes and ref != name
+            }
+            if not is_ai_node(self.node_type(name)) or INPUT_REFERENCE_PATTERN.search(parameters):
+                referenced |= set(self.predecessors[name])
+            dependencies[name] = referenced
+        return dependencies
+
+    def longest_paths(
+        self,
+        latencies: Dict[str, float],
+        dependencies: Optional[Dict[str, Set[str]]] = None
+    ) -> Tuple[Dict[str, float], Dict[str, Optional[str]]]:
+        """Earliest finish time of each node and the dependency that delays it most."""
+        dependencies = dependencies or {name: set(self.predecessors[name]) for name in self.nodes}
+        finish: Dict[str, float] = {}
+        critical_parent: Dict[str, Optional[str]] = {}
+        for name in self.order:
+            # Named references can point downstream in malformed graphs; only count scheduled nodes
+            ready = [(finish[dep], dep) for dep in dependencies[name] if dep in finish]
+            start, parent = max(ready, key=lambda item: item[0]) if ready else (0.0, None)
+            finish[name] = start + latencies[name]
+            critical_parent[name] = parent
+        return finish, critical_parent
+
+    def tail_latencies(self, latencies: Dict[str, float]) -> Dict[str, float]:
+        """Longest latency from each node (inclusive) to the end of the workflow."""
+        tails: Dict[str, float] = {}
+        for name in reversed(self.order):
+            downstream = [tails[target] for target, _ in self.successors[name]]
+            tails[name] = latencies[name] + max(downstream, default=0.0)
+        return tails
+
+
+def analyze_workflow(workflow: Dict, history: Optional[Dict[str, float]] = None) -> WorkflowAnalysis:
+    """Analyze a workflow's critical path and parallelization opportunities.
+
+    history maps node names or node types to measured latencies in milliseconds;
+    nodes without an entry fall back to per-type estimates.
+    """
+    history = history or {}
+    graph = WorkflowGraph(workflow)
+
+    latencies: Dict[str, float] = {}
+    estimated = []
+    for name in graph.order:
+        node_type = graph.node_type(name)
+        if name in history:
+            latencies[name] = float(history[name])
+        elif node_type in history:
+            latencies[name] = float(history[node_type])
+        else:
+            latencies[name] = default_latency(node_type)
+            estimated.append(name)
+
+    # Critical path through the graph as wired
+    finish, critical_parent = graph.longest_paths(latencies)
+    end = max(finish, key=finish.get) if finish else None
+    critical_path = []
+    while end is not None:
+        critical_path.append(end)
+        end = critical_parent[end]
+    critical_path.reverse()
+    critical_path_latency = max(finish.values(), default=0.0)
+
+    # Schedule each node after only the nodes whose data it uses; nodes that use no
+    # data still wait for the workflow's trigger
+    ancestors = graph.ancestors()
+    dependencies = graph.data_dependencies()
+    for name, deps in dependencies.items():
+        if not deps and graph.predecessors[name]:
+            dependencies[name] = {a for a in ancestors[name] if not graph.predecessors[a]}
+    parallel_finish, _ = graph.longest_paths(latencies, dependencies)
+    parallel_latency = max(parallel_finish.values(), default=0.0)
+
+    # Sequential AI nodes where the downstream one never reads the upstream one's output
+    data_closure: Dict[str, Set[str]] = {}
+    for name in graph.order:
+        closure = set()
+        for dep in dependencies[name]:
+            closure.add(dep)
+            closure |= data_closure.get(dep, set())
+        data_closure[name] = closure
+
+    on_critical_path = set(critical_path)
+    parallelizable = []
+    ai_nodes = [name for name in graph.order if is_ai_node(graph.node_type(name))]
+    for downstream in ai_nodes:
+        for upstream in ai_nodes:
+            if upstream in ancestors[downstream] and upstream not in data_closure[downstream]:
+                parallelizable.append({
+                    "upstream": upstream,
+                    "downstream": downstream,
+                    "on_critical_path": upstream in on_critical_path and downstream in on_critical_path
+                })
+
+    # Fan-out points and the branch that dominates the time after each
+    tails = graph.tail_latencies(latencies)
+    branches = []
+    for name in graph.order:
+        successors = graph.successors[name]
+        if len({target for target, _ in successors}) < 2:
+            continue
+        branch_latencies = sorted(
+            ({"node": target, "output": output_index, "latency": tails[target]} for target, output_index in successors),
+            key=lambda branch: (branch["latency"], branch["node"] in on_critical_path),
+            reverse=True
+        )
+        branches.append({
+            "fork": name,
+            "conditional": len({output_index for _, output_index in successors}) > 1,
+            "dominant": branch_latencies[0]["node"],
+            "branches": branch_latencies
+        })
+
+    return WorkflowAnalysis(
+        workflow_id=str(workflow.get("id", "")),
+        workflow_name=workflow.get("name", ""),
+        node_count=len(graph.nodes),
+        critical_path=critical_path,
+        critical_path_latency=critical_path_latency,
+        parallel_latency=parallel_latency,
+        node_latencies=latencies,
+        estimated_nodes=estimated,
+        parallelizable=parallelizable,
+        branches=branches,
+        cyclic=graph.cyclic
+    )
+
+
+def format_analysis(analysis: WorkflowAnalysis) -> List[str]:
+    """Human-readable summary lines for an analysis."""
+    lines = [
+        f"Critical Path: {analysis.critical_path_latency / 1000:.2f}s "
+        f"({' → '.join(analysis.critical_path)})"
+    ]
+    if analysis.parallel_latency < analysis.critical_path_latency:
+        lines.append(
+            f"With independent AI nodes in parallel: {analysis.parallel_latency / 1000:.2f}s "
+            f"(-{(analysis.critical_path_latency - analysis.parallel_latency) / 1000:.2f}s)"
+        )
+    for pair in analysis.parallelizable:
+        marker = " [critical path]" if pair["on_critical_path"] else ""
+        lines.append(f"Parallelizable: {pair['upstream']} ∥ {pair['downstream']}{marker}")
+    for fork in analysis.branches:
+        dominant = fork["branches"][0]
+        kind = "conditional branches" if fork["conditional"] else "branches"
+        lines.append(
+            f"Fork at {fork['fork']} ({len(fork['branches'])} {kind}): "
+            f"{dominant['node']} dominates with {dominant['latency'] / 1000:.2f}s"
+        )
+    if analysis.cyclic:
+        lines.append("Workflow contains loops; loop-back connections were ignored")
+    return lines
+
+
+def is_workflow_file(name: str) -> bool:
+    """Whether a file name in a workflows directory holds a workflow definition."""
+    return fnmatch.fnmatch(name, WORKFLOW_FILE_PATTERN)
+
+
+def load_workflow_files(paths: List[str]) -> List[Tuple[str, Dict]]:
+    """Load workflow JSON files, expanding directories."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            files.extend(os.path.join(path, name) for name in sorted(os.listdir(path)) if name.endswith(".json"))
+        else:
+            files.append(path)
+
+    workflows = []
+    for path in files:
+        try:
+            with open(path, "r") as f:
+                workflow = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Skipping workflow file {path}: {str(e)}")
+            continue
+        if isinstance(workflow, dict) and "nodes" in workflow:
+            workflow.setdefault("id", os.path.splitext(os.path.basename(path))[0])
+            workflows.append((path, workflow))
+    return workflows
+
+
+def main():
+    """Analyze workflow files from the command line."""
+    parser = argparse.ArgumentParser(description="Analyze n8n workflow graphs")
+    parser.add_argument("paths", nargs="+", help="Workflow JSON files or directories")
+    parser.add_argument("--latencies", help="JSON file mapping node names or types to latencies in ms")
+    parser.add_argument("--format", choices=["text", "json", "github"], default="text",
+                        help="Output format for the analysis")
+    args = parser.parse_args()
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        handlers=[logging.StreamHandler(sys.stderr)]
+    )
+
+    history = {}
+    if args.latencies:
+        with open(args.latencies, "r") as f:
+            history = json.load(f)
+
+    analyses = [(path, analyze_workflow(workflow, history)) for path, workflow in load_workflow_files(args.paths)]
+
+    if args.format == "json":
+        print(json.dumps([asdict(analysis) for _, analysis in analyses], indent=2))
+    elif args.format == "github":
+        for path, analysis in analyses:
+            for pair in analysis.parallelizable:
+                print(
+                    f"::notice file={path},title=Parallelizable AI nodes::"
+                    f"{pair['downstream']} does not use the output of {pair['upstream']}"
+                )
+    else:
+        for path, analysis in analyses:
+            print("\n" + "=" * 80)
+            print(f"{analysis.workflow_name or analysis.workflow_id} ({path}, {analysis.node_count} nodes)")
+            print("=" * 80)
+            for line in format_analysis(analysis):
+                print(f"  {line}")
+
+
+if __name__ == "__main__":
+    main()